@@ -1,133 +1,57 @@
 import os
+import sys
+import time
 import pandas as pd
 
-def get_pct_cpct_from_record(csv_path):
-    """
-    Reads the record CSV (which has 9 rows, 2 columns).
-    Returns (pct, cpct) from:
-      - 3rd row (1-based) ⇒ df.iloc[2] in 0-based => 'Pct'
-      - 5th row (1-based) ⇒ df.iloc[4] in 0-based => 'CPct'
-    Returns None, None if the file is empty or invalid.
-    """
-    try:
-        df = pd.read_csv(csv_path, header=None)
-        # If the CSV is empty or doesn't have enough rows/cols, skip it
-        if df.shape[0] < 5 or df.shape[1] < 2:
-            return None, None
-        
-        pct = df.iloc[2, 1]
-        cpct = df.iloc[4, 1]
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from athlete import warehouse
+from athlete.excel import write_xlsx
+from athlete.ranking import rank_records
+from athlete.ranking_state import RankingState
+from athlete.records import load_record_pcts
 
-        # Attempt conversion to float (skip if fails)
-        return float(pct), float(cpct)
+# Read the records from warehouse.sqlite (`python -m athlete.warehouse ingest`)
+# instead of walking Schedule/
+FROM_WAREHOUSE = False
 
-    except Exception as e:
-        print(f"Error reading '{csv_path}': {e}")
-        return None, None
+# Only re-rank the (Gender, Sport, Year) groups whose record files changed
+# since the last run (.rankings_state.json); False re-reads and re-ranks all
+INCREMENTAL = True
 
-def dense_rank_cpct_pct(group):
-    """
-    Performs a 'dense rank' on the group, which must already be sorted by 
-    CPct descending, then Pct descending.
-    
-    If (CPct,Pct) changes, increment rank; if they are the same, keep the same rank.
-    """
-    ranks = []
-    rank_val = 1
-    last_cpct, last_pct = None, None
-
-    for idx, row in group.iterrows():
-        cpct_val = row["CPct"]
-        pct_val  = row["Pct"]
-        if (cpct_val, pct_val) != (last_cpct, last_pct):
-            # new combination => increment rank
-            ranks.append(rank_val)
-            rank_val += 1
-            last_cpct, last_pct = cpct_val, pct_val
-        else:
-            # same combination => same rank
-            ranks.append(rank_val - 1)
-
-    group["Ranking"] = ranks
-    return group
+OUTPUTS = ["all_schools_rankings.xlsx", "all_schools_rankings.csv"]
 
 def main():
-    # Root directory that contains all the schools
-    SCHEDULE_DIR = "Schedule"
-
-    # We'll store each row of final data in a list of dicts
-    records_list = []
-
-    # --- 1) Traverse the folder structure ---
-    # Schedule/SchoolName/Gender/Sport/Year/record.csv
-    for school_name in os.listdir(SCHEDULE_DIR):
-        school_path = os.path.join(SCHEDULE_DIR, school_name)
-        if not os.path.isdir(school_path):
-            continue
-
-        for gender_name in os.listdir(school_path):
-            gender_path = os.path.join(school_path, gender_name)
-            if not os.path.isdir(gender_path):
-                continue
-
-            for sport_name in os.listdir(gender_path):
-                sport_path = os.path.join(gender_path, sport_name)
-                if not os.path.isdir(sport_path):
-                    continue
-
-                for year_folder in os.listdir(sport_path):
-                    year_path = os.path.join(sport_path, year_folder)
-                    if not os.path.isdir(year_path):
-                        continue
-
-                    # Find the CSV that has "record" in its name
-                    for file_name in os.listdir(year_path):
-                        if "record" in file_name.lower() and file_name.lower().endswith(".csv"):
-                            record_csv = os.path.join(year_path, file_name)
-                            pct, cpct = get_pct_cpct_from_record(record_csv)
-
-                            # Append data if valid
-                            if pct is not None and cpct is not None:
-                                records_list.append({
-                                    "School": school_name,
-                                    "Gender": gender_name,
-                                    "Sport": sport_name,
-                                    "Year": year_folder,
-                                    "Pct": pct,
-                                    "CPct": cpct
-                                })
-
-    # --- 2) Build a DataFrame ---
-    df = pd.DataFrame(records_list)
+    start = time.perf_counter()
+    if INCREMENTAL and not FROM_WAREHOUSE:
+        # --- 1-4) Re-read and re-rank only the groups with new or changed record files ---
+        state = RankingState()
+        changed, removed = state.update("Schedule")
+        print(f"Re-ranked {len(changed)} of {len(state.groups)} (Gender, Sport, Year) groups, "
+              f"dropped {len(removed)}, in {time.perf_counter() - start:.2f}s")
+        if not changed and not removed and all(os.path.exists(p) for p in OUTPUTS):
+            print("Rankings are up to date.")
+            return
+        df = state.frame()
+    else:
+        # --- 1-2) Collect (School, Gender, Sport, Year, Pct, CPct) from every record CSV ---
+        # Schedule/SchoolName/Gender/Sport/Year/record.csv, read on a process pool
+        state = None
+        df = warehouse.record_pcts() if FROM_WAREHOUSE else load_record_pcts("Schedule")
+        print(f"Loaded {len(df)} season records in {time.perf_counter() - start:.2f}s")
+
+        # --- 3-4) Sort by (Gender, Sport, Year, CPct desc, Pct desc), dense rank on
+        # (CPct, Pct) within each group, then order by (Gender, Sport, Year, Ranking) ---
+        df = rank_records(df)
     if df.empty:
         print("No valid record data found.")
         return
 
-    # --- 3) Sort by (Gender, Sport, Year, CPct desc, Pct desc) ---
-    df.sort_values(
-        by=["Gender", "Sport", "Year", "CPct", "Pct"],
-        ascending=[True, True, True, False, False],
-        inplace=True
-    )
-
-    # --- 4) Group by (Gender, Sport, Year) and apply a custom dense rank ---
-    # We must not change the order inside each group when we apply the function,
-    # so use group_keys=False and let the group remain in the sorted order:
-    df = df.groupby(["Gender", "Sport", "Year"], group_keys=False).apply(dense_rank_cpct_pct)
-
-    # If desired, re-sort by (Gender, Sport, Year, Ranking) for final readability
-    df.sort_values(
-        by=["Gender", "Sport", "Year", "Ranking"],
-        ascending=[True, True, True, True],
-        inplace=True
-    )
-
-    # --- 5) Write to Excel or CSV ---
-    output_excel_path = "all_schools_rankings.xlsx"
-    df.to_excel(output_excel_path, index=False)
-
-    output_csv_path = "all_schools_rankings.csv"
+    # --- 5) Write to Excel and CSV ---
+    output_excel_path, output_csv_path = OUTPUTS
+    write_xlsx(df, output_excel_path)
     df.to_csv(output_csv_path, index=False)
+    if state is not None:
+        state.save()  # after the outputs, so a failed write is redone next run
 
     print(f"Done! Compiled data saved to:\n  {output_excel_path}\n  {output_csv_path}")
 
@@ -1,8 +1,11 @@
 import os
-import requests
-from bs4 import BeautifulSoup as bs
-import pandas as pd
-from io import StringIO
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import parsing
+from athlete.http_client import HttpClient
+from athlete.manifest import SeasonManifest, school_key
+from athlete.tables import table_to_frame
 
 # ---------------------------------------------------------------
 # CONFIG
@@ -10,20 +13,29 @@ from io import StringIO
 BASE_URL = "https://pioneers.grinnell.edu/sports/womens-volleyball/coaches"
 OUTPUT_FOLDER = "Volleyball"
 
+# Only fetch seasons the manifest says are new, in progress or stale;
+# set FULL_REFRESH = True to re-scrape every season in the dropdown
+FULL_REFRESH = False
+
 headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
                   'AppleWebKit/537.36 (KHTML, like Gecko) '
                   'Chrome/85.0.4183.121 Safari/537.36'
 }
 
+client = HttpClient(headers=headers)
+manifest = SeasonManifest()
+school = school_key(BASE_URL)
+sport = BASE_URL.rstrip("/").split("/")[-2]  # .../sports/<sport>/coaches
+
 # ---------------------------------------------------------------
 # FETCH BASE PAGE
 # ---------------------------------------------------------------
 print(f"Fetching {BASE_URL}")
-resp = requests.get(BASE_URL, headers=headers)
+resp = client.get(BASE_URL)
 resp.raise_for_status()
 
-soup = bs(resp.text, "html.parser")
+soup = parsing.soup(resp.text, parsing.dropdown_strainer("ddl_seasons_list"))
 
 # ---------------------------------------------------------------
 # FIND SEASON DROPDOWN
@@ -51,28 +63,36 @@ for option in season_options:
 # ---------------------------------------------------------------
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+if not FULL_REFRESH:
+    todo = manifest.pending(school, sport, "coaches", [text for text, _ in seasons])
+    print(f"{len(seasons) - len(todo)} of {len(seasons)} seasons are final and up to date")
+    seasons = [(text, url) for text, url in seasons if text in todo]
+
 for season_text, season_url in seasons:
     print(f"\n=== Processing season: {season_text} ===")
     try:
-        season_resp = requests.get(season_url, headers=headers)
+        season_resp = client.get(season_url)
         season_resp.raise_for_status()
-        season_soup = bs(season_resp.text, "html.parser")
+        season_soup = parsing.soup(season_resp.text, parsing.TABLE_STRAINER)
 
         table = season_soup.find("table")
         if not table:
             continue
 
         # Parse the table
-        df = pd.read_html(StringIO(str(table)))[0]
+        df = table_to_frame(table)
         safe_name = f"{season_text}_{OUTPUT_FOLDER}".replace(" ", "_").replace("/", "_")
         csv_filename = f"{safe_name}.csv"
         csv_path = os.path.join(OUTPUT_FOLDER, csv_filename)
         df.to_csv(csv_path, index=False)
         print(f"     -> Saved table to: {csv_path}")
+        manifest.mark_done(school, sport, "coaches", season_text, outputs=[csv_path])
 
     except Exception as e:
         print(e)
         continue
 
 
+manifest.save()
+print(client.summary())
 print("\nAll done!")
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import aio, alltime
+from athlete.alltime import parse_overall_rows, row_link, detail_url, parse_record_table, flatten
+from athlete.http_client import HttpClient
+
+# -----------------------------------------------------------------------------
+# HTTP-only version of "opponent history.py" / test.py: instead of clicking each
+# 'Overall' row and waiting for its modal, request every row's #record_table
+# directly and fetch them all concurrently. Same flattened CSV output.
+# -----------------------------------------------------------------------------
+url = "https://pioneers.grinnell.edu/alltime.aspx?path=wbball&record_type=opponents"
+file_name = "all_overall_data.csv"
+
+# The request behind the modal is recorded once per site (athlete/alltime.py);
+# set this only to override the recorded one
+DETAIL_URL_TEMPLATE = None
+MAX_IN_FLIGHT_PER_HOST = 8
+
+client = HttpClient()
+start = time.perf_counter()
+
+# 1. Fetch the page and find every 'Overall' row
+page = client.get_ok(url)
+rows = parse_overall_rows(page.text)
+print(f"Found {len(rows)} total 'Overall' rows.")
+
+# 2. Work out the request behind each row's modal, one row at a time
+template = DETAIL_URL_TEMPLATE or alltime.saved_template(url)
+recorded = template is not None
+jobs = []  # (row number, detail URL)
+for idx, row in enumerate(rows, start=1):
+    try:
+        if template is None and not recorded and row_link(url, row) is None:
+            recorded = True  # record it once per run, even if recording fails
+            template = alltime.detail_template(url)
+        jobs.append((idx, detail_url(url, row, template)))
+    except Exception as e:
+        print(f"Error processing row {idx}: {e}")
+
+# 3. Fetch all record tables concurrently
+data = []
+results = aio.fetch_all([u for _, u in jobs], fetch=client.get_ok, per_host=MAX_IN_FLIGHT_PER_HOST)
+for (idx, _), result in zip(jobs, results):
+    if result.error is not None:
+        print(f"Error processing row {idx}: {result.error}")
+        continue
+    table_data = parse_record_table(result.response.text)
+    print(f"Row {idx}: Found {len(table_data)} rows in modal.")
+    data.append((f"Overall_{idx}", table_data))
+
+# 4. Save all extracted data to a CSV if we have any
+if data:
+    df = pd.DataFrame(flatten(data))
+    df.to_csv(file_name, index=False, header=False)
+    print(f"Data has been successfully saved to {file_name}!")
+else:
+    print("No data extracted.")
+
+print(f"Fetched {len(jobs)} record tables in {time.perf_counter() - start:.2f}s")
+print(client.summary())
@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import aio
+from athlete.http_client import HttpClient
+from athlete.manifest import SeasonManifest, school_key
+from athlete.sidearm import (
+    parse_roster_seasons,
+    parse_roster_grid,
+    roster_season_url,
+    roster_csv_path,
+    write_roster_csv,
+)
+
+# -----------------------------------------------------------------------------
+# Browserless version of roster.py: every season's grid view (?view=2) is
+# requested directly and parsed offline, so no Chrome, no clicking through
+# ddl_past_rosters and no fixed sleeps. All seasons of all sports below are
+# fetched concurrently. Output is the same <Folder>/<season text>.csv
+# (caption row, header row, data rows).
+# -----------------------------------------------------------------------------
+BASE_URL = "https://pioneers.grinnell.edu"
+
+# Sport slug on the site -> folder the CSVs go into
+SPORTS = {
+    "womens-volleyball": "Volleyball",
+}
+
+MAX_IN_FLIGHT_PER_HOST = 6
+
+# Only fetch seasons the manifest says are new, in progress or stale;
+# set FULL_REFRESH = True to re-scrape every season in the dropdown
+FULL_REFRESH = False
+
+client = HttpClient()
+manifest = SeasonManifest()
+school = school_key(BASE_URL)
+start = time.perf_counter()
+
+# -----------------------------------------------------------------------------
+# 1) FETCH EACH SPORT'S ROSTER PAGE & READ THE PAST-ROSTERS DROPDOWN
+# -----------------------------------------------------------------------------
+landing_urls = [f"{BASE_URL}/sports/{sport}/roster" for sport in SPORTS]
+jobs = []  # (sport, folder, season_text, season_url)
+
+for (sport, folder), result in zip(SPORTS.items(), aio.fetch_all(
+        landing_urls, fetch=client.get_ok, per_host=MAX_IN_FLIGHT_PER_HOST)):
+    if result.error is not None:
+        print(f"Failed to fetch {result.url} -- {result.error}")
+        continue
+
+    seasons = parse_roster_seasons(result.response.text)
+    if not seasons:
+        print(f"No ddl_past_rosters dropdown for {sport}, skipping.")
+        continue
+
+    os.makedirs(folder, exist_ok=True)
+    if not FULL_REFRESH:
+        todo = set(manifest.pending(school, sport, "roster", [text for text, _ in seasons]))
+        print(f"{sport}: {len(seasons) - len(todo)} of {len(seasons)} seasons are final and up to date")
+        seasons = [(text, value) for text, value in seasons if text in todo]
+
+    for season_text, season_value in seasons:
+        url = roster_season_url(BASE_URL, sport, season_value, season_text)
+        jobs.append((sport, folder, season_text, url))
+
+# -----------------------------------------------------------------------------
+# 2) FETCH EVERY SEASON'S GRID VIEW CONCURRENTLY, PARSE & WRITE CSV
+# -----------------------------------------------------------------------------
+results = aio.fetch_all([url for *_, url in jobs], fetch=client.get_ok,
+                        per_host=MAX_IN_FLIGHT_PER_HOST)
+
+for (sport, folder, season_text, url), result in zip(jobs, results):
+    print(f"Processing season: {season_text} ({sport})")
+    if result.error is not None:
+        print(f"Failed to fetch {url} -- {result.error}")
+        continue
+
+    grid = parse_roster_grid(result.response.text)
+    if grid is None:
+        print(f"Could not find 'Grid' table for season: {season_text}, skipping.")
+        continue
+
+    csv_path = roster_csv_path(folder, season_text)
+    write_roster_csv(csv_path, *grid)
+    manifest.mark_done(school, sport, "roster", season_text, outputs=[csv_path])
+    print(f"Saved CSV for season: {season_text} -> {csv_path}")
+
+manifest.save()
+print(f"Fetched {len(jobs)} roster pages in {time.perf_counter() - start:.2f}s")
+print(client.summary())
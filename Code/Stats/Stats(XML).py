@@ -1,15 +1,30 @@
 import os
-import requests
+import sys
 from bs4 import BeautifulSoup as bs
-import pandas as pd
 from collections import deque
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import parsing
+from athlete.dataset import DatasetWriter
+from athlete.http_client import HttpClient
+from athlete.manifest import SeasonManifest, school_key
+from athlete.registry import load_registry, school_for_url
+from athlete.tables import table_to_frame
+
 # ------------------------------------------------------------------------------
 # 1) CONFIGURATION
 # ------------------------------------------------------------------------------
 BASE_URL = "https://pioneers.grinnell.edu/sports/baseball/stats"
 root_folder = "Baseball"
 
+# Only walk seasons the manifest says are new, in progress or stale;
+# set FULL_REFRESH = True to re-scrape every season in the dropdown
+FULL_REFRESH = False
+
+# "csv" = <root_folder>/<season>/<tabs>/<table>.csv as before, "parquet" =
+# Dataset/stats/ (athlete.dataset), "both" = write both
+OUTPUT = "csv"
+
 cookies = {
     '_gid': 'GA1.2.1531733898.1726155099',
     '_gat_tracker0': '1',
@@ -30,14 +45,29 @@ headers = {
     )
 }
 
+client = HttpClient(headers=headers)
+manifest = SeasonManifest()
+school = school_key(BASE_URL)
+sport = BASE_URL.rstrip("/").split("/")[-2]  # .../sports/<sport>/stats
+dataset = None
+if OUTPUT != "csv":
+    # The dataset is keyed by the registry's school and sport folders
+    registry = load_registry()
+    dataset_school = school_for_url(registry, BASE_URL)
+    if sport not in registry["sports"]:
+        raise ValueError(f"Sport {sport!r} is not in scrape_registry.json's sports map; "
+                         f'add it as "{sport}": ["<Gender>", "<Sport folder>"]')
+    gender, sport_folder = registry["sports"][sport]
+    dataset = DatasetWriter("stats")
+
 # ------------------------------------------------------------------------------
 # 2) FETCH THE BASE "STATS" PAGE & PARSE THE SEASON DROPDOWN
 # ------------------------------------------------------------------------------
 print(f"Fetching base page: {BASE_URL}")
-base_resp = requests.get(BASE_URL, headers=headers, cookies=cookies)
+base_resp = client.get(BASE_URL, cookies=cookies)
 base_resp.raise_for_status()
 
-base_soup = bs(base_resp.text, 'html.parser')
+base_soup = parsing.soup(base_resp.text, parsing.dropdown_strainer("ctl00_cplhMainContent_seasons_ddl"))
 
 season_select = base_soup.find("select", {"id": "ctl00_cplhMainContent_seasons_ddl"})
 if not season_select:
@@ -92,29 +122,38 @@ print("\nFound season options:")
 for folder_val, link in season_urls:
     print(f"  - {folder_val} -> {link}")
 
+if not FULL_REFRESH:
+    todo = manifest.pending(school, sport, "stats", [val for val, _ in season_urls])
+    print(f"\n{len(season_urls) - len(todo)} of {len(season_urls)} seasons are final and up to date")
+    season_urls = [(val, link) for val, link in season_urls if val in todo]
+
 # ------------------------------------------------------------------------------
 # 3) BFS LOGIC: FOR EACH SEASON, PARSE THE PAGE, DISCOVER TABS, EXTRACT TABLES
 # ------------------------------------------------------------------------------
-os.makedirs(root_folder, exist_ok=True)
+if OUTPUT != "parquet":
+    os.makedirs(root_folder, exist_ok=True)
 
 for season_val, season_link in season_urls:
     print(f"\n=== Processing season: {season_val} ===")
     
     try:
-        season_resp = requests.get(season_link, headers=headers, cookies=cookies)
+        season_resp = client.get(season_link, cookies=cookies)
         if season_resp.status_code != 200:
             print(f"Failed to load {season_link}, status={season_resp.status_code}")
             continue
+        # Full tree on purpose: the tab walker needs every tablist/section/table
         season_soup = bs(season_resp.text, 'html.parser')
     except Exception as e:
         print(f"Error retrieving {season_link}: {e}")
         continue
 
     season_folder = os.path.join(root_folder, season_val)
-    os.makedirs(season_folder, exist_ok=True)
+    if OUTPUT != "parquet":
+        os.makedirs(season_folder, exist_ok=True)
 
     queue = deque()
     visited_paths = set()
+    tables_written, tables_failed = 0, 0
     
     # Start BFS with the entire page
     queue.append((season_soup, []))
@@ -131,7 +170,8 @@ for season_val, season_link in season_urls:
             season_folder,
             *[p.replace("/", "_") for p in path_labels]
         )
-        os.makedirs(path_folder, exist_ok=True)
+        if OUTPUT != "parquet":
+            os.makedirs(path_folder, exist_ok=True)
 
         # ----------------------------------------------------------------------
         # Find sub-tabs in the static HTML
@@ -171,9 +211,11 @@ for season_val, season_link in season_urls:
 
             for idx, table_elem in enumerate(all_tables, start=1):
                 try:
-                    df = pd.read_html(str(table_elem))[0]
-                except:
-                    continue  # skip if can't parse
+                    df = table_to_frame(table_elem)
+                except Exception as e:
+                    print(f"Could not parse table {idx} under {path_labels or 'the page'}: {e}")
+                    tables_failed += 1
+                    continue
 
                 # Build filename from <caption> or fallback
                 cap_el = table_elem.find("caption")
@@ -188,9 +230,14 @@ for season_val, season_link in season_urls:
                             .replace(" ", "_")
                 )
                 
-                csv_path = os.path.join(path_folder, f"{safe_name}.csv")
-                df.to_csv(csv_path, index=False)
-                print(f"Saved table to {csv_path}")
+                if dataset is not None:
+                    table_name = "/".join([p.replace("/", "_") for p in path_labels] + [safe_name])
+                    dataset.add_frame(dataset_school, gender, sport_folder, season_val, table_name, df)
+                if OUTPUT != "parquet":
+                    csv_path = os.path.join(path_folder, f"{safe_name}.csv")
+                    df.to_csv(csv_path, index=False)
+                    print(f"Saved table to {csv_path}")
+                tables_written += 1
 
         # ----------------------------------------------------------------------
         # Otherwise, we have deeper sub‐tabs; enqueue them
@@ -200,4 +247,16 @@ for season_val, season_link in season_urls:
                 new_path = path_labels + [lbl]
                 queue.append((sc, new_path))
 
+    if dataset is not None:
+        dataset.flush()
+    # Record the season for the next refresh only if every table of every tab was written
+    if tables_written == 0 or tables_failed:
+        print(f"Season {season_val}: {tables_written} tables written, {tables_failed} failed; "
+              f"leaving it pending")
+        continue
+    manifest.mark_done(school, sport, "stats", season_val,
+                       outputs=[season_folder] if OUTPUT != "parquet" else [])
+    manifest.save()
+
+print(client.summary())
 print("\nAll done!")
@@ -1,27 +1,33 @@
 import os
+import sys
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import re
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import parsing
+from athlete.http_client import HttpClient
+from athlete.tables import table_to_frame
+
 # Base URL
 base_url = "https://www.tfrrs.org/teams/xc/IA_college_f_Grinnell.html"
 
+# Root folder for storing the data
+root_folder = "Cross Country"
+os.makedirs(root_folder, exist_ok=True)
+
 # Headers for HTTP requests
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
-# Root folder for storing the data
-root_folder = "Cross Country"
-os.makedirs(root_folder, exist_ok=True)
+client = HttpClient(headers=headers)
 
 # Step 1: Fetch the main page
-response = requests.get(base_url, headers=headers)
+response = client.get(base_url)
 if response.status_code != 200:
     print("Failed to fetch the main page")
     exit()
-soup = BeautifulSoup(response.text, "html.parser")
+soup = parsing.soup(response.text, parsing.dropdown_strainer(name="config_hnd"))
 
 # Step 2: Extract dropdown options
 dropdown = soup.find("select", {"name": "config_hnd"})
@@ -36,11 +42,11 @@ for season, value in season_mapping.items():
 
     # Simulate a form submission to select the season
     season_url = f"{base_url}?config_hnd={value}"
-    season_response = requests.get(season_url, headers=headers)
+    season_response = client.get(season_url)
     if season_response.status_code != 200:
         print(f"Failed to fetch season page for {season}")
         continue
-    season_soup = BeautifulSoup(season_response.text, "html.parser")
+    season_soup = parsing.soup(season_response.text, parsing.LINK_STRAINER)
 
     # Step 4: Locate buttons by <a> text
     button_texts = ["TOP QUALIFIERS (POP)", "TOP PERFORMANCES", "ALL PERFORMANCES"]
@@ -65,11 +71,11 @@ for season, value in season_mapping.items():
         # Fetch the linked page
         link = button["href"]
         full_link = requests.compat.urljoin(base_url, link)
-        linked_page_response = requests.get(full_link, headers=headers)
+        linked_page_response = client.get(full_link)
         if linked_page_response.status_code != 200:
             print(f"Failed to fetch page for button {button_name} in {season}")
             continue
-        linked_page_soup = BeautifulSoup(linked_page_response.text, "html.parser")
+        linked_page_soup = parsing.soup(linked_page_response.text, parsing.TFRRS_BLOCK_STRAINER)
 
         # Step 6: Locate table blocks and extract titles and tables
         table_blocks = linked_page_soup.find_all("div", {"class": "col-lg-12"})
@@ -93,7 +99,7 @@ for season, value in season_mapping.items():
 
             try:
                 # Convert the table to a pandas DataFrame
-                df = pd.read_html(str(table_element))[0]
+                df = table_to_frame(table_element)
 
                 # Clean and validate the table title for file naming
                 table_title = re.sub(r'[<>:"/\\|?*]', '_', table_title)
@@ -105,4 +111,5 @@ for season, value in season_mapping.items():
             except Exception as e:
                 print(f"Failed to process table '{table_title}' for {button_name} in {season}: {e}")
 
+print(client.summary())
 print("All data has been processed and saved.")
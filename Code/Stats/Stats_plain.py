@@ -1,9 +1,13 @@
 import os
+import sys
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
 import re
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete.http_client import HttpClient
+from athlete.tables import table_to_frame
+
 # Base URL
 base_url = "https://pioneers.grinnell.edu/sports/2012/4/14/WGOLF_0414125417.aspx"
 
@@ -12,12 +16,14 @@ headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
+client = HttpClient(headers=headers)
+
 # Root folder for storing the data
 root_folder = "Golf"
 os.makedirs(root_folder, exist_ok=True)
 
 # Step 1: Fetch the main page
-response = requests.get(base_url, headers=headers)
+response = client.get(base_url)
 if response.status_code != 200:
     print("Failed to fetch the main page")
     exit()
@@ -35,7 +41,7 @@ for season, link in season_mapping.items():
 
     # Fetch the season page
     season_url = requests.compat.urljoin(base_url, link)
-    season_response = requests.get(season_url, headers=headers)
+    season_response = client.get(season_url)
     if season_response.status_code != 200:
         print(f"Failed to fetch season page for {season}")
         continue
@@ -53,7 +59,7 @@ for season, link in season_mapping.items():
 
         # Fetch the category page
         stat_url = requests.compat.urljoin(season_url, stat_link["href"])
-        stat_response = requests.get(stat_url, headers=headers)
+        stat_response = client.get(stat_url)
         if stat_response.status_code != 200:
             print(f"Failed to fetch {stat_name} page for {season}")
             continue
@@ -72,7 +78,7 @@ for season, link in season_mapping.items():
 
                 try:
                     # Convert the table to a pandas DataFrame
-                    df = pd.read_html(str(table))[0]
+                    df = table_to_frame(table)
 
                     # Clean the file name using the title
                     file_name = re.sub(r"[^\w\s-]", "", title_text).replace(" ", "_")
@@ -100,7 +106,7 @@ for season, link in season_mapping.items():
                         continue
 
                     # Convert the table to a pandas DataFrame
-                    df = pd.read_html(str(table))[0]
+                    df = table_to_frame(table)
 
                     # Save the table with the player's name
                     table_filename = os.path.join(stat_folder, f"{player_name.replace(' ', '_')}.csv")
@@ -114,7 +120,7 @@ for season, link in season_mapping.items():
             tables = stat_soup.find_all("table")
             for idx, table in enumerate(tables):
                 try:
-                    df = pd.read_html(str(table))[0]
+                    df = table_to_frame(table)
                     table_filename = os.path.join(stat_folder, f"table_{idx + 1}.csv")
                     df.to_csv(table_filename, index=False)
                     print(f"Saved season stats table {idx + 1} in {season}")
@@ -124,4 +130,5 @@ for season, link in season_mapping.items():
         else:
             print(f"Unrecognized category {stat_name} for {season}")
 
+print(client.summary())
 print("All data has been processed and saved.")
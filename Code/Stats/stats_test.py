@@ -1,8 +1,11 @@
 import os
-import requests
-from bs4 import BeautifulSoup as bs
-import pandas as pd
-from io import StringIO
+import sys
+from bs4 import SoupStrainer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete import parsing
+from athlete.http_client import HttpClient
+from athlete.tables import table_to_frame
 
 # ---------------------------------------------------------------
 # CONFIG
@@ -16,14 +19,16 @@ headers = {
                   'Chrome/85.0.4183.121 Safari/537.36'
 }
 
+client = HttpClient(headers=headers)
+
 # ---------------------------------------------------------------
 # FETCH BASE PAGE
 # ---------------------------------------------------------------
 print(f"Fetching {BASE_URL}")
-resp = requests.get(BASE_URL, headers=headers)
+resp = client.get(BASE_URL)
 resp.raise_for_status()
 
-soup = bs(resp.text, "html.parser")
+soup = parsing.soup(resp.text, parsing.dropdown_strainer("ctl00_cplhMainContent_seasons_ddl"))
 
 # ---------------------------------------------------------------
 # FIND SEASON DROPDOWN
@@ -54,9 +59,9 @@ os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 for season_text, season_url in seasons:
     print(f"\n=== Processing season: {season_text} ===")
     try:
-        season_resp = requests.get(season_url, headers=headers)
+        season_resp = client.get(season_url)
         season_resp.raise_for_status()
-        season_soup = bs(season_resp.text, "html.parser")
+        season_soup = parsing.soup(season_resp.text, SoupStrainer(["ul", "section"]))
     except Exception as e:
         print(f"Failed to fetch season {season_text}: {e}")
         continue
@@ -84,7 +89,7 @@ for season_text, season_url in seasons:
                         continue
 
                     # Parse the table
-                    df = pd.read_html(StringIO(str(table)))[0]
+                    df = table_to_frame(table)
                     safe_name = f"{season_text}_{section_id}".replace(" ", "_").replace("/", "_")
                     csv_filename = f"{safe_name}.csv"
                     csv_path = os.path.join(season_folder, csv_filename)
@@ -96,4 +101,5 @@ for season_text, season_url in seasons:
                 continue
 
 
+print(client.summary())
 print("\nAll done!")
@@ -1,12 +1,17 @@
+import os
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from athlete.excel import read_excel, write_xlsx
+
 # Paths to your two Excel files
 men_file = "Men Team Expenses.xlsx"
 women_file = "Women Team Expenses.xlsx"
 
-# Read each file into a DataFrame
-df_men = pd.read_excel(men_file)
-df_women = pd.read_excel(women_file)
+# Read each file into a DataFrame (parsed once per workbook version, see athlete/excel.py)
+df_men = read_excel(men_file)
+df_women = read_excel(women_file)
 
 # Melt each DataFrame from wide to long:
 #  - "Year" is kept as is (id_vars)
@@ -25,8 +30,8 @@ combined_df = pd.concat([df_men_melted, df_women_melted], ignore_index=True)
 # Rearrange columns if you prefer a specific order:
 combined_df = combined_df[["Year", "Sport", "Cost", "Gender"]]
 
-# Save the result to Excel (or CSV)
-combined_df.to_excel("Combined_Team_Expenses.xlsx", index=False)
+# Save the result to Excel (or CSV), streamed row by row
+write_xlsx(combined_df, "Combined_Team_Expenses.xlsx")
 # If you prefer CSV:
 # combined_df.to_csv("Combined_Team_Expenses.csv", index=False)
 
@@ -6,9 +6,13 @@ Created on Mon Feb 10 15:33:07 2025
 """
 
 import os
+import sys
 import csv
 import requests
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+from athlete import parsing
+from athlete.http_client import HttpClient
 
 # -------------------------------------------------------------------
 # 1) SETUP
@@ -17,23 +21,16 @@ BASE_URL = "https://midwestconference.org"
 START_URL = f"{BASE_URL}/standings.aspx?path=wvball"
 ROOT_FOLDER = "Volleyball"
 
-# Spoof a browser User-Agent to avoid blocks
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/87.0.4280.66 Safari/537.36"
-    )
-}
-
 os.makedirs(ROOT_FOLDER, exist_ok=True)
 
+client = HttpClient()
+
 # -------------------------------------------------------------------
 # 2) FETCH THE MAIN PAGE & FIND THE SEASON DROPDOWN
 # -------------------------------------------------------------------
-response = requests.get(START_URL, headers=HEADERS)
+response = client.get(START_URL)
 response.raise_for_status()
-soup = BeautifulSoup(response.text, "html.parser")
+soup = parsing.soup(response.text, parsing.dropdown_strainer("ctl00_cplhMainContent_ddl_past_standings"))
 
 # The dropdown has id="ctl00_cplhMainContent_ddl_past_standings"
 season_select = soup.find("select", id="ctl00_cplhMainContent_ddl_past_standings")
@@ -61,9 +58,15 @@ for opt in options:
     print(f"Scraping '{season_text}' => {season_url}")
 
     # Fetch that season page
-    resp = requests.get(season_url, headers=HEADERS)
-    resp.raise_for_status()
-    season_soup = BeautifulSoup(resp.text, "html.parser")
+    # (transient 5xx are retried by the client; a page that still fails only
+    # skips its own season instead of killing the whole run)
+    resp = client.get(season_url)
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError as err:
+        print(f"Failed to fetch {season_url} -- {err}")
+        continue
+    season_soup = parsing.soup(resp.text, parsing.STANDINGS_STRAINER)
 
     # -----------------------------------------------------------------
     # 4) FIND THE STANDINGS TABLE
@@ -128,4 +131,5 @@ for opt in options:
             f.write("")
         print(f"Empty table. Wrote empty CSV => {csv_filename}")
 
+print(client.summary())
 print("Done scraping!")
@@ -19,65 +19,19 @@ Outputs:
   • combined_athlete_expenses_std.csv
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from athlete.names import SCHOOLS
+
 # ---------------------------------------------------------------------------
-# 1. Mapping dictionary: variant → canonical
+# 1. Canonical names
 # ---------------------------------------------------------------------------
-
-SCHOOL_MAP = {
-    # Beloit
-    "Beloit College":        "Beloit College",
-    "Beloit":                "Beloit College",
-
-    # Carroll
-    "Carroll University":    "Carroll University",
-    "Carroll":               "Carroll University",
-
-    # Cornell
-    "Cornell College":       "Cornell College",
-    "Cornell":               "Cornell College",
-
-    # Grinnell
-    "Grinnell College":      "Grinnell College",
-    "Grinnell":              "Grinnell College",
-
-    # Illinois
-    "Illinois College":      "Illinois College",
-    "Illinois C.":           "Illinois College",
-    "Illinois Col.":         "Illinois College",
-
-    # Knox
-    "Knox College":          "Knox College",
-    "Knox":                  "Knox College",
-    "Know":                  "Knox College",   # typo
-
-    # Lake Forest
-    "Lake Forest College":   "Lake Forest College",
-    "Lake Forest":           "Lake Forest College",
-
-    # Lawrence
-    "Lawrence University":   "Lawrence University",
-    "Lawrence":              "Lawrence University",
-    "Lawerence":             "Lawrence University",  # typo
-
-    # Monmouth
-    "Monmouth College":      "Monmouth College",
-    "Monmouth":              "Monmouth College",
-
-    # Ripon
-    "Ripon College":         "Ripon College",
-    "Ripon":                 "Ripon College",
-
-    # St / Saint Norbert
-    "St. Norbert College":   "St. Norbert College",
-    "St. Norbert":           "St. Norbert College",
-    "Saint Norbert College": "St. Norbert College",
-
-    # University of Chicago
-    "University of Chicago": "University of Chicago",
-}
+# Variants ("Beloit", "Illinois Col.", "Lawerence", ...) and their canonical
+# spelling live in athlete.names.SCHOOLS, which also catches unseen variants
+# ("Illinois Col", "Monmouth IL") by abbreviation and bounded fuzzy matching.
 
 # ---------------------------------------------------------------------------
 # 2. Utility
@@ -86,16 +40,10 @@ SCHOOL_MAP = {
 def standardize_school_column(df, col="School"):
     """
     Return a copy of *df* with a new column `<col>_std` that holds the
-    canonical spelling. Unmapped values are left unchanged.
+    canonical spelling. Unmatched values are left unchanged.
     """
     df = df.copy()
-    df[f"{col}_std"] = (
-        df[col]
-          .astype(str)
-          .str.strip()
-          .map(SCHOOL_MAP)
-          .fillna(df[col])          # keep original if unseen
-    )
+    df[f"{col}_std"] = SCHOOLS.standardize(df[col])
     return df
 
 # ---------------------------------------------------------------------------
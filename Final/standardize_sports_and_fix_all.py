@@ -2,49 +2,17 @@
 # ------------------------------------------------------------
 # standardize_sports_and_fix_all.py
 # ------------------------------------------------------------
+import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from athlete.names import SPORTS
+
 # ────────────────────────────────────────────────────────────
-# 1) SPORT-NAME MAPPING  (variant ➜ canonical)
+# 1) SPORT NAMES  (variant ➜ canonical: athlete.names.SPORTS)
 # ────────────────────────────────────────────────────────────
-SPORT_MAP = {
-    # ball sports & others
-    "Baseball": "Baseball",
-    "Softball": "Softball",
-    "Basketball": "Basketball",
-    "Football": "Football",
-    "Golf": "Golf",
-    "Ice Hockey": "Ice Hockey",
-    "Lacrosse": "Lacrosse",
-    "Soccer": "Soccer",
-    "Tennis": "Tennis",
-    "Volleyball": "Volleyball",
-    "Fencing": "Fencing",
-    "Water Polo": "Water Polo",
-    "Wrestling": "Wrestling",
-
-    # cross-country / track
-    "Cross Country": "Cross Country",
-    "Cross_Country": "Cross Country",
-    "Track and Field X Country": "Cross Country",
-    "Indoor Track & Field": "Track & Field (Indoor)",
-    "Track and Field Indoor": "Track & Field (Indoor)",
-    "Outdoor Track & Field": "Track & Field (Outdoor)",
-    "Track and Field Outdoor": "Track & Field (Outdoor)",
-    "Track and Fields": "Track & Field (Outdoor)",
-    "All Track Combined": "All Track Combined",
-
-    # swim / dive
-    "Swimming": "Swimming & Diving",
-    "Diving": "Swimming & Diving",
-    "Swimming and Diving": "Swimming & Diving",
-    "Swimming & Diving": "Swimming & Diving",
-
-    # total rows
-    "Total": "Total",
-}
-
 NUMERIC_COLS = ["Total Expense", "Operating Expense"]   # columns to aggregate
 
 # ────────────────────────────────────────────────────────────
@@ -68,62 +36,80 @@ for df in (score_df, exp_df):
 # 3) STANDARDISE SPORT NAMES (all three dataframes)
 # ────────────────────────────────────────────────────────────
 for df in (score_df, exp_df, roster_df):
-    df["Sport_std"] = (
-        df["Sport"]
-          .astype(str)
-          .str.strip()
-          .map(SPORT_MAP)
-          .fillna(df["Sport"])
-    )
+    df["Sport_std"] = SPORTS.standardize(df["Sport"])
 
 # ────────────────────────────────────────────────────────────
 # 4) EXPENSE-FILE SPECIAL FIXES
 # ────────────────────────────────────────────────────────────
-clean_blocks = []
-
-for (yr, gender, school), grp in exp_df.groupby(
-    ["Year", "Gender", "School_std"], sort=False
-):
-    grp = grp.copy()
-
-    # 4-A  merge duplicate Swimming & Diving rows
-    if (grp["Sport_std"] == "Swimming & Diving").sum() > 1:
-        rows = grp[grp["Sport_std"] == "Swimming & Diving"]
-        summed = rows[NUMERIC_COLS].sum()
-        template = rows.iloc[0].copy()
-        template.update(summed)
-        grp = grp[grp["Sport_std"] != "Swimming & Diving"]
-        grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
+GROUP_KEYS = ["Year", "Gender", "School_std"]
+TRACK_SPORTS = ["Track & Field (Indoor)", "Track & Field (Outdoor)", "Cross Country"]
+
+
+def fix_expenses(exp_df):
+    """
+    Per (Year, Gender, School_std) group: merge duplicate Swimming & Diving
+    rows, add All Track Combined and Total rows if missing. Works on group
+    codes; the output is taken from exp_df once, each synthesized row right
+    after its group, groups in order of first appearance.
+    """
+    grp = exp_df.groupby(GROUP_KEYS, sort=False).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    n_groups = grp.max() + 1 if len(grp) else 0
+    pos = np.arange(len(grp))
+    sport = exp_df["Sport_std"]
+    in_group = grp >= 0                       # groupby leaves out rows with a missing key
+    swim = in_group & sport.eq("Swimming & Diving").to_numpy()
+    track = in_group & sport.isin(TRACK_SPORTS).to_numpy()
+    values = {c: exp_df[c].to_numpy(dtype=float) for c in NUMERIC_COLS}
+
+    def count(mask):
+        return np.bincount(grp[mask], minlength=n_groups)
+
+    def sums(mask):
+        return {c: np.bincount(grp[mask], weights=np.nan_to_num(v[mask]), minlength=n_groups)
+                for c, v in values.items()}
+
+    def first(mask):
+        firsts = np.full(n_groups, -1)
+        groups, at = np.unique(grp[mask], return_index=True)
+        firsts[groups] = pos[mask][at]
+        return firsts
+
+    # 4-A  merge duplicate Swimming & Diving rows into a copy of the first one
+    merge = count(swim) > 1
+    dup = swim & merge[grp]
+    kept = in_group & ~dup
+    swim_sums = sums(dup)
+    # the group's first row once 4-A is done: templates for 4-B and 4-C
+    template = first(kept)
+    template = np.where(template >= 0, template, first(swim))
 
     # 4-B  add All Track Combined if missing
-    if "All Track Combined" not in grp["Sport_std"].values:
-        mask = grp["Sport_std"].isin(
-            ["Track & Field (Indoor)", "Track & Field (Outdoor)", "Cross Country"]
-        )
-        if mask.any():
-            summed = grp.loc[mask, NUMERIC_COLS].sum()
-            template = grp.iloc[0].copy()
-            template["Sport"] = template["Sport_std"] = "All Track Combined"
-            template.update(summed)
-            grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
+    has_atc = count(in_group & sport.eq("All Track Combined").to_numpy()) > 0
+    add_atc = ~has_atc & (count(track) > 0)
+    track_sums = sums(track)
 
     # 4-C  add Total row if missing (avoid double-count)
-    if "Total" not in grp["Sport_std"].values:
-        exclude = (
-            ["Track & Field (Indoor)", "Track & Field (Outdoor)", "Cross Country"]
-            if "All Track Combined" in grp["Sport_std"].values
-            else []
-        )
-        sum_mask = ~grp["Sport_std"].isin(["Total"] + exclude)
-        summed = grp.loc[sum_mask, NUMERIC_COLS].sum()
-        template = grp.iloc[0].copy()
-        template["Sport"] = template["Sport_std"] = "Total"
-        template.update(summed)
-        grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
-
-    clean_blocks.append(grp)
-
-exp_clean = pd.concat(clean_blocks, ignore_index=True)
+    add_total = count(in_group & sport.eq("Total").to_numpy()) == 0
+    counted = sums(kept & ~((has_atc | add_atc)[grp] & track))
+    total_sums = {c: counted[c] + swim_sums[c] * merge + track_sums[c] * add_atc for c in NUMERIC_COLS}
+
+    merge_g, atc_g, total_g = np.flatnonzero(merge), np.flatnonzero(add_atc), np.flatnonzero(add_total)
+    src = np.concatenate([pos[kept], first(swim)[merge_g], template[atc_g], template[total_g]])
+    step = np.repeat([0, 1, 2, 3], [kept.sum(), len(merge_g), len(atc_g), len(total_g)])
+    order = np.lexsort((src, step, np.concatenate([grp[kept], merge_g, atc_g, total_g])))
+
+    out = exp_df.take(src[order]).reset_index(drop=True)
+    for c in NUMERIC_COLS:
+        col = np.concatenate([values[c][kept], swim_sums[c][merge_g],
+                              track_sums[c][atc_g], total_sums[c][total_g]])
+        out[c] = col[order]
+    step = step[order]
+    out.loc[step == 2, ["Sport", "Sport_std"]] = "All Track Combined"
+    out.loc[step == 3, ["Sport", "Sport_std"]] = "Total"
+    return out
+
+
+exp_clean = fix_expenses(exp_df)
 
 # ────────────────────────────────────────────────────────────
 # 5) SAVE CLEANED DATA
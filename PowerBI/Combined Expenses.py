@@ -1,7 +1,11 @@
 import os
 import re
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.names import EXPENSE_REPORT_SPORTS
+
 # Folder containing all CSV files for each school
 school_expenses_folder = "School Expenses"
 
@@ -50,15 +54,9 @@ def parse_column_name(col_name):
     pattern = r"(?:Men's|Women's)\s+Team\s+Expenses$"
     base_sport = re.sub(pattern, "", col_norm, flags=re.IGNORECASE).strip()
 
-    # Special cases
-    if base_sport.lower() == "track and field x country":
-        # rename to Cross Country
-        sport = "Cross Country"
-    elif base_sport.lower() in ["track and field indoor", "track and field outdoor"]:
-        # unify to Track and Fields (we'll sum them later)
-        sport = "Track and Fields"
-    else:
-        sport = base_sport
+    # Canonical name (X Country -> Cross Country, indoor/outdoor -> Track and
+    # Fields, which we sum later); unknown sports are kept as they are
+    sport = EXPENSE_REPORT_SPORTS.resolve(base_sport) or base_sport
 
     return sport, gender
 
@@ -129,6 +127,8 @@ for filename in os.listdir(school_expenses_folder):
     # Add to the list of all rows
     all_rows.append(file_long_df)
 
+EXPENSE_REPORT_SPORTS.save()
+
 # Combine everything across all schools
 if not all_rows:
     print("No valid expense data found in any file.")
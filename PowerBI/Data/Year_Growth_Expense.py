@@ -1,25 +1,30 @@
+import os
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from athlete.growth import growth
+
 # Load the CSV file into a DataFrame
 df = pd.read_csv('all_school_expenses.csv')
 
 # Sort the DataFrame to ensure proper ordering for each school, sport, and gender.
 df.sort_values(by=['School', 'Sport', 'Gender', 'Year'], inplace=True)
 
-# Compute Accumulative Growth:
-# For each group (School, Sport, and Gender), use the 2003 expense as the base (i.e., 1),
-# then compute each year's expense relative to the 2003 expense.
-df['Accumulative Growth'] = df.groupby(['School', 'Sport', 'Gender'])['Expense'] \
-    .transform(lambda x: x / x.iloc[0])
-
-# Compute Yearly Change:
-# For each group, calculate the difference between this year's expense and the previous year's,
-# then divide that difference by the previous year's expense.
-df['Yearly Change'] = df.groupby(['School', 'Sport', 'Gender'])['Expense'] \
-    .transform(lambda x: x.diff() / x.shift(1))
+# Per (School, Sport, Gender) series, from that series' own first year:
+# Accumulative Growth = expense relative to the first year's expense (1 there)
+# Yearly Change = change from the series' previous year in the data,
+# x.diff() / x.shift(1) (blank in the first year)
+# Annualized Yearly Change = the same per year when years are missing in
+# between (0 in the first year)
+changes = growth(df, 'Expense', by=['School', 'Sport', 'Gender'], metrics=('Index', 'Change', 'YoY'))
+df['Accumulative Growth'] = changes['Index']
+df['Yearly Change'] = changes['Change']
 
 # For the base year (2003), set the Yearly Change to 0 since there is no previous year.
 df.loc[df['Year'] == 2003, 'Yearly Change'] = 0
 
+df['Annualized Yearly Change'] = changes['YoY']
+
 # Save the updated DataFrame to a new CSV file locally.
 df.to_csv('all_school_expenses_updated.csv', index=False)
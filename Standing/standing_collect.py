@@ -1,10 +1,15 @@
-import requests
+import os
+import sys
 import re
 import pandas as pd
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from requests.utils import requote_uri
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.http_client import HttpClient
+from athlete.names import STANDING_SPORT_CODES
+
 # ——— 0) Browser-like headers ———
 HEADERS = {
     "User-Agent": (
@@ -14,11 +19,13 @@ HEADERS = {
     )
 }
 
+client = HttpClient(headers=HEADERS)
+
 # ——— 1) Fetch history page ———
 history_url = requote_uri(
     "https://midwestconference.org/sports/2010/8/18/GEN_0818103443.aspx?id=86"
 )
-resp = requests.get(history_url, headers=HEADERS)
+resp = client.get(history_url)
 resp.raise_for_status()
 history_soup = BeautifulSoup(resp.content, "html.parser")
 
@@ -33,29 +40,14 @@ for a in history_soup.find_all("a", href=True):
             raw = urljoin(BASE, a["href"])
             year_links[start] = requote_uri(raw)
 
-# ——— 3) Sport code → full name (all keys uppercase) ———
-sport_map = {
-    "VB":    "Volleyball",
-    "SOC":   "Soccer",
-    "XC":    "Cross Country",
-    "CC":    "Cross Country",      # alternate code
-    "TEN":   "Tennis",
-    "BKB":   "Basketball",
-    "SWIM":  "Swimming",
-    "SWM":   "Swimming",           # alternate code
-    "ITRK":  "Indoor Track & Field",
-    "OTRK":  "Outdoor Track & Field",
-    "SB":    "Softball",
-    "FB":    "Football",
-    "BASE":  "Baseball",
-    "BSB":   "Baseball",           # alternate code
-    "TOTAL": "Total"               # capture the Total column
-}
+# ——— 3) Sport code → full name ———
+# Header codes (VB, SOC, XC/CC, SWIM/SWM, ITRK, TOTAL, ...) are resolved by
+# athlete.names.STANDING_SPORT_CODES: exact matches only, no fuzzy guessing
 
 # ——— 4) Scrape each season’s Men/Women tables ———
 records = []
 for year in sorted(year_links):
-    page = requests.get(year_links[year], headers=HEADERS)
+    page = client.get(year_links[year])
     page.raise_for_status()
     soup = BeautifulSoup(page.content, "html.parser")
     tables = soup.find_all("table")
@@ -76,7 +68,7 @@ for year in sorted(year_links):
             school = cells[0]
             # zip each code with its corresponding rank
             for code, rank in zip(codes, cells[1:]):
-                sport_name = sport_map.get(code)
+                sport_name = STANDING_SPORT_CODES.resolve(code)
                 if sport_name:
                     records.append({
                         "Year":   year,
@@ -86,7 +78,10 @@ for year in sorted(year_links):
                         "Rank":   rank
                     })
 
+STANDING_SPORT_CODES.save()
+
 # ——— 5) Build DataFrame & save ———
 df = pd.DataFrame(records)
 df.to_csv("midwest_all_sports_standings_2003_2025.csv", index=False)
 print(f"Saved {len(df)} rows for {len(year_links)} seasons.")
+print(client.summary())
@@ -7,6 +7,10 @@ Created on Mon Feb  3 15:35:47 2025
 
 import pandas as pd
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from athlete.excel import read_excel, write_xlsx
 
 def extract_unique_values(input_file, column_name, output_file=None):
     """
@@ -24,7 +28,7 @@ def extract_unique_values(input_file, column_name, output_file=None):
     if ext == ".csv":
         df = pd.read_csv(input_file)
     elif ext in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_file)
+        df = read_excel(input_file)
     else:
         raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
     
@@ -44,7 +48,7 @@ def extract_unique_values(input_file, column_name, output_file=None):
         output_file = f"{column_name}_unique.xlsx"
     
     # Save the new DataFrame to an Excel file (without the index).
-    out_df.to_excel(output_file, index=False)
+    write_xlsx(out_df, output_file)
     print(f"Unique values from column '{column_name}' have been saved to '{output_file}'.")
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+"""
+Shared helpers for the athletics scrapers and aggregation scripts.
+
+The scripts in this repo are run directly (Spyder / ``python script.py``), so
+each one puts the repository root on ``sys.path`` before importing from here.
+"""
@@ -0,0 +1,257 @@
+"""
+Sidearm all-time records pages (``alltime.aspx?path=...&record_type=opponents``).
+
+Each ``tr[data-identifier="Overall"]`` row opens a modal whose ``#record_table``
+is loaded by a separate request. Instead of clicking every row in a browser,
+detail_url() works out that request from the row itself, and the tables are
+then fetched concurrently over plain HTTP.
+
+How the row points at its detail request, in the order tried:
+
+  1. an ``<a href>`` inside the row (not "#" / "javascript:");
+  2. a ``data-url`` / ``data-href`` / ``data-link`` attribute;
+  3. a quoted path or URL inside the row's ``onclick``;
+  4. a template -- a format string filled with the page's query parameters
+     and the row's ``data-*`` attributes (dashes become underscores), e.g.
+     "{base}/services/alltime.ashx?path={path}&id={data_id}".
+
+The template for a site is recorded, not guessed: discover_template() opens
+the page in Chrome once, clicks the first row, takes the GET the click sends
+from the browser's network log and replaces the values that came from the
+row or the page URL with their field names. The result is kept per host in
+``.alltime_endpoints.json`` at the repo root, so every later run and every
+sport on that site is plain HTTP.
+
+    python -m athlete.alltime discover "https://pioneers.grinnell.edu/alltime.aspx?path=wbball&record_type=opponents"
+    python -m athlete.alltime show
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from urllib.parse import urljoin, urlsplit, parse_qsl, quote, unquote
+
+from bs4 import SoupStrainer
+
+from athlete import parsing
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# ATHLETE_ALLTIME_ENDPOINTS points a run at a different endpoints file
+DEFAULT_ENDPOINTS_PATH = os.environ.get("ATHLETE_ALLTIME_ENDPOINTS") or os.path.join(
+    REPO_ROOT, ".alltime_endpoints.json")
+
+OVERALL_ROW_SELECTOR = 'tr[data-identifier="Overall"]'
+OVERALL_ROW_STRAINER = SoupStrainer("tr", attrs={"data-identifier": "Overall"})
+RECORD_TABLE_STRAINER = SoupStrainer(id="record_table")
+
+_ONCLICK_URL_RE = re.compile(r"""['"]((?:https?://|/)[^'"]+)['"]""")
+
+# Reads every attribute of an element in the browser (Selenium has no call for it)
+_ATTRIBUTES_JS = ("var a = {}; for (const n of arguments[0].getAttributeNames()) "
+                  "a[n] = arguments[0].getAttribute(n); return a;")
+
+
+def parse_overall_rows(html, parser=None):
+    """The ``tr[data-identifier="Overall"]`` rows, in page order."""
+    return parsing.soup(html, OVERALL_ROW_STRAINER, parser).find_all("tr")
+
+
+def row_link(page_url, row):
+    """URL the row itself points at (steps 1-3 above), or None."""
+    a_tag = row.find("a", href=True)
+    if a_tag and not a_tag["href"].startswith(("#", "javascript:")):
+        return urljoin(page_url, a_tag["href"])
+
+    for attr in ("data-url", "data-href", "data-link"):
+        if row.get(attr):
+            return urljoin(page_url, row[attr])
+
+    m = _ONCLICK_URL_RE.search(row.get("onclick") or "")
+    if m:
+        return urljoin(page_url, m.group(1))
+    return None
+
+
+def _fields(page_url, row_attrs):
+    parts = urlsplit(page_url)
+    fields = {"base": f"{parts.scheme}://{parts.netloc}"}
+    fields.update(parse_qsl(parts.query))
+    fields.update({k.replace("-", "_"): v for k, v in row_attrs.items() if k.startswith("data-")})
+    return fields
+
+
+def detail_url(page_url, row, template=None):
+    """URL of the request behind one row's modal (see module docstring)."""
+    link = row_link(page_url, row)
+    if link is not None:
+        return link
+    if template is None:
+        raise ValueError(
+            "Could not find the detail request for an 'Overall' row and no template "
+            f"is recorded for {urlsplit(page_url).netloc} (see athlete/alltime.py). "
+            f"Row attributes: {dict(row.attrs)}"
+        )
+    fields = {k: v if k == "base" else quote(str(v), safe="")
+              for k, v in _fields(page_url, row.attrs).items()}
+    try:
+        return template.format(**fields)
+    except KeyError as err:
+        raise ValueError(f"Row has no {err.args[0]!r} for the detail template {template!r}") from None
+
+
+def request_template(request_url, page_url, row_attrs):
+    """
+    Template for detail_url() from one recorded request: every query value or
+    path segment equal to a row ``data-*`` attribute (or else a page query
+    parameter) becomes that field.
+    """
+    fields = _fields(page_url, row_attrs)
+    base = fields.pop("base")
+    by_value = {}
+    for name, value in fields.items():          # row attributes come last and win
+        if value:
+            by_value[value] = "{" + name + "}"
+
+    def part(text, safe):
+        return by_value.get(text) or quote(text, safe=safe).replace("{", "{{").replace("}", "}}")
+
+    req = urlsplit(request_url)
+    path = "/".join(part(unquote(segment), "") for segment in req.path.split("/"))
+    query = "&".join(f"{quote(k, safe='')}={part(v, '')}"
+                     for k, v in parse_qsl(req.query, keep_blank_values=True))
+    if f"{req.scheme}://{req.netloc}" == base:
+        template = "{base}" + path
+    else:
+        template = f"{req.scheme}://{req.netloc}{path}".replace("{", "{{").replace("}", "}}")
+    return template + ("?" + query if query else "")
+
+
+def discover_template(page_url, timeout=15):
+    """
+    Open ``page_url`` in Chrome, click its first 'Overall' row and turn the GET
+    request the modal sends into a template (see request_template()).
+    """
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+    except ImportError:
+        raise ImportError("recording the detail request needs selenium: pip install selenium") from None
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(page_url)
+        row = WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, OVERALL_ROW_SELECTOR)))
+        row_attrs = driver.execute_script(_ATTRIBUTES_JS, row)
+        driver.get_log("performance")           # drop the page load's own requests
+        driver.execute_script("arguments[0].scrollIntoView(true);", row)
+        driver.execute_script("arguments[0].click();", row)
+
+        # the modal's request goes to the site itself; analytics calls do not
+        host = urlsplit(page_url).netloc
+        requests, deadline = [], time.time() + timeout
+        while not any(urlsplit(u).netloc == host for u in requests) and time.time() < deadline:
+            for entry in driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                if message["method"] != "Network.requestWillBeSent":
+                    continue
+                params = message["params"]
+                if params.get("type") in ("XHR", "Fetch") and params["request"]["method"] == "GET":
+                    requests.append(params["request"]["url"])
+            time.sleep(0.2)
+    finally:
+        driver.quit()
+
+    own = [u for u in requests if urlsplit(u).netloc == host]
+    if not own:
+        raise ValueError(f"Clicking an 'Overall' row on {page_url} sent no GET request to {host}")
+    return request_template(own[0], page_url, row_attrs)
+
+
+# -----------------------------------------------------------------------------
+# Recorded templates, per host
+# -----------------------------------------------------------------------------
+def _read_endpoints(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def saved_template(page_url, path=DEFAULT_ENDPOINTS_PATH):
+    """Template recorded for ``page_url``'s host, or None."""
+    return _read_endpoints(path).get(urlsplit(page_url).netloc)
+
+
+def save_template(page_url, template, path=DEFAULT_ENDPOINTS_PATH):
+    with _FileLock(path):
+        data = _read_endpoints(path)
+        data[urlsplit(page_url).netloc] = template
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+
+def detail_template(page_url, path=DEFAULT_ENDPOINTS_PATH):
+    """The host's recorded template, recording it with discover_template() first if needed."""
+    template = saved_template(page_url, path)
+    if template is None:
+        print(f"Recording the detail request for {urlsplit(page_url).netloc} (opens Chrome once)...")
+        template = discover_template(page_url)
+        save_template(page_url, template, path)
+        print(f"Detail request: {template}")
+    return template
+
+
+def parse_record_table(html, parser=None):
+    """
+    Rows of cell texts from a modal response. The response may be the whole
+    ``#record_table`` element or just its inner table.
+    """
+    record = parsing.soup(html, RECORD_TABLE_STRAINER, parser).find(id="record_table")
+    if record is None:
+        record = parsing.soup(html, parsing.TABLE_STRAINER, parser)
+    return [
+        [cell.get_text(strip=True) for cell in tr.find_all(["td", "th"])]
+        for tr in record.find_all("tr")
+    ]
+
+
+def flatten(tables):
+    """[(identifier, rows), ...] -> one list per row, prefixed with its identifier."""
+    return [[identifier] + row for identifier, rows in tables for row in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.alltime",
+                                     description="Detail requests of Sidearm all-time records pages.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("discover", help="record (again) the detail request for a page's host")
+    p.add_argument("page_url")
+    sub.add_parser("show", help="recorded templates per host")
+    args = parser.parse_args(argv)
+
+    if args.command == "discover":
+        template = discover_template(args.page_url)
+        save_template(args.page_url, template)
+        print(f"{urlsplit(args.page_url).netloc}: {template}")
+    else:
+        for host, template in sorted(_read_endpoints(DEFAULT_ENDPOINTS_PATH).items()):
+            print(f"{host}: {template}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Compressed, content-addressed archive of every page fetched over the network,
+plus an offline replay mode.
+
+Layout under ``.html_archive/`` at the repo root:
+
+    objects/<sha[:2]>/<sha256 of body>.gz   gzip'd body, stored once per content
+    index.jsonl                             one line per fetch: url, fetched_at,
+                                            sha256, status, encoding, content type
+
+HttpClient records every 200 response it downloads (cache hits are already
+archived, 304s did not change). A page that did not change between fetches
+costs one index line, not another copy.
+
+Replay: with ``ATHLETE_REPLAY=1`` in the environment (or
+``HttpClient(replay=True)``) every request is answered from the archive --
+no network, no rate limiting. The answer is the latest copy of the URL, or
+the latest one at or before ``ATHLETE_REPLAY_AS_OF`` (YYYY-MM-DD). A URL that
+was never archived comes back as a 404, so the scripts' usual "failed to
+fetch" handling applies. Re-parsing after a parser fix is then just re-running
+the scraper:
+
+    python -m athlete.archive run Code/Schedule/schedule.py   # script, offline
+    python -m athlete.scheduler --replay                      # all schedules, offline
+    python -m athlete.archive stats
+    python -m athlete.archive list riponredhawks.com/sports/baseball
+    python -m athlete.archive import-cache                    # seed from .http_cache/
+
+Scripts that skip final seasons through the manifest need FULL_REFRESH = True
+to re-parse them (the scheduler's --replay does that for you).
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import bisect
+import hashlib
+import argparse
+import datetime
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ARCHIVE_DIR = os.path.join(REPO_ROOT, ".html_archive")
+
+REPLAY_ENV = "ATHLETE_REPLAY"
+REPLAY_AS_OF_ENV = "ATHLETE_REPLAY_AS_OF"
+
+
+def replay_enabled():
+    return os.environ.get(REPLAY_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def replay_as_of():
+    """ATHLETE_REPLAY_AS_OF as an end-of-day timestamp, or None."""
+    value = os.environ.get(REPLAY_AS_OF_ENV, "").strip()
+    if not value:
+        return None
+    day = datetime.datetime.strptime(value, "%Y-%m-%d") + datetime.timedelta(days=1)
+    return day.timestamp()
+
+
+class HtmlArchive:
+    """Append-only page archive. Safe to share between threads and processes."""
+
+    def __init__(self, archive_dir=DEFAULT_ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, "index.jsonl")
+        self.stats = {"archived": 0, "new_objects": 0, "replayed": 0, "missing": 0}
+        self._lock = threading.Lock()
+        self._index = None  # url -> [entry, ...] sorted by fetched_at; loaded lazily
+        os.makedirs(os.path.join(archive_dir, "objects"), exist_ok=True)
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _object_path(self, digest):
+        return os.path.join(self.archive_dir, "objects", digest[:2], digest + ".gz")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def put(self, body):
+        """Store a body (bytes) once; returns its SHA-256."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(body)
+            os.replace(tmp, path)
+            self._count("new_objects")
+        return digest
+
+    def add(self, url, body, status=200, encoding=None, content_type=None, fetched_at=None):
+        """Archive one fetch of ``url``."""
+        entry = {
+            "url": url,
+            "fetched_at": fetched_at or time.time(),
+            "sha256": self.put(body),
+            "status": status,
+            "encoding": encoding,
+            "content_type": content_type,
+        }
+        line = json.dumps(entry) + "\n"
+        with _FileLock(self.index_path, poll=0.005):
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        with self._lock:
+            if self._index is not None:
+                self._insert(entry)
+        self._count("archived")
+        return entry
+
+    def record(self, url, resp):
+        """Archive a requests.Response (only 200s are worth replaying)."""
+        if resp.status_code != 200:
+            return None
+        return self.add(url, resp.content, resp.status_code, resp.encoding,
+                        resp.headers.get("Content-Type"))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _insert(self, entry):
+        entries = self._index.setdefault(entry["url"], [])
+        keys = [e["fetched_at"] for e in entries]
+        entries.insert(bisect.bisect_right(keys, entry["fetched_at"]), entry)
+
+    def index(self):
+        """{url: [entry, ...]} oldest first (read once per process)."""
+        with self._lock:
+            if self._index is None:
+                self._index = {}
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            try:
+                                self._insert(json.loads(line))
+                            except ValueError:
+                                continue  # torn last line from a crashed writer
+                except OSError:
+                    pass
+            return self._index
+
+    def latest(self, url, as_of=None):
+        """Newest entry for ``url`` (fetched at or before ``as_of``), or None."""
+        entries = self.index().get(url, [])
+        if as_of is not None:
+            entries = [e for e in entries if e["fetched_at"] <= as_of]
+        return entries[-1] if entries else None
+
+    def body(self, digest):
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return f.read()
+
+    def response(self, url, as_of=None):
+        """The archived page as a requests.Response; a 404 if never archived."""
+        resp = requests.Response()
+        resp.url = url
+        resp.from_cache = True
+        entry = self.latest(url, as_of)
+        if entry is None:
+            self._count("missing")
+            resp.status_code = 404
+            resp.reason = "Not in archive"
+            resp._content = b""
+            return resp
+        self._count("replayed")
+        resp.status_code = entry["status"]
+        resp.reason = "OK"
+        resp._content = self.body(entry["sha256"])
+        resp.encoding = entry.get("encoding")
+        resp.headers = CaseInsensitiveDict(
+            {"Content-Type": entry["content_type"]} if entry.get("content_type") else {})
+        return resp
+
+    def summary(self):
+        s = self.stats
+        return (f"archive: {s['archived']} pages archived ({s['new_objects']} new objects), "
+                f"{s['replayed']} replayed, {s['missing']} not in archive")
+
+
+# -----------------------------------------------------------------------------
+# CLI
+# -----------------------------------------------------------------------------
+def _stats(archive):
+    index = archive.index()
+    fetches = sum(len(v) for v in index.values())
+    objects, size = 0, 0
+    for root, _, files in os.walk(os.path.join(archive.archive_dir, "objects")):
+        for name in files:
+            if name.endswith(".gz"):
+                objects += 1
+                size += os.path.getsize(os.path.join(root, name))
+    print(f"{len(index)} URLs, {fetches} fetches, {objects} distinct pages, "
+          f"{size / 1e6:.1f} MB compressed")
+
+
+def _list(archive, pattern):
+    for url, entries in sorted(archive.index().items()):
+        if pattern and pattern not in url:
+            continue
+        for e in entries:
+            when = datetime.datetime.fromtimestamp(e["fetched_at"]).strftime("%Y-%m-%d %H:%M")
+            print(f"{when}  {e['sha256'][:12]}  {url}")
+
+
+def _import_cache(archive, cache_dir):
+    """Seed the archive from the HTTP cache's stored bodies."""
+    known = {(url, e["sha256"]) for url, entries in archive.index().items() for e in entries}
+    added = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(root, name)
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(meta_path[:-5] + ".body", "rb") as f:
+                    body = f.read()
+            except (OSError, ValueError):
+                continue
+            if (meta["url"], hashlib.sha256(body).hexdigest()) in known:
+                continue
+            archive.add(meta["url"], body, meta.get("status", 200), meta.get("encoding"),
+                        (meta.get("headers") or {}).get("Content-Type"), meta.get("fetched_at"))
+            added += 1
+    print(f"Imported {added} cached pages")
+
+
+def _run(script, args):
+    """Run a scraper script with replay switched on."""
+    import runpy
+    os.environ[REPLAY_ENV] = "1"
+    sys.argv = [script] + list(args)
+    runpy.run_path(script, run_name="__main__")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.archive",
+                                     description="Inspect the HTML archive or replay a scraper from it.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="archive size")
+    p = sub.add_parser("list", help="archived fetches")
+    p.add_argument("pattern", nargs="?", default="", help="substring of the URL")
+    p = sub.add_parser("import-cache", help="archive every page in the HTTP cache")
+    p.add_argument("--cache-dir", default=None)
+    p = sub.add_parser("run", help="run a scraper offline against the archive")
+    p.add_argument("script")
+    p.add_argument("--as-of", default=None, help="replay pages fetched up to YYYY-MM-DD")
+    p.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.as_of:
+            os.environ[REPLAY_AS_OF_ENV] = args.as_of
+        _run(args.script, args.args)
+        return 0
+
+    archive = HtmlArchive()
+    if args.command == "stats":
+        _stats(archive)
+    elif args.command == "list":
+        _list(archive, args.pattern)
+    elif args.command == "import-cache":
+        from athlete.http_cache import DEFAULT_CACHE_DIR
+        _import_cache(archive, args.cache_dir or DEFAULT_CACHE_DIR)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
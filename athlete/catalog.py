@@ -0,0 +1,268 @@
+"""
+Catalog of every data file in the repo, keyed by what its path means.
+
+The aggregators all rebuild the same nested os.listdir loops to find their
+inputs. The catalog does that walk once and keeps, per file:
+
+    path (relative to the repo root), tree, kind, school, gender, sport,
+    season, year, table, size, mtime, sha256
+
+e.g. ``Schedule/Ripon/Women/Soccer/2019/2019_record.csv`` is tree "Schedule",
+kind "record", school "Ripon", gender "Women", sport "Soccer", season "2019",
+table "2019_record". Trees without a school level (Roster/, Coaches/,
+Performance Stats/, Awards/) are Grinnell's; Standing/ and NCAA/ are
+conference-wide (school None).
+
+It lives in ``.data_catalog.json`` at the repo root. refresh() stats every
+file but only re-hashes those whose size or mtime changed, so a refresh after
+a scrape costs one directory walk. find() answers from the index alone:
+
+    from athlete.catalog import Catalog
+    Catalog().paths(kind="record", gender="Women", sport="Soccer")
+
+    python -m athlete.catalog refresh
+    python -m athlete.catalog find --kind record --gender Women --sport Soccer
+    python -m athlete.catalog stats
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from collections import Counter, namedtuple
+
+from athlete.manifest import _FileLock
+from athlete.seasons import year_of
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CATALOG_PATH = os.path.join(REPO_ROOT, ".data_catalog.json")
+
+CATALOG_VERSION = 1
+DATA_SUFFIXES = (".csv", ".xlsx", ".xls")
+
+# Tree -> (directory levels under it, school for trees without a school level)
+LAYOUTS = {
+    "Schedule": (("school", "gender", "sport", "season"), None),
+    "Standing": (("gender", "sport"), None),
+    "Roster": (("gender", "sport"), "Grinnell"),
+    "Coaches": (("gender", "sport"), "Grinnell"),
+    "Performance Stats": (("gender", "sport", "season"), "Grinnell"),
+    "Awards": (("gender",), "Grinnell"),
+    "NCAA": (("gender",), None),
+    "Expense Data": (("school",), None),
+}
+
+KEYS = ("tree", "kind", "school", "gender", "sport", "season", "year", "table")
+Entry = namedtuple("Entry", ("path",) + KEYS + ("size", "mtime", "sha256"))
+
+
+def _kind(tree, keys, name):
+    """Table kind of a file, and fill the keys its file name carries."""
+    stem = os.path.splitext(name)[0]
+    lower = name.lower()
+    if tree == "Schedule":
+        return "record" if "record" in lower else "schedule" if "schedule" in lower else "other"
+    if tree == "Standing":
+        keys["season"] = stem
+        return "standing"
+    if tree in ("Roster", "Coaches"):
+        keys["season"] = name.split("_")[0]
+        return "roster" if tree == "Roster" else "coaches"
+    if tree == "Performance Stats":
+        return "stats"
+    if tree in ("Awards", "NCAA"):
+        keys["sport"] = stem
+        return tree.lower()
+    return "expenses"
+
+
+def parse_path(relpath):
+    """Catalog keys for a path relative to the repo root (None if not a data file)."""
+    parts = relpath.replace(os.sep, "/").split("/")
+    tree, name = parts[0], parts[-1]
+    if tree not in LAYOUTS or not name.lower().endswith(DATA_SUFFIXES):
+        return None
+    levels, school = LAYOUTS[tree]
+    dirs = parts[1:-1]
+    keys = dict.fromkeys(KEYS)
+    keys.update(tree=tree, school=school, table=os.path.splitext(name)[0])
+    if len(dirs) < len(levels):
+        # Loose files above the keyed levels (Standing/Score data.csv, stray outputs)
+        keys.update(zip(levels, dirs))
+        keys["kind"] = "scores" if tree == "Standing" else "unkeyed"
+    else:
+        keys.update(zip(levels, dirs))
+        extra = dirs[len(levels):]
+        if extra and tree in ("Awards", "NCAA"):
+            keys["kind"] = "raw"  # Awards/<Gender>/raw/, processed/ ...
+        else:
+            keys["kind"] = _kind(tree, keys, name)
+            keys["table"] = "/".join(extra + [keys["table"]])
+    keys["year"] = year_of(keys["season"]) if keys["season"] else None
+    return keys
+
+
+def file_hash(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _matches(value, wanted):
+    if wanted is None:
+        return True
+    if isinstance(wanted, (str, int)):
+        return value == wanted
+    return value in wanted
+
+
+class Catalog:
+    """The persisted file index. refresh() updates it; find()/paths() query it."""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH, root=REPO_ROOT):
+        self.path = path
+        self.root = root
+        self.files, self.refreshed_at = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION:
+                return data["files"], data.get("refreshed_at")
+        except (OSError, ValueError):
+            pass
+        return {}, None
+
+    def _walk(self, trees):
+        """(relative path, DirEntry) for every data file under ``trees``."""
+        stack = [os.path.join(self.root, t) for t in trees]
+        while stack:
+            folder = stack.pop()
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for e in entries:
+                if e.name.startswith((".", "_", "~$")):
+                    continue  # caches, lock files, Office temp files
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.lower().endswith(DATA_SUFFIXES):
+                    yield os.path.relpath(e.path, self.root).replace(os.sep, "/"), e
+
+    def refresh(self, trees=None, verbose=False):
+        """
+        Re-walk ``trees`` (default: all); hash new and changed files, drop
+        deleted ones, save. Returns counts of added/changed/removed/unchanged.
+        """
+        trees = list(trees or LAYOUTS)
+        counts = Counter()
+        seen = set()
+        for rel, entry in self._walk(trees):
+            keys = parse_path(rel)
+            if keys is None:
+                continue
+            seen.add(rel)
+            st = entry.stat()
+            old = self.files.get(rel)
+            if old and old["size"] == st.st_size and old["mtime"] == st.st_mtime_ns:
+                if any(old.get(k) != v for k, v in keys.items()):
+                    old.update(keys)  # layout rules changed; the content did not
+                counts["unchanged"] += 1
+                continue
+            counts["changed" if old else "added"] += 1
+            self.files[rel] = dict(keys, size=st.st_size, mtime=st.st_mtime_ns,
+                                   sha256=file_hash(entry.path))
+        for rel in [p for p, f in self.files.items() if f["tree"] in trees and p not in seen]:
+            del self.files[rel]
+            counts["removed"] += 1
+        self.refreshed_at = time.time()
+        self.save()
+        if verbose:
+            print(", ".join(f"{counts[k]} {k}" for k in ("added", "changed", "removed", "unchanged")))
+        return counts
+
+    def save(self):
+        with _FileLock(self.path):
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CATALOG_VERSION, "refreshed_at": self.refreshed_at,
+                           "files": self.files}, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp, self.path)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def find(self, suffix=None, **filters):
+        """
+        Entries matching every filter (a value, or a list of accepted values),
+        sorted by path: find(kind="record", gender="Women", sport="Soccer").
+        """
+        unknown = set(filters) - set(KEYS)
+        if unknown:
+            raise TypeError(f"Unknown catalog key(s): {', '.join(sorted(unknown))}")
+        found = []
+        for rel in sorted(self.files):
+            f = self.files[rel]
+            if suffix and not rel.lower().endswith(suffix.lower()):
+                continue
+            if all(_matches(f[k], v) for k, v in filters.items()):
+                found.append(Entry(rel, *(f[k] for k in KEYS), f["size"], f["mtime"], f["sha256"]))
+        return found
+
+    def paths(self, **filters):
+        """Absolute paths of the matching files."""
+        return [os.path.join(self.root, *e.path.split("/")) for e in self.find(**filters)]
+
+    def values(self, key, **filters):
+        """Distinct values of one key among the matching files, e.g. values("sport", tree="Roster")."""
+        return sorted({getattr(e, key) for e in self.find(**filters)} - {None}, key=str)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.catalog",
+                                     description="Path-derived index of the data tree.")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("refresh", help="re-walk the tree; re-hash changed files")
+    p.add_argument("--tree", action="append", choices=sorted(LAYOUTS))
+    p = sub.add_parser("find", help="list matching files")
+    for key in KEYS:
+        p.add_argument(f"--{key}", action="append", type=int if key == "year" else str)
+    p.add_argument("--long", action="store_true", help="also print size and hash")
+    sub.add_parser("stats", help="files per tree and kind")
+    args = parser.parse_args(argv)
+
+    catalog = Catalog(args.catalog)
+    if args.command == "refresh":
+        start = time.perf_counter()
+        catalog.refresh(args.tree, verbose=True)
+        print(f"{len(catalog.files)} files indexed in {time.perf_counter() - start:.2f}s")
+    elif args.command == "find":
+        filters = {k: getattr(args, k) for k in KEYS if getattr(args, k)}
+        found = catalog.find(**filters)
+        for e in found:
+            print(f"{e.size:9d}  {e.sha256[:12]}  {e.path}" if args.long else e.path)
+        print(f"{len(found)} files", file=sys.stderr)
+    else:
+        if catalog.refreshed_at is None:
+            print("Catalog is empty; run `python -m athlete.catalog refresh`.")
+            return 1
+        counts = Counter((f["tree"], f["kind"]) for f in catalog.files.values())
+        sizes = Counter()
+        for f in catalog.files.values():
+            sizes[f["tree"], f["kind"]] += f["size"]
+        for (tree, kind), n in sorted(counts.items()):
+            print(f"{tree:18} {kind:10} {n:6d} files {sizes[tree, kind] / 1e6:8.2f} MB")
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(catalog.refreshed_at))
+        print(f"{len(catalog.files)} files, refreshed {when}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
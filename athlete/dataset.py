@@ -0,0 +1,469 @@
+"""
+Partitioned Parquet dataset for scraper output, with a CSV-tree exporter.
+
+The CSV trees hold thousands of tiny files (6,358 schedule CSVs, 8,492
+Performance Stats CSVs), and every downstream job pays a file open and a
+pandas parse for each one. Here the same tables live in
+
+    Dataset/<kind>/school=<School>/gender=<Gender>/sport=<Sport>/data.parquet
+
+one file per (school, gender, sport), Hive-style so pyarrow / DuckDB /
+Power BI can read the directory as one dataset. Season is a column, and
+rows are written sorted by season, so season filters skip whole row groups.
+
+A flush does not rewrite data.parquet: it adds its tables as a new
+``part-<n>.parquet`` next to it, and a table in a newer part replaces the
+same (season, table) in older files. Once a partition has COMPACT_AFTER
+parts they are merged back into data.parquet, so a scraper that flushes
+after every season rewrites the partition once every COMPACT_AFTER flushes,
+and a reader opens at most COMPACT_AFTER files per partition. Outside
+readers (DuckDB, Power BI) do not know which part wins, so run ``compact``
+before pointing them here.
+
+Every table is stored cell by cell: season, table, row, col, value (all text,
+exactly as it would have been written to CSV; row -1 is the header). Tables of
+any shape -- schedule grids, record key/value lists, stats tables with odd
+headers, empty files -- therefore round-trip to byte-identical CSVs.
+
+    python -m athlete.dataset import schedule          # CSV tree -> dataset
+    python -m athlete.dataset export schedule --dest out/Schedule
+    python -m athlete.dataset compact schedule         # merge parts into data.parquet
+    python -m athlete.dataset info
+
+Writers: DatasetWriter (used by athlete.scheduler --sink parquet and
+Stats(XML).py). Readers: read_cells(), iter_tables(), read_table(),
+read_records(). Needs pyarrow.
+"""
+
+import io
+import os
+import csv
+import sys
+import argparse
+from collections import defaultdict
+
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATASET_ROOT = os.path.join(REPO_ROOT, "Dataset")
+
+# kind -> (CSV tree under the repo root, path levels above the table files)
+KINDS = {
+    "schedule": ("Schedule", ("school", "gender", "sport", "season")),
+    "stats": ("Performance Stats", ("gender", "sport", "season")),
+}
+# Trees without a school level are Grinnell's own pages
+DEFAULT_SCHOOL = "Grinnell"
+
+PARTITION_KEYS = ("school", "gender", "sport")
+DATA_FILE = "data.parquet"
+PART_PREFIX, PART_SUFFIX = "part-", ".parquet"
+# Rows are sorted by season, so a row group's min/max season lets season
+# filters skip it; small groups would cost more to open than they save
+ROW_GROUP_ROWS = 64 * 1024
+# Parts a partition may collect before a flush merges them into DATA_FILE
+COMPACT_AFTER = 8
+
+# A CSV file with no content at all (not even a header)
+_EMPTY = (-1, -1, None)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("athlete.dataset needs pyarrow: pip install pyarrow") from None
+    return pyarrow, pyarrow.parquet
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    return {value} if isinstance(value, str) else set(value)
+
+
+def partition_dir(kind, school, gender, sport, root=DEFAULT_DATASET_ROOT):
+    return os.path.join(root, kind, f"school={school}", f"gender={gender}", f"sport={sport}")
+
+
+def _partition_files(folder):
+    """DATA_FILE (if any), then the parts oldest first: the order tables replace each other in."""
+    parts = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(PART_PREFIX) and name.endswith(PART_SUFFIX):
+                    number = name[len(PART_PREFIX):-len(PART_SUFFIX)]
+                    if number.isdigit():
+                        parts.append((int(number), entry.path))
+    except OSError:
+        return []
+    data = os.path.join(folder, DATA_FILE)
+    return ([data] if os.path.exists(data) else []) + [path for _, path in sorted(parts)]
+
+
+def partitions(kind, root=DEFAULT_DATASET_ROOT, school=None, gender=None, sport=None):
+    """[({school, gender, sport}, folder, files), ...] of partitions with data, filtered."""
+    wanted = dict(zip(PARTITION_KEYS, map(_as_set, (school, gender, sport))))
+    found = []
+    base = os.path.join(root, kind)
+
+    def walk(path, level, keys):
+        if level == len(PARTITION_KEYS):
+            files = _partition_files(path)
+            if files:
+                found.append((dict(keys), path, files))
+            return
+        name = PARTITION_KEYS[level]
+        try:
+            entries = sorted(os.scandir(path), key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            if not entry.is_dir() or not entry.name.startswith(name + "="):
+                continue
+            value = entry.name[len(name) + 1:]
+            if wanted[name] is not None and value not in wanted[name]:
+                continue
+            walk(entry.path, level + 1, keys + [(name, value)])
+
+    walk(base, 0, [])
+    return found
+
+
+# -----------------------------------------------------------------------------
+# Writing
+# -----------------------------------------------------------------------------
+def _rows_to_cells(rows):
+    """CSV rows (first = header) -> [(row, col, value)]; header is row -1."""
+    if not rows:
+        return [_EMPTY]
+    return [(r - 1, c, value) for r, row in enumerate(rows) for c, value in enumerate(row)]
+
+
+def _schema(pa):
+    return pa.schema([("season", pa.string()), ("table", pa.string()), ("row", pa.int32()),
+                      ("col", pa.int32()), ("value", pa.string())])
+
+
+class DatasetWriter:
+    """
+    Buffer tables, then add them to their partitions on flush(). A table
+    written again for the same season replaces the stored one, like
+    overwriting the CSV would. flush() writes one part per partition it has
+    tables for, under the partition's lock, so parallel jobs can flush into
+    the same dataset.
+    """
+
+    def __init__(self, kind, root=DEFAULT_DATASET_ROOT):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown dataset kind {kind!r}; known: {', '.join(KINDS)}")
+        self.kind = kind
+        self.root = root
+        self._pending = defaultdict(dict)  # (school, gender, sport) -> {(season, table): cells}
+
+    def add_rows(self, school, gender, sport, season, table, rows):
+        """One table as CSV rows (header first); [] stands for an empty file."""
+        rows = [[("" if v is None else str(v)) for v in row] for row in rows]
+        self._pending[(school, gender, sport)][(str(season), table)] = _rows_to_cells(rows)
+
+    def add_dicts(self, school, gender, sport, season, table, dicts):
+        """Rows as write_dict_csv() would write them (header from the first dict)."""
+        if not dicts:
+            return self.add_rows(school, gender, sport, season, table, [])
+        header = list(dicts[0].keys())
+        rows = [header] + [[d.get(k, "") for k in header] for d in dicts]
+        self.add_rows(school, gender, sport, season, table, rows)
+
+    def add_frame(self, school, gender, sport, season, table, frame, index=False):
+        """A DataFrame, rendered exactly as ``frame.to_csv(index=index)`` renders it."""
+        text = frame.to_csv(index=index, lineterminator="\n")
+        self.add_rows(school, gender, sport, season, table, list(csv.reader(io.StringIO(text))))
+
+    def flush(self):
+        pa, pq = _pyarrow()
+        for (school, gender, sport), tables in self._pending.items():
+            folder = partition_dir(self.kind, school, gender, sport, self.root)
+            os.makedirs(folder, exist_ok=True)
+            with _FileLock(os.path.join(folder, DATA_FILE), timeout=120.0):
+                files = _partition_files(folder)
+                parts = [f for f in files if os.path.basename(f) != DATA_FILE]
+                number = int(os.path.basename(parts[-1])[len(PART_PREFIX):-len(PART_SUFFIX)]) + 1 if parts else 1
+                part = os.path.join(folder, f"{PART_PREFIX}{number:05d}{PART_SUFFIX}")
+                _write_file(pa, pq, part, _cells_table(pa, tables))
+                if len(parts) + 1 >= COMPACT_AFTER:
+                    _compact(pa, pq, folder)
+        self._pending.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.flush()
+
+
+def _cells_table(pa, tables):
+    """{(season, table): cells} -> Arrow table of the stored columns."""
+    cols = {"season": [], "table": [], "row": [], "col": [], "value": []}
+    for (season, table), cells in tables.items():
+        for r, c, v in cells:
+            cols["season"].append(season)
+            cols["table"].append(table)
+            cols["row"].append(r)
+            cols["col"].append(c)
+            cols["value"].append(v)
+    return pa.table(cols, schema=_schema(pa))
+
+
+def _write_file(pa, pq, path, table):
+    """Write cells sorted by season, table, row and column, in ROW_GROUP_ROWS row groups."""
+    table = table.sort_by([("season", "ascending"), ("table", "ascending"),
+                           ("row", "ascending"), ("col", "ascending")])
+    tmp = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp, row_group_size=ROW_GROUP_ROWS, compression="zstd")
+    os.replace(tmp, path)
+
+
+def _latest(pa, pq, files, filters=None):
+    """
+    Cells of ``files`` (oldest first) read as one table, keeping each
+    (season, table) only from the newest file that has it.
+    """
+    import pyarrow.compute as pc
+    if len(files) == 1:
+        return pq.read_table(files[0], filters=filters, schema=_schema(pa))   # already sorted
+    kept, seen = [], None
+    for path in reversed(files):
+        table = pq.read_table(path, filters=filters, schema=_schema(pa))
+        keys = pc.binary_join_element_wise(table["season"], table["table"], "\x1f")
+        if seen is not None:
+            keep = pc.invert(pc.is_in(keys, value_set=seen))
+            table, keys = table.filter(keep), keys.filter(keep)
+        kept.append(table)
+        unique = pc.unique(keys)
+        seen = unique if seen is None else pa.concat_arrays([seen, unique])
+    if not kept:
+        return _schema(pa).empty_table()
+    return pa.concat_tables(reversed(kept)).sort_by(
+        [("season", "ascending"), ("table", "ascending"), ("row", "ascending"), ("col", "ascending")])
+
+
+def _read_partition(pa, pq, folder, filters=None):
+    """_latest() of a partition; lists the files again if a compaction removed one meanwhile."""
+    for attempt in range(3):
+        try:
+            return _latest(pa, pq, _partition_files(folder), filters)
+        except FileNotFoundError:
+            if attempt == 2:
+                raise
+
+
+def _compact(pa, pq, folder):
+    """Merge a partition's parts into DATA_FILE. The caller holds the partition lock."""
+    files = _partition_files(folder)
+    data = os.path.join(folder, DATA_FILE)
+    if files and files != [data]:
+        _write_file(pa, pq, data, _latest(pa, pq, files))
+        for path in files:
+            if path != data:
+                os.remove(path)
+
+
+def compact(kind, root=DEFAULT_DATASET_ROOT, school=None, gender=None, sport=None):
+    """Merge every matching partition's parts into its DATA_FILE; returns the parts removed."""
+    pa, pq = _pyarrow()
+    removed = 0
+    for _, folder, files in partitions(kind, root, school, gender, sport):
+        with _FileLock(os.path.join(folder, DATA_FILE), timeout=120.0):
+            removed += len([f for f in _partition_files(folder) if os.path.basename(f) != DATA_FILE])
+            _compact(pa, pq, folder)
+    return removed
+
+
+def _cells_by_table(arrow_table):
+    cols = arrow_table.to_pydict()
+    tables = defaultdict(list)
+    for season, table, r, c, v in zip(cols["season"], cols["table"], cols["row"],
+                                      cols["col"], cols["value"]):
+        tables[(season, table)].append((r, c, v))
+    return dict(tables)
+
+
+# -----------------------------------------------------------------------------
+# Reading
+# -----------------------------------------------------------------------------
+def _read_cells(kind, root, school, gender, sport, filters):
+    """Arrow table of read_cells() columns; ``filters`` as pq.read_table() takes them."""
+    pa, pq = _pyarrow()
+    tables = []
+    for keys, folder, _ in partitions(kind, root, school, gender, sport):
+        table = _read_partition(pa, pq, folder, filters)
+        for i, name in enumerate(PARTITION_KEYS):
+            table = table.add_column(i, name, pa.array([keys[name]] * table.num_rows, pa.string()))
+        tables.append(table)
+    if not tables:
+        return pa.schema([(name, pa.string()) for name in PARTITION_KEYS] + list(_schema(pa))).empty_table()
+    return pa.concat_tables(tables)
+
+
+def read_cells(kind, root=DEFAULT_DATASET_ROOT, school=None, gender=None, sport=None,
+               season=None, table=None):
+    """
+    Long DataFrame (school, gender, sport, season, table, row, col, value) for
+    the matching partitions; season/table filters skip row groups.
+    """
+    seasons, tables = _as_set(season), _as_set(table)
+    filters = []
+    if seasons:
+        filters.append(("season", "in", sorted(seasons)))
+    if tables:
+        filters.append(("table", "in", sorted(tables)))
+    return _read_cells(kind, root, school, gender, sport, filters or None).to_pandas()
+
+
+def iter_tables(kind, root=DEFAULT_DATASET_ROOT, **filters):
+    """Yield (keys, table name, rows) -- rows as CSV rows, header first ([] = empty file)."""
+    pa, pq = _pyarrow()
+    seasons, wanted = _as_set(filters.get("season")), _as_set(filters.get("table"))
+    pq_filters = [("season", "in", sorted(seasons))] if seasons else None
+    for keys, folder, _ in partitions(kind, root, filters.get("school"), filters.get("gender"),
+                                      filters.get("sport")):
+        for (season, table), cells in sorted(_cells_by_table(_read_partition(pa, pq, folder, pq_filters)).items()):
+            if wanted and table not in wanted:
+                continue
+            yield dict(keys, season=season), table, _cells_to_rows(cells)
+
+
+def _cells_to_rows(cells):
+    if cells == [_EMPTY]:
+        return []
+    rows = defaultdict(dict)
+    for r, c, v in cells:
+        rows[r][c] = v
+    return [[row[c] for c in sorted(row)] for r, row in sorted(rows.items())]
+
+
+def read_table(kind, school, gender, sport, season, table, root=DEFAULT_DATASET_ROOT):
+    """One stored table as a DataFrame of strings (None if absent)."""
+    import pandas as pd
+    for _, _, rows in iter_tables(kind, root, school=school, gender=gender, sport=sport,
+                                  season=season, table=table):
+        if not rows:
+            return pd.DataFrame()
+        width = max(len(r) for r in rows)
+        header = rows[0] + [""] * (width - len(rows[0]))
+        return pd.DataFrame([r + [""] * (width - len(r)) for r in rows[1:]], columns=header)
+    return None
+
+
+def read_records(root=DEFAULT_DATASET_ROOT, **filters):
+    """
+    Season records from the schedule dataset, one row per (school, gender,
+    sport, season) with a column per record category (Overall, OverallPCT,
+    Conf, ConfPCT, ...).
+    """
+    import pyarrow.compute as pc
+    where = (pc.ends_with(pc.field("table"), "_record") & (pc.field("row") >= 0)
+             & (pc.field("col") <= 1))
+    seasons = _as_set(filters.get("season"))
+    if seasons:
+        where = where & pc.field("season").isin(sorted(seasons))
+    cells = _read_cells("schedule", root, filters.get("school"), filters.get("gender"),
+                        filters.get("sport"), where).to_pandas()
+    wide = cells.pivot_table(index=list(PARTITION_KEYS) + ["season", "row"], columns="col",
+                             values="value", aggfunc="first").reset_index()
+    wide = wide.rename(columns={0: "category", 1: "value"})
+    return (wide.pivot_table(index=list(PARTITION_KEYS) + ["season"], columns="category",
+                             values="value", aggfunc="first")
+                .reset_index().rename_axis(columns=None))
+
+
+# -----------------------------------------------------------------------------
+# CSV tree <-> dataset
+# -----------------------------------------------------------------------------
+def _csv_tree(kind, src=None):
+    tree, levels = KINDS[kind]
+    return src or os.path.join(REPO_ROOT, tree), levels
+
+
+def import_csv(kind, src=None, root=DEFAULT_DATASET_ROOT):
+    """Load an existing CSV tree into the dataset; returns the number of tables."""
+    src, levels = _csv_tree(kind, src)
+    writer = DatasetWriter(kind, root)
+    count = 0
+    for dirpath, _, files in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        parts = [] if rel == "." else rel.split(os.sep)
+        if len(parts) < len(levels):
+            continue
+        keys = dict(zip(levels, parts))
+        keys.setdefault("school", DEFAULT_SCHOOL)
+        subdir = "/".join(parts[len(levels):])
+        for name in sorted(files):
+            if not name.endswith(".csv"):
+                continue
+            with open(os.path.join(dirpath, name), "r", newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            table = f"{subdir}/{name[:-4]}" if subdir else name[:-4]
+            writer.add_rows(keys["school"], keys["gender"], keys["sport"], keys["season"], table, rows)
+            count += 1
+        if len(writer._pending) > 50:
+            writer.flush()
+    writer.flush()
+    compact(kind, root)
+    return count
+
+
+def export_csv(kind, dest=None, root=DEFAULT_DATASET_ROOT, **filters):
+    """Write the dataset back out as the old CSV tree; returns the number of files."""
+    dest, levels = _csv_tree(kind, dest)
+    count = 0
+    for keys, table, rows in iter_tables(kind, root, **filters):
+        folder = os.path.join(dest, *[keys[level] for level in levels])
+        path = os.path.join(folder, *table.split("/")) + ".csv"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.dataset",
+                                     description="Partitioned Parquet dataset of scraper output.")
+    parser.add_argument("--root", default=DEFAULT_DATASET_ROOT)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("import", help="load a CSV tree into the dataset")
+    p.add_argument("kind", choices=sorted(KINDS))
+    p.add_argument("--src", default=None, help="CSV tree (default: the repo's)")
+    p = sub.add_parser("export", help="write the dataset out as the old CSV tree")
+    p.add_argument("kind", choices=sorted(KINDS))
+    p.add_argument("--dest", default=None, help="target folder (default: the repo's tree)")
+    for key in PARTITION_KEYS + ("season",):
+        p.add_argument(f"--{key}", action="append")
+    p = sub.add_parser("compact", help="merge every partition's parts into its data.parquet")
+    p.add_argument("kind", choices=sorted(KINDS))
+    sub.add_parser("info", help="files and sizes per kind")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        print(f"Imported {import_csv(args.kind, args.src, args.root)} tables")
+    elif args.command == "export":
+        filters = {k: getattr(args, k) for k in PARTITION_KEYS + ("season",) if getattr(args, k)}
+        print(f"Wrote {export_csv(args.kind, args.dest, args.root, **filters)} CSV files")
+    elif args.command == "compact":
+        print(f"Merged {compact(args.kind, args.root)} parts")
+    else:
+        for kind in KINDS:
+            found = partitions(kind, args.root)
+            files = [path for _, _, paths in found for path in paths]
+            size = sum(os.path.getsize(path) for path in files)
+            print(f"{kind:10} {len(found):5d} partitions  {len(files):6d} files  {size / 1e6:7.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Shared Excel I/O: streaming xlsx output and cached workbook input.
+
+Writing. ``DataFrame.to_excel`` builds an openpyxl Cell object for every cell
+and keeps the whole sheet in memory until save. write_xlsx() uses openpyxl's
+write-only workbook instead. Rows stream to the sheet XML as they are
+appended, so memory stays flat however long the frame is. The file is written
+to a temp name, then renamed.
+
+Reading. read_excel() is ``pd.read_excel`` (openpyxl in read-only,
+values-only mode for .xlsx) behind a cache. The parsed frame is stored as
+Parquet under ``.excel_cache/``, named by the SHA-256 of the workbook bytes
+and the read arguments. An unchanged workbook is parsed once; every later
+read loads the Parquet file. A workbook saved again in Excel hashes
+differently, so a stale result is never served. Frames that Parquet cannot
+hold exactly (mixed-type columns, non-string labels) are returned uncached.
+
+    from athlete.excel import read_excel, write_xlsx
+    df = read_excel("NCAA/Men/Baseball.xlsx")
+    write_xlsx(df, "all_schools_rankings.xlsx")
+
+    python -m athlete.excel info       # cached frames and their size
+    python -m athlete.excel clear
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# ATHLETE_EXCEL_CACHE points a run (e.g. a benchmark) at a different cache folder
+DEFAULT_CACHE_DIR = os.environ.get("ATHLETE_EXCEL_CACHE") or os.path.join(REPO_ROOT, ".excel_cache")
+
+CACHE_VERSION = 1
+# Rows converted from the frame per step while streaming
+CHUNK_ROWS = 10_000
+
+
+def _openpyxl():
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("athlete.excel needs openpyxl: pip install openpyxl") from None
+    return openpyxl
+
+
+# -----------------------------------------------------------------------------
+# Writing
+# -----------------------------------------------------------------------------
+def _rows(frame):
+    """Python row tuples of ``frame``, NaN/NaT/NA as None (an empty cell)."""
+    for start in range(0, len(frame), CHUNK_ROWS):
+        block = frame.iloc[start:start + CHUNK_ROWS]
+        columns = [col.astype(object).where(col.notna(), None).tolist() for _, col in block.items()]
+        yield from zip(*columns)
+
+
+def write_xlsx(df, path, sheet_name="Sheet1", index=False, header=True):
+    """Write ``df`` to a one-sheet xlsx at ``path`` with openpyxl's write-only mode."""
+    openpyxl = _openpyxl()
+    frame = df.reset_index() if index else df
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    if header:
+        sheet.append([str(label) for label in frame.columns])
+    for row in _rows(frame):
+        sheet.append(row)
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    workbook.save(tmp)
+    os.replace(tmp, path)
+    return path
+
+
+# -----------------------------------------------------------------------------
+# Reading
+# -----------------------------------------------------------------------------
+def workbook_hash(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_path(path, cache_dir=DEFAULT_CACHE_DIR, **kwargs):
+    """Where the parsed frame of ``path`` read with ``kwargs`` is cached."""
+    args = json.dumps(kwargs, sort_keys=True, default=repr)
+    key = hashlib.sha256(f"{CACHE_VERSION}\0{workbook_hash(path)}\0{args}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, key[:2], f"{key}.parquet")
+
+
+def _store(df, target):
+    """Cache ``df`` at ``target`` if it round-trips through Parquet unchanged."""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp)
+        if pd.read_parquet(tmp).equals(df):
+            os.replace(tmp, target)
+            return True
+    except (ImportError, ValueError, TypeError, NotImplementedError):
+        pass  # pyarrow missing, or a column it cannot hold as is
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    return False
+
+
+def read_excel(path, cache_dir=DEFAULT_CACHE_DIR, **kwargs):
+    """
+    ``pd.read_excel(path, **kwargs)``, parsed once per workbook content.
+    ``cache_dir=None`` skips the cache. Reads that return several sheets
+    (``sheet_name=None`` or a list) are not cached.
+    """
+    path = os.fspath(path)
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        kwargs.setdefault("engine", "openpyxl")  # read-only, values-only workbook
+    target = cache_path(path, cache_dir, **kwargs) if cache_dir else None
+    if target and os.path.exists(target):
+        try:
+            return pd.read_parquet(target)
+        except (OSError, ValueError):
+            pass  # half-written or corrupt entry: parse again
+    df = pd.read_excel(path, **kwargs)
+    if target and isinstance(df, pd.DataFrame):
+        _store(df, target)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.excel",
+                                     description="Cache of parsed Excel workbooks.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="number and size of cached frames")
+    sub.add_parser("clear", help="delete every cached frame")
+    args = parser.parse_args(argv)
+
+    entries = []
+    for dirpath, _, names in os.walk(args.cache_dir):
+        entries.extend(os.path.join(dirpath, n) for n in names if n.endswith(".parquet"))
+    if args.command == "clear":
+        for entry in entries:
+            os.remove(entry)
+        print(f"Removed {len(entries)} cached frame(s)")
+    else:
+        size = sum(os.path.getsize(e) for e in entries)
+        print(f"{len(entries)} cached frame(s), {size / 1e6:.2f} MB in {args.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+EADA expense sheets: the wide-to-long step.
+
+An EADA "Expenses_All_Sports" sheet has one row per (institution, survey
+year) and a "<Sport> Men's|Women's Team Expenses" column per team; the
+matching "Operating_Expenses" sheet has "<Sport> ... Team Operating
+Expenses" columns. extract_tidy() turns a pair into one row per (sheet row,
+team column). Expense Data/Combined_Data.py and the warehouse ingest
+(athlete.warehouse) both use it, so their rows cannot drift apart.
+
+    from athlete.expenses import extract_tidy
+    tidy = extract_tidy(df_total, df_oper)   # Year, School, Gender, Sport, Total/Operating Expense, Undergrads
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+COL_TOTAL_RE = re.compile(r"(.+?) (Men's|Women's) Team Expenses$", re.I)
+
+TIDY_COLUMNS = ["Year", "School", "Gender", "Sport", "Total Expense", "Operating Expense", "Undergrads"]
+
+
+def column_map(df_total, df_oper):
+    """(total column, matching operating column or None, sport, gender) for every team-expense column."""
+    cols = []
+    for col in df_total.columns:
+        m = COL_TOTAL_RE.match(col)
+        if not m:
+            continue
+        sport = m.group(1).strip()
+        gender_poss = m.group(2)
+        gender = "Men" if gender_poss.lower().startswith("men") else "Women"
+        oper_col = f"{sport} {gender_poss} Team Operating Expenses"
+        cols.append((col, oper_col if oper_col in df_oper.columns else None, sport, gender))
+    return cols
+
+
+def extract_tidy(df_total, df_oper, extra=()):
+    """
+    Turn the *wide* total/operating sheets into long tidy rows (TIDY_COLUMNS),
+    in sheet order; rows missing an expense or the undergrad count are
+    dropped. ``extra``: sheet columns (e.g. "UNITID") repeated onto each row
+    after those.
+    """
+    # locate undergrad columns
+    ug_m_col = next((c for c in df_total.columns if re.search(r"Male Undergraduates", c, re.I)), None)
+    ug_f_col = next((c for c in df_total.columns if re.search(r"Female Undergraduates", c, re.I)), None)
+    if not ug_m_col or not ug_f_col:
+        raise RuntimeError("could not detect undergrad columns")
+
+    cols = column_map(df_total, df_oper)
+    # skip rows missing school or year
+    rows = df_total.dropna(subset=["Survey Year", "Institution Name"])
+    n, k = len(rows), len(cols)
+    if not n or not k:
+        raise RuntimeError("no team expense rows found")
+
+    # operating expenses aligned to the total rows by (UNITID, Survey Year)
+    keys = ["UNITID", "Survey Year"]
+    oper_cols = [c for _, c, _, _ in cols if c]
+    oper = None
+    if oper_cols and all(c in df_oper.columns and c in df_total.columns for c in keys):
+        lookup = df_oper.drop_duplicates(keys).set_index(keys)[oper_cols]
+        oper = lookup.reindex(pd.MultiIndex.from_frame(rows[keys]))
+    missing = np.full(n, np.nan)
+    oper_vals = np.column_stack([oper[c].to_numpy() if c and oper is not None else missing
+                                 for _, c, _, _ in cols])
+
+    # one output row per (sheet row, column), in sheet order
+    men = np.tile([g == "Men" for _, _, _, g in cols], n)
+    df = pd.DataFrame({
+        "Year": np.repeat(rows["Survey Year"].astype(int).to_numpy(), k),
+        "School": np.repeat(rows["Institution Name"].to_numpy(), k),
+        "Gender": np.tile([g for _, _, _, g in cols], n),
+        "Sport": np.tile([s for _, _, s, _ in cols], n),
+        "Total Expense": rows[[c for c, _, _, _ in cols]].to_numpy().ravel(),
+        "Operating Expense": oper_vals.ravel(),
+        "Undergrads": np.where(men, np.repeat(rows[ug_m_col].to_numpy(), k),
+                               np.repeat(rows[ug_f_col].to_numpy(), k)),
+    })
+    for name in extra:
+        df[name] = np.repeat(rows[name].to_numpy(), k)
+    # drop any rows missing key fields
+    df.dropna(subset=["Total Expense", "Operating Expense", "Undergrads"], inplace=True)
+    return df
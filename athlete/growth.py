@@ -0,0 +1,97 @@
+"""
+Growth and change of a yearly metric per series, vectorized.
+
+A series is one combination of the ``by`` keys, e.g. (School, Sport, Gender)
+for expenses, (School, Sport) for win percentage or roster size. growth()
+sorts the rows once by (series, year) and computes, per row:
+
+  Index         value / the series' value in its own first year (1.0 there)
+  Change        change from the series' previous row, (value - previous) /
+                previous, however many years apart; NaN in the series' first
+                year (what x.diff() / x.shift(1) gives per group)
+  YoY           change from the previous year; across a gap of k years the
+                annualized change (value / previous) ** (1 / k) - 1; 0.0 in
+                the series' first year
+  CAGR          annual growth rate since the series' first year
+                (NaN in the first year itself)
+  Rolling Mean  mean of the values in the trailing ``window`` calendar years
+                (missing years and NaN values are skipped)
+
+All of it is whole-array NumPy work on the sorted rows, with no Python call
+per group. Rows with a missing key or year get NaN everywhere. A series is
+expected to have one row per year.
+
+    from athlete.growth import growth
+    g = growth(df, "Expense", by=["School", "Sport", "Gender"])
+    df["Accumulative Growth"] = g["Index"]
+    df["Yearly Change"] = g["Change"]
+"""
+
+import numpy as np
+import pandas as pd
+
+METRICS = ("Index", "Change", "YoY", "CAGR", "Rolling Mean")
+
+
+def _shift(a, k, fill):
+    out = np.empty_like(a)
+    out[:k] = fill
+    out[k:] = a[:len(a) - k]
+    return out
+
+
+def growth(df, value, by, time="Year", window=3, metrics=METRICS):
+    """
+    ``metrics`` (any of METRICS) of ``df[value]`` per ``by`` series, as a
+    frame aligned to ``df.index``.
+    """
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metric(s) {sorted(unknown)}; known: {', '.join(METRICS)}")
+    codes = df.groupby(list(by), sort=False).ngroup().fillna(-1).to_numpy(dtype=np.int64, copy=True)
+    years = df[time].to_numpy(dtype=float)
+    codes[np.isnan(years)] = -1
+    order = np.lexsort((years, codes))
+    code, year = codes[order], years[order]
+    values = df[value].to_numpy(dtype=float)[order]
+    n = len(code)
+
+    first = np.ones(n, dtype=bool)            # first row of each series
+    first[1:] = code[1:] != code[:-1]
+    start = np.maximum.accumulate(np.where(first, np.arange(n), 0))
+    prev_value, prev_year = _shift(values, 1, np.nan), _shift(year, 1, np.nan)
+
+    out = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        index = values / values[start]
+        if "Index" in metrics:
+            out["Index"] = index
+        if "Change" in metrics:
+            change = (values - prev_value) / prev_value
+            change[first] = np.nan
+            out["Change"] = change
+        if "YoY" in metrics:
+            gap = year - prev_year
+            yoy = np.where(gap == 1, (values - prev_value) / prev_value,
+                           (values / prev_value) ** (1 / gap) - 1)
+            yoy[gap == 0] = np.nan            # duplicate year
+            yoy[first] = 0.0
+            out["YoY"] = yoy
+        if "CAGR" in metrics:
+            span = year - year[start]
+            out["CAGR"] = np.where(first, np.nan, index ** (1 / span) - 1)
+        if "Rolling Mean" in metrics:
+            total, count = np.zeros(n), np.zeros(n)
+            for lag in range(window):         # one row per year: lags past the window cannot qualify
+                lag_value = _shift(values, lag, np.nan)
+                inside = ((_shift(code, lag, -2) == code) & (year - _shift(year, lag, np.nan) < window)
+                          & ~np.isnan(lag_value))
+                total += np.where(inside, lag_value, 0.0)
+                count += inside
+            out["Rolling Mean"] = total / count
+
+    result = np.full((n, len(out)), np.nan)
+    if out:
+        result[order] = np.column_stack(list(out.values()))
+    result[codes < 0] = np.nan
+    return pd.DataFrame(result, index=df.index, columns=list(out))
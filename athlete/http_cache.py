@@ -0,0 +1,199 @@
+"""
+On-disk HTTP response cache with conditional revalidation.
+
+Bodies are stored under ``.http_cache/`` (one ``.body`` + one ``.json`` file
+per URL, named by the SHA-256 of the URL). Each URL gets a time-to-live:
+
+  * past seasons (a year in the URL older than the current season) never
+    expire -- 2011-2023 schedules do not change;
+  * the current season, and pages without a season, expire after a few hours;
+  * TTL_RULES can override either for specific URL patterns.
+
+An expired entry is not thrown away: the next request sends
+If-None-Match / If-Modified-Since, and a 304 reply re-uses the stored body,
+so a nightly refresh only downloads pages that actually changed.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import datetime
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+HOUR = 60 * 60
+
+# TTL (seconds) for the current season and for season-less pages
+CURRENT_SEASON_TTL = 6 * HOUR
+DEFAULT_TTL = 6 * HOUR
+
+# (pattern, ttl) checked in order; the first match wins. ttl=None => never expires.
+TTL_RULES = [
+    # Conference GEN_ articles (season history, all-sports standings) are edited in place
+    (re.compile(r"midwestconference\.org/sports/\d{4}/\d+/\d+/GEN_", re.I), DEFAULT_TTL),
+    # Old Sidearm article pages (e.g. .../sports/2012/4/14/WGOLF_....aspx) are frozen
+    (re.compile(r"/sports/\d{4}/\d+/\d+/\w+\.aspx", re.I), None),
+]
+
+# Season key inside a URL: 2019, 2019-20, 2019-2020 (not part of a longer number)
+SEASON_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})(?:-\d{2,4})?(?!\d)")
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".http_cache"
+)
+
+
+def current_season_year(today=None):
+    """Academic-year start: Oct 2025 and Mar 2026 are both season 2025."""
+    today = today or datetime.date.today()
+    return today.year if today.month >= 7 else today.year - 1
+
+
+def ttl_for(url, rules=TTL_RULES, today=None):
+    """Seconds an entry for ``url`` stays fresh, or None if it never expires."""
+    for pattern, ttl in rules:
+        if pattern.search(url):
+            return ttl
+
+    years = [int(y) for y in SEASON_RE.findall(url)]
+    if not years:
+        return DEFAULT_TTL
+    if max(years) < current_season_year(today):
+        return None
+    return CURRENT_SEASON_TTL
+
+
+class HttpCache:
+    """
+    Drop-in for ``requests.get`` that serves fresh entries from disk and
+    revalidates stale ones. Safe to share between threads.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, rules=TTL_RULES):
+        self.cache_dir = cache_dir
+        self.rules = rules
+        self.stats = {"hits": 0, "revalidated": 0, "downloaded": 0, "bytes": 0}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        folder = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(folder, key + ".json"), os.path.join(folder, key + ".body")
+
+    def load(self, url):
+        """Return (meta, body) for a cached URL, or (None, None)."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write_meta(self, meta_path, meta):
+        tmp = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, meta_path)
+
+    def store(self, url, resp):
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        tmp = f"{body_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(resp.content)
+        os.replace(tmp, body_path)
+
+        self._write_meta(meta_path, {
+            "url": url,
+            "status": resp.status_code,
+            "encoding": resp.encoding,
+            "headers": {
+                k: v for k, v in resp.headers.items()
+                if k.lower() in ("content-type", "etag", "last-modified")
+            },
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        })
+
+    def touch(self, url, meta):
+        """Mark a revalidated (304) entry as fresh again."""
+        meta_path, _ = self._paths(url)
+        meta = dict(meta, fetched_at=time.time())
+        self._write_meta(meta_path, meta)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def is_fresh(self, url, meta, now=None):
+        ttl = ttl_for(url, self.rules)
+        if ttl is None:
+            return True
+        return (now or time.time()) - meta.get("fetched_at", 0) < ttl
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def get(self, url, fetch=None, **kwargs):
+        """
+        GET ``url`` through the cache. ``fetch`` defaults to requests.get;
+        extra keyword arguments (headers, cookies, timeout...) are passed on.
+        Returns a requests.Response; cached ones have ``from_cache = True``.
+        """
+        fetch = fetch or requests.get
+        meta, body = self.load(url)
+        if meta is not None and self.is_fresh(url, meta):
+            self._count("hits")
+            return cached_response(url, meta, body)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp = fetch(url, headers=headers, **kwargs)
+
+        if resp.status_code == 304 and meta is not None:
+            self.touch(url, meta)
+            self._count("revalidated")
+            return cached_response(url, meta, body)
+
+        self._count("downloaded")
+        self._count("bytes", len(resp.content))
+        if resp.status_code == 200:
+            self.store(url, resp)
+        resp.from_cache = False
+        return resp
+
+    def summary(self):
+        s = self.stats
+        return (f"cache: {s['hits']} fresh hits, {s['revalidated']} revalidated (304), "
+                f"{s['downloaded']} downloaded ({s['bytes'] / 1e6:.1f} MB)")
+
+
+def cached_response(url, meta, body):
+    """Rebuild a requests.Response from a stored entry."""
+    resp = requests.Response()
+    resp.status_code = meta.get("status", 200)
+    resp.reason = "OK"
+    resp.url = url
+    resp._content = body
+    resp.encoding = meta.get("encoding")
+    resp.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    resp.from_cache = True
+    return resp
@@ -0,0 +1,208 @@
+"""
+One HTTP client for every scraper.
+
+    from athlete.http_client import HttpClient
+    client = HttpClient()                 # on-disk cache on by default
+    resp = client.get(url)                # pooled, retried, timed out
+    print(client.summary())
+
+* A single ``requests.Session`` keeps connections alive, with one pool per
+  host (``pool_size`` connections each) -- re-using the TCP/TLS connection is
+  most of the win when fetching 20 seasons from the same site.
+* Idempotent GETs are retried on connection errors, timeouts and
+  429/500/502/503/504 with jittered exponential backoff ("full jitter"),
+  honouring Retry-After when the server sends one.
+* Every request gets a (connect, read) timeout.
+* Responses are kept in the on-disk cache (athlete.http_cache): past seasons
+  are served from it without a request, the current season and season-less
+  pages are revalidated with ETag / Last-Modified once they expire.
+* Every network request first takes a token from its domain's shared rate
+  limit (athlete.rate_limit); 429/503 responses slow that domain down for all
+  processes.
+* Every downloaded page is kept in the compressed HTML archive
+  (athlete.archive); with ATHLETE_REPLAY=1 pages come from there instead of
+  the network.
+* With ATHLETE_STANDIN=http://127.0.0.1:<port> every request goes to the
+  local stand-in server instead (benchmarks/standin_server.py), with the
+  cache, archive and rate limit off.
+* Requests, bytes, retries, failures, time throttled and time fetching are
+  counted per run.
+"""
+
+import os
+import time
+import random
+import threading
+import email.utils
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from athlete.archive import HtmlArchive, replay_enabled, replay_as_of
+from athlete.http_cache import HttpCache
+from athlete.rate_limit import RateLimiter
+
+# The browser User-Agent the schedule scripts sent (Code/Schedule/schedule.py,
+# Conf_standing.py, ...). Scripts that sent a different one still pass it in
+# ``headers``, so no site sees a new User-Agent.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/87.0.4280.66 Safari/537.36"
+)
+
+DEFAULT_TIMEOUT = (10, 30)          # (connect, read) seconds
+DEFAULT_RETRIES = 4                 # attempts after the first one
+DEFAULT_BACKOFF = 0.5               # base delay in seconds
+MAX_BACKOFF = 30.0
+DEFAULT_POOL_SIZE = 8               # keep-alive connections per host
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Base URL of a local stand-in server that answers for every site
+STANDIN_ENV = "ATHLETE_STANDIN"
+
+
+def standin_url(url, standin):
+    """https://host/path?query -> <standin>/host/path?query"""
+    parts = urlsplit(url)
+    target = f"{standin.rstrip('/')}/{parts.netloc}{parts.path or '/'}"
+    return f"{target}?{parts.query}" if parts.query else target
+
+
+def retry_after_seconds(resp):
+    """Parse a Retry-After header (seconds or HTTP date); None if absent/invalid."""
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    """Pooled requests.Session with retries, timeouts and per-run counters."""
+
+    def __init__(self, headers=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF,
+                 pool_size=DEFAULT_POOL_SIZE, cache=True, rate_limit=True,
+                 archive=True, replay=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        if headers:
+            self.session.headers.update(headers)
+
+        self.standin = os.environ.get(STANDIN_ENV) or None
+        if self.standin:
+            # Nothing from a stand-in server is worth caching, archiving or throttling
+            cache = None if cache is True else cache
+            rate_limit = None if rate_limit is True else rate_limit
+            archive = None if archive is True else archive
+
+        # cache=True => default on-disk cache; pass an HttpCache or None/False
+        self.cache = HttpCache() if cache is True else (cache or None)
+        # rate_limit=True => shared per-domain buckets; pass a RateLimiter or None/False
+        self.limiter = RateLimiter() if rate_limit is True else (rate_limit or None)
+        # archive=True => default HTML archive; replay=None => follow ATHLETE_REPLAY
+        self.archive = HtmlArchive() if archive is True else (archive or None)
+        self.replay = replay_enabled() if replay is None else replay
+        self.replay_as_of = replay_as_of()
+        if self.replay and self.archive is None:
+            self.archive = HtmlArchive()
+
+        self.stats = {"requests": 0, "bytes": 0, "retries": 0, "failures": 0,
+                      "throttled": 0.0, "fetch_time": 0.0}
+        self._lock = threading.Lock()
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def backoff_delay(self, attempt, resp=None):
+        """Full-jitter exponential backoff, or the server's Retry-After if longer."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        retry_after = retry_after_seconds(resp)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff * 4))
+        return delay
+
+    def fetch(self, url, **kwargs):
+        """GET over the network (no cache), retrying transient failures."""
+        if self.replay:
+            return self.archive.response(url, self.replay_as_of)
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self._count("throttled", self.limiter.acquire(url))
+            self._count("requests")
+            start = time.perf_counter()
+            try:
+                if self.standin:
+                    resp = self.session.get(standin_url(url, self.standin), **kwargs)
+                    resp.url = url
+                else:
+                    resp = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._count("fetch_time", time.perf_counter() - start)
+                if attempt >= self.retries:
+                    self._count("failures")
+                    raise
+                resp = None
+            else:
+                self._count("bytes", len(resp.content))
+                self._count("fetch_time", time.perf_counter() - start)
+                if self.limiter is not None:
+                    self.limiter.feedback(url, resp.status_code, retry_after_seconds(resp))
+                if resp.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    if resp.status_code >= 400:
+                        self._count("failures")
+                    elif self.archive is not None:
+                        self.archive.record(url, resp)
+                    return resp
+
+            self._count("retries")
+            time.sleep(self.backoff_delay(attempt, resp))
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        """GET through the cache (if enabled). Same keyword arguments as requests.get."""
+        if self.cache is not None and not self.replay:
+            return self.cache.get(url, fetch=self.fetch, **kwargs)
+        return self.fetch(url, **kwargs)
+
+    def get_ok(self, url, **kwargs):
+        """get() followed by raise_for_status(); handy as an aio.fetch_all callable."""
+        resp = self.get(url, **kwargs)
+        resp.raise_for_status()
+        return resp
+
+    def summary(self):
+        s = self.stats
+        line = (f"http: {s['requests']} requests, {s['retries']} retries, "
+                f"{s['failures']} failed, {s['bytes'] / 1e6:.1f} MB")
+        if self.limiter is not None and not self.replay:
+            line += (f"\nrate limit: {s['throttled']:.1f}s throttled vs "
+                     f"{s['fetch_time']:.1f}s fetching")
+        if self.cache is not None and not self.replay:
+            line += "\n" + self.cache.summary()
+        if self.archive is not None:
+            line += "\n" + self.archive.summary()
+        return line
+
+    def close(self):
+        self.session.close()
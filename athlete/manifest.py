@@ -0,0 +1,192 @@
+"""
+Season manifest for incremental scraping.
+
+Records which (school, sport, page type, season) units have been scraped and
+whether they are *final* (a past season whose page will not change). A
+refresh then only fetches seasons that are
+
+  * new (never scraped),
+  * still in progress (scraped, but the current season),
+  * marked stale by hand, or
+  * missing one of the output files recorded for them.
+
+The manifest is a single JSON file (``scrape_manifest.json`` at the repo root)
+so it can be inspected and committed next to the data.
+
+    python -m athlete.manifest list --sport baseball
+    python -m athlete.manifest stale --school pioneers.grinnell.edu --season 2023
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from urllib.parse import urlsplit
+
+from athlete.http_cache import current_season_year
+
+# ATHLETE_MANIFEST points a run (e.g. a benchmark) at a different manifest file
+DEFAULT_MANIFEST_PATH = os.environ.get("ATHLETE_MANIFEST") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scrape_manifest.json"
+)
+
+FIELDS = ("school", "sport", "page_type", "season")
+
+_YEAR_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+
+
+def school_key(base_url):
+    """Schools are keyed by the host of their athletics site."""
+    return urlsplit(base_url).netloc or base_url
+
+
+def is_final_season(season, today=None):
+    """A season is final once its start year is before the current season."""
+    m = _YEAR_RE.search(str(season))
+    if not m:
+        return False
+    return int(m.group(1)) < current_season_year(today)
+
+
+class _FileLock:
+    """Tiny cross-platform lock file so parallel jobs don't lose updates."""
+
+    def __init__(self, path, timeout=30.0, stale_after=120.0, poll=0.05):
+        self.path = path + ".lock"
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll = poll
+
+    def __enter__(self):
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)  # left behind by a crashed run
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Could not lock {self.path}")
+                time.sleep(self.poll)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class SeasonManifest:
+    """Load/query/update the manifest. Call save() after marking units done."""
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.entries = self._read()
+        self._dirty = set()
+
+    @staticmethod
+    def key(school, sport, page_type, season):
+        return "|".join([school, sport, page_type, str(season)])
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def needs_fetch(self, school, sport, page_type, season):
+        entry = self.entries.get(self.key(school, sport, page_type, season))
+        if entry is None or entry.get("stale") or not entry.get("final"):
+            return True
+        return not all(os.path.exists(p) for p in entry.get("outputs", []))
+
+    def pending(self, school, sport, page_type, seasons):
+        """Subset of ``seasons`` (order kept) that has to be fetched again."""
+        return [s for s in seasons if self.needs_fetch(school, sport, page_type, s)]
+
+    def find(self, **filters):
+        """Entries whose fields equal every given filter (school=..., season=...)."""
+        out = []
+        for entry in self.entries.values():
+            if all(str(entry.get(k)) == str(v) for k, v in filters.items() if v is not None):
+                out.append(entry)
+        return out
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def mark_done(self, school, sport, page_type, season, outputs=(), final=None):
+        """Record a successfully scraped unit; ``final`` defaults to is_final_season()."""
+        key = self.key(school, sport, page_type, season)
+        self.entries[key] = {
+            "school": school,
+            "sport": sport,
+            "page_type": page_type,
+            "season": str(season),
+            "final": is_final_season(season) if final is None else bool(final),
+            "stale": False,
+            "outputs": [os.path.abspath(p) for p in outputs],
+            "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self._dirty.add(key)
+
+    def mark_stale(self, **filters):
+        """Flag matching entries for re-scraping. Returns how many were marked."""
+        n = 0
+        for key, entry in self.entries.items():
+            if all(str(entry.get(k)) == str(v) for k, v in filters.items() if v is not None):
+                entry["stale"] = True
+                self._dirty.add(key)
+                n += 1
+        return n
+
+    def save(self):
+        """Merge our changes into the file on disk (other jobs may have written it)."""
+        if not self._dirty:
+            return
+        with _FileLock(self.path):
+            merged = self._read()
+            for key in self._dirty:
+                merged[key] = self.entries[key]
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        self.entries = merged
+        self._dirty.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the scrape manifest.")
+    parser.add_argument("command", choices=["list", "stale"])
+    for field in FIELDS:
+        parser.add_argument("--" + field.replace("_", "-"), dest=field)
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    manifest = SeasonManifest(args.manifest)
+    filters = {f: getattr(args, f) for f in FIELDS}
+    if args.command == "stale":
+        n = manifest.mark_stale(**filters)
+        manifest.save()
+        print(f"Marked {n} unit(s) stale.")
+    else:
+        for e in sorted(manifest.find(**filters), key=lambda e: [e[f] for f in FIELDS]):
+            state = "stale" if e["stale"] else ("final" if e["final"] else "in progress")
+            print(f"{e['school']:28} {e['sport']:20} {e['page_type']:9} {e['season']:8} {state}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""
+Canonical school and sport names.
+
+Every vocabulary below is a Resolver: a table of known variants -> canonical
+name. A name is normalized first: Unicode NFKC, curly quotes, case,
+apostrophes, "&" as "and", and any other punctuation as a space. The
+normalized form is then matched in three steps:
+
+  1. exactly, against the normalized variants;
+  2. as an abbreviation: same word count, each word a prefix of the
+     variant's word ("Lawrence Univ", "Cornell Coll");
+  3. fuzzily (difflib ratio), only when the best canonical name scores at or
+     above ``cutoff`` and clearly ahead of the runner-up. Schools are compared
+     without words like "College" that every school shares, so
+     "Coe College" stays unmatched instead of becoming Cornell, and only
+     against variants naming the same kind of institution: "Cornell
+     University" is not Cornell College, and a bare "Illinois" is not
+     Illinois College (which no variant calls just "Illinois").
+
+Names that match nothing resolve to None and standardize() leaves them as
+they were. Each distinct string is resolved once: standardize() works on the
+column's unique values and maps the answers back by code, so a million rows
+cost the same as their few hundred distinct names. Answers are also kept in
+``.names_memo.json`` at the repo root, per vocabulary; editing a vocabulary
+invalidates its section.
+
+    from athlete.names import SCHOOLS, SPORTS
+    df["School_std"] = SCHOOLS.standardize(df["School"])
+    SCHOOLS.resolve("Illinois Col")          # 'Illinois College'
+    SCHOOLS.resolve("Monmouth IL")           # 'Monmouth College' (fuzzy)
+    # no match: another school, or another kind of institution
+    SCHOOLS.resolve("Coe College")           # None
+    SCHOOLS.resolve("Cornell University")    # None
+    SCHOOLS.resolve("Monmouth University")   # None
+    SCHOOLS.resolve("Carroll College")       # None
+    SCHOOLS.resolve("Illinois")              # None
+
+    python -m athlete.names resolve schools "Illinois Col" "Macalester College" "Cornell University"
+    python -m athlete.names info
+    python -m athlete.names clear
+"""
+
+import os
+import re
+import sys
+import json
+import difflib
+import hashlib
+import argparse
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# ATHLETE_NAMES_MEMO points a run at a different memo file
+DEFAULT_MEMO_PATH = os.environ.get("ATHLETE_NAMES_MEMO") or os.path.join(REPO_ROOT, ".names_memo.json")
+
+MEMO_VERSION = 1
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "ʼ": "'", "“": '"', "”": '"'})
+
+
+def normalize(name):
+    """Comparison form of a name: "St. Norbert’s  Col." -> "st norberts col"."""
+    text = unicodedata.normalize("NFKC", str(name)).translate(_QUOTES).casefold()
+    text = text.replace("&", " and ").replace("'", "")
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+
+class Resolver:
+    """
+    Maps name variants to canonical names. ``aliases`` is {variant: canonical};
+    every canonical name is also a variant of itself. ``generic`` words are
+    left out of the fuzzy comparison. ``types`` maps words that name a kind of
+    institution to that kind ({"univ": "university", ...}); the fuzzy step
+    only compares names of the same kind, none counting as a kind of its own.
+    ``cutoff=None`` turns off the abbreviation and fuzzy steps (e.g. for
+    short codes).
+    """
+
+    def __init__(self, kind, aliases, cutoff=0.85, generic=(), types=None, margin=0.05,
+                 memo_path=DEFAULT_MEMO_PATH):
+        self.kind = kind
+        self.cutoff = cutoff
+        self.margin = margin
+        self.generic = frozenset(generic)
+        self.types = dict(types or {})
+        self.memo_path = memo_path
+        self.canonical = sorted(set(aliases.values()))
+        self.keys = {}
+        for variant, canonical in list(aliases.items()) + [(c, c) for c in self.canonical]:
+            key = normalize(variant)
+            if self.keys.setdefault(key, canonical) != canonical:
+                raise ValueError(f"{kind}: {variant!r} is both {self.keys[key]!r} and {canonical!r}")
+        self.vocab_hash = hashlib.sha256(json.dumps(
+            [MEMO_VERSION, sorted(self.keys.items()), cutoff, margin, sorted(self.generic),
+             sorted(self.types.items())]
+        ).encode("utf-8")).hexdigest()
+        self._words = [(key.split(), canonical) for key, canonical in self.keys.items()]
+        self._stems = {}       # institution kind -> {stem: canonical}
+        for key, canonical in self.keys.items():
+            self._stems.setdefault(self._type(key), {}).setdefault(self._stem(key), canonical)
+        self._memo = None      # name -> canonical or None, loaded on first use
+        self._new = {}         # resolved in this process, not saved yet
+
+    def _stem(self, key):
+        return " ".join(w for w in key.split() if w not in self.generic) or key
+
+    def _type(self, key):
+        return tuple(sorted({self.types[w] for w in key.split() if w in self.types}))
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+    def match(self, key):
+        """Canonical name for a normalized ``key``, or None."""
+        if key in self.keys:
+            return self.keys[key]
+        if self.cutoff is None or not key:
+            return None
+        words = key.split()
+        found = {canonical for variant, canonical in self._words
+                 if len(variant) == len(words) and all(v.startswith(w) for w, v in zip(words, variant))}
+        if len(found) == 1:
+            return found.pop()
+        stem = self._stem(key)
+        best = {}
+        for candidate, canonical in self._stems.get(self._type(key), {}).items():
+            score = difflib.SequenceMatcher(None, stem, candidate).ratio()
+            best[canonical] = max(score, best.get(canonical, 0.0))
+        if not best:
+            return None
+        ranked = sorted(best.values(), reverse=True) + [0.0]
+        top = max(best, key=best.get)
+        if ranked[0] >= self.cutoff and ranked[0] - ranked[1] >= self.margin:
+            return top
+        return None
+
+    def resolve(self, name):
+        """Canonical name for ``name`` (None if nothing matches); memoized."""
+        if self._memo is None:
+            self._memo = self._read().get("names", {})
+        name = str(name)
+        if name in self._memo:
+            return self._memo[name]
+        result = self._memo[name] = self._new[name] = self.match(normalize(name))
+        return result
+
+    def standardize(self, values):
+        """
+        Series of canonical names for ``values``, resolving each distinct value
+        once; values that match nothing (and missing values) are kept as is.
+        """
+        values = pd.Series(values)
+        codes, uniques = pd.factorize(values.astype(str).str.strip())
+        mapped = np.array([self.resolve(u) for u in uniques] + [None], dtype=object)
+        self.save()
+        return pd.Series(mapped[codes], index=values.index).fillna(values)
+
+    # ------------------------------------------------------------------
+    # Persistent memo
+    # ------------------------------------------------------------------
+    def _read_all(self):
+        try:
+            with open(self.memo_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MEMO_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": MEMO_VERSION, "vocabularies": {}}
+
+    def _read(self):
+        section = self._read_all()["vocabularies"].get(self.kind, {})
+        return section if section.get("vocab") == self.vocab_hash else {}
+
+    def save(self):
+        """Add the names resolved since the last save to the memo file."""
+        if not self._new or not self.memo_path:
+            return
+        with _FileLock(self.memo_path):
+            data = self._read_all()   # merge with what other processes saved
+            section = data["vocabularies"].get(self.kind, {})
+            if section.get("vocab") != self.vocab_hash:
+                section = {"vocab": self.vocab_hash, "names": {}}
+            section["names"].update(self._new)
+            data["vocabularies"][self.kind] = section
+            tmp = f"{self.memo_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True))
+            os.replace(tmp, self.memo_path)
+        self._new = {}
+
+
+# -----------------------------------------------------------------------------
+# Vocabularies
+# -----------------------------------------------------------------------------
+SCHOOLS = Resolver("schools", {
+    "Beloit": "Beloit College",
+    "Carroll": "Carroll University",
+    "Cornell": "Cornell College",
+    "Grinnell": "Grinnell College",
+    "Illinois C.": "Illinois College",
+    "Illinois Col.": "Illinois College",
+    "Knox": "Knox College",
+    "Know": "Knox College",                       # typo
+    "Lake Forest": "Lake Forest College",
+    "Lawrence": "Lawrence University",
+    "Lawerence": "Lawrence University",           # typo
+    "Monmouth": "Monmouth College",
+    "Ripon": "Ripon College",
+    "St. Norbert": "St. Norbert College",
+    "Saint Norbert College": "St. Norbert College",
+    "University of Chicago": "University of Chicago",
+}, cutoff=0.8, generic=("college", "university", "univ", "col", "coll", "c", "u", "of", "the"),
+   types={"college": "college", "col": "college", "coll": "college", "c": "college",
+          "university": "university", "univ": "university", "u": "university"})
+
+# Sport names used from Final/ on
+SPORTS = Resolver("sports", {
+    "Baseball": "Baseball",
+    "Softball": "Softball",
+    "Basketball": "Basketball",
+    "Football": "Football",
+    "Golf": "Golf",
+    "Ice Hockey": "Ice Hockey",
+    "Lacrosse": "Lacrosse",
+    "Soccer": "Soccer",
+    "Tennis": "Tennis",
+    "Volleyball": "Volleyball",
+    "Fencing": "Fencing",
+    "Water Polo": "Water Polo",
+    "Wrestling": "Wrestling",
+    # cross-country / track
+    "Cross_Country": "Cross Country",
+    "Track and Field X Country": "Cross Country",
+    "Indoor Track & Field": "Track & Field (Indoor)",
+    "Track and Field Indoor": "Track & Field (Indoor)",
+    "Outdoor Track & Field": "Track & Field (Outdoor)",
+    "Track and Field Outdoor": "Track & Field (Outdoor)",
+    "Track and Fields": "Track & Field (Outdoor)",
+    "All Track Combined": "All Track Combined",
+    # swim / dive
+    "Swimming": "Swimming & Diving",
+    "Diving": "Swimming & Diving",
+    "Swimming and Diving": "Swimming & Diving",
+    # total rows
+    "Total": "Total",
+}, cutoff=0.9)
+
+# Midwest Conference all-sports standings column codes -> Standing/ sport names
+STANDING_SPORT_CODES = Resolver("standing_sport_codes", {
+    "VB": "Volleyball",
+    "SOC": "Soccer",
+    "XC": "Cross Country",
+    "CC": "Cross Country",
+    "TEN": "Tennis",
+    "BKB": "Basketball",
+    "SWIM": "Swimming",
+    "SWM": "Swimming",
+    "ITRK": "Indoor Track & Field",
+    "OTRK": "Outdoor Track & Field",
+    "SB": "Softball",
+    "FB": "Football",
+    "BASE": "Baseball",
+    "BSB": "Baseball",
+    "TOTAL": "Total",
+}, cutoff=None)
+
+# EADA "<Sport> Men's/Women's Team Expenses" headers -> PowerBI expense sports
+# (indoor and outdoor track are summed as "Track and Fields")
+EXPENSE_REPORT_SPORTS = Resolver("expense_report_sports", {
+    "Baseball": "Baseball",
+    "Basketball": "Basketball",
+    "Football": "Football",
+    "Golf": "Golf",
+    "Soccer": "Soccer",
+    "Softball": "Softball",
+    "Tennis": "Tennis",
+    "Volleyball": "Volleyball",
+    "Cross Country": "Cross Country",
+    "Track and Field X Country": "Cross Country",
+    "Swimming and Diving": "Swimming and Diving",
+    "Track and Field Indoor": "Track and Fields",
+    "Track and Field Outdoor": "Track and Fields",
+}, cutoff=0.9)
+
+VOCABULARIES = {r.kind: r for r in (SCHOOLS, SPORTS, STANDING_SPORT_CODES, EXPENSE_REPORT_SPORTS)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.names",
+                                     description="Canonical school and sport names.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("resolve", help="resolve names against a vocabulary")
+    p.add_argument("vocabulary", choices=sorted(VOCABULARIES))
+    p.add_argument("names", nargs="+")
+    sub.add_parser("info", help="memoized names per vocabulary")
+    sub.add_parser("clear", help="delete the memo file")
+    args = parser.parse_args(argv)
+
+    if args.command == "resolve":
+        resolver = VOCABULARIES[args.vocabulary]
+        for name in args.names:
+            print(f"{name!r} -> {resolver.resolve(name)!r}")
+        resolver.save()
+    elif args.command == "clear":
+        if os.path.exists(DEFAULT_MEMO_PATH):
+            os.remove(DEFAULT_MEMO_PATH)
+        print(f"Removed {DEFAULT_MEMO_PATH}")
+    else:
+        for kind, resolver in VOCABULARIES.items():
+            names = resolver._read().get("names", {})
+            unmatched = sum(v is None for v in names.values())
+            print(f"{kind:22} {len(resolver.canonical):3} canonical, {len(names):5} memoized "
+                  f"({unmatched} unmatched)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Fast, partial HTML parsing for Sidearm / TFRRS pages.
+
+Most scrapers need one ``<select>`` or one ``<table>`` out of a 300 KB page.
+Building the full html.parser tree for that is the slowest part of a cached
+run, so this module parses with lxml (when installed) and hands BeautifulSoup
+a SoupStrainer, which keeps only the matching subtrees.
+
+The same ``find``/``get_text`` calls then run on the strained soup, so the
+extracted values do not change -- only how much of the page gets built.
+
+Note: a strainer sees the raw ``class`` attribute ("sidearm-table dataTable
+...") before BeautifulSoup splits it, so classes are matched with class_re()
+rather than a plain string.
+"""
+
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (only needed as the BeautifulSoup tree builder)
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = "html.parser"
+
+# The parser every script used before this module existed
+SLOW_PARSER = "html.parser"
+
+
+def class_re(*names):
+    """Regex matching a class attribute that contains any of ``names`` as a word."""
+    alternatives = "|".join(re.escape(n) for n in names)
+    return re.compile(rf"(?:^|\s)(?:{alternatives})(?:\s|$)")
+
+
+def dropdown_strainer(select_id=None, name=None):
+    """Keep only the season <select> (by id, or by name= for TFRRS)."""
+    if name is not None:
+        return SoupStrainer("select", attrs={"name": name})
+    return SoupStrainer("select", id=select_id)
+
+
+# Schedule grid page: the season-record block and the grid table
+SCHEDULE_STRAINER = SoupStrainer(
+    ["div", "table"],
+    class_=class_re("sidearm-schedule-record", "sidearm-table-grid-template-1"),
+)
+
+# Conference standings page
+STANDINGS_STRAINER = SoupStrainer("table", class_=class_re("sidearm-standings-table"))
+
+# Roster page in grid view (?view=2)
+ROSTER_STRAINER = SoupStrainer("table", class_=class_re("sidearm-table-grid-template-1"))
+
+# Any <table> (coaches pages, plain stats pages)
+TABLE_STRAINER = SoupStrainer("table")
+
+# TFRRS team pages: title + table blocks, and the links to the sub-pages
+TFRRS_BLOCK_STRAINER = SoupStrainer("div", class_=class_re("col-lg-12"))
+LINK_STRAINER = SoupStrainer("a")
+
+# Sidearm season dropdowns, by page type
+SEASON_SELECT_IDS = {
+    "schedule": "sidearm-schedule-select-season",
+    "stats": "ctl00_cplhMainContent_seasons_ddl",
+    "coaches": "ddl_seasons_list",
+    "roster": "ddl_past_rosters",
+    "standings": "ctl00_cplhMainContent_ddl_past_standings",
+}
+
+
+def soup(html, strainer=None, parser=None):
+    """
+    BeautifulSoup of ``html`` restricted to ``strainer``.
+    parser=None uses lxml when available; pass SLOW_PARSER (and strainer=None)
+    for the old full html.parser tree.
+    """
+    return BeautifulSoup(html, parser or FAST_PARSER, parse_only=strainer)
+
+
+def season_dropdown(html, page_type, parser=None, strained=True):
+    """The season <select> Tag for a Sidearm page type, or None."""
+    select_id = SEASON_SELECT_IDS[page_type]
+    strainer = dropdown_strainer(select_id) if strained else None
+    return soup(html, strainer, parser).find("select", id=select_id)
@@ -0,0 +1,347 @@
+"""
+Content-hashed pipeline runner for the combine -> standardize -> rank chain.
+
+Each stage declares the files it reads and writes (paths or globs relative to
+the repo root). A run walks the stages in dependency order and hashes each
+stage's inputs, including its own script. A stage is skipped when those
+hashes and its outputs both match the last successful run. Independent stages
+run in parallel, each script in its own process.
+
+    Expense Data/Combined_Data.py ──> Final/ ──> standardize_school_names.py ──┐
+    Standing/ranking_process.py ────> Final/ ──┘                               ├─> standardize_sports_and_fix_all.py
+    Code/Roster/combine_player.py ──> Final/ ──────────────────────────────────┘
+    Schedule/Combine_schedule.py          (Schedule/combined_records.csv)
+    All Rankings.py                       (all_schools_rankings.csv/.xlsx)
+    PowerBI/Combined Expenses.py ──> PowerBI/Data/all_school_expenses.csv ──> PowerBI/Data/Year_Growth_Expense.py
+
+The "copy" stages stand in for the hand copies the next script expects
+(into Final/, and PowerBI/all_expenses.csv into PowerBI/Data). The files in
+HAND_MAINTAINED are out of scope: no stage writes them (see ``graph``).
+
+``.pipeline_state.json`` keeps the per-file hashes (a file is re-hashed only
+when its size or mtime changed), each stage's last input/output digests, and
+the timings of recent runs.
+
+    python -m athlete.pipeline run                 # everything that is out of date
+    python -m athlete.pipeline run all_rankings    # one stage and what it needs
+    python -m athlete.pipeline run --force --jobs 2
+    python -m athlete.pipeline status
+    python -m athlete.pipeline graph
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import datetime
+import threading
+import subprocess
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_FILE = ".pipeline_state.json"
+STATE_VERSION = 1
+KEEP_RUNS = 20
+
+# kind: "script" (target run with the current Python, cwd relative to the root)
+#       or "copy" (target = source file, outputs[0] = destination)
+Stage = namedtuple("Stage", "name kind target inputs outputs cwd")
+
+
+def script(name, path, inputs, outputs, cwd="."):
+    """A stage that runs ``path``; the script itself is always an input."""
+    return Stage(name, "script", path, (path,) + tuple(inputs), tuple(outputs), cwd)
+
+
+def copy(name, source, dest):
+    return Stage(name, "copy", source, (source,), (dest,), ".")
+
+
+ATHLETE = "athlete/*.py"  # scripts that import the shared package
+
+STAGES = [
+    script("combine_expenses", "Expense Data/Combined_Data.py",
+           ["Expense Data/*Expenses*", "Expense Data/*/*Expenses*", ATHLETE],
+           ["Expense Data/combined_athlete_expenses.csv"]),
+    copy("stage_expenses", "Expense Data/combined_athlete_expenses.csv",
+         "Final/combined_athlete_expenses.csv"),
+    script("rank_standings", "Standing/ranking_process.py",
+           ["Standing/Score data.csv"], ["Standing/Score data_ranked.csv"]),
+    copy("stage_scores", "Standing/Score data_ranked.csv", "Final/Score data_ranked.csv"),
+    script("combine_roster", "Code/Roster/combine_player.py",
+           ["Roster/**/*.csv", ATHLETE], ["combined_roster.csv"]),
+    copy("stage_roster", "combined_roster.csv", "Final/combined_roster.csv"),
+    script("standardize_school_names", "Final/standardize_school_names.py",
+           ["Final/Score data_ranked.csv", "Final/combined_athlete_expenses.csv", ATHLETE],
+           ["Final/Score data_ranked_std.csv", "Final/combined_athlete_expenses_std.csv"]),
+    script("standardize_sports", "Final/standardize_sports_and_fix_all.py",
+           ["Final/Score data_ranked_std.csv", "Final/combined_athlete_expenses_std.csv",
+            "Final/combined_roster.csv", ATHLETE],
+           ["Final/Score data_ranked_clean.csv", "Final/combined_athlete_expenses_clean.csv",
+            "Final/combined_roster_clean.csv"]),
+    script("combine_schedule", "Schedule/Combine_schedule.py",
+           ["Schedule/Ripon/**/*record*.csv", ATHLETE], ["Schedule/combined_records.csv"],
+           cwd="Schedule"),
+    script("all_rankings", "All Rankings.py",
+           ["Schedule/*/*/*/*/*record*.csv", ATHLETE],
+           ["all_schools_rankings.csv", "all_schools_rankings.xlsx"]),
+    script("combine_powerbi_expenses", "PowerBI/Combined Expenses.py",
+           ["PowerBI/School Expenses/*.csv", ATHLETE], ["PowerBI/all_expenses.csv"], cwd="PowerBI"),
+    copy("stage_powerbi_expenses", "PowerBI/all_expenses.csv", "PowerBI/Data/all_school_expenses.csv"),
+    script("year_growth", "PowerBI/Data/Year_Growth_Expense.py",
+           ["PowerBI/Data/all_school_expenses.csv", ATHLETE], ["PowerBI/Data/all_school_expenses_updated.csv"],
+           cwd="PowerBI/Data"),
+]
+
+# Copies in PowerBI/Data the report reads that were edited by hand after
+# copying (other columns, filtered rows, Excel-formatted W-L cells): a copy
+# stage would overwrite them with a layout the report does not expect
+HAND_MAINTAINED = {
+    "PowerBI/Data/combined_records.csv": "Schedule/combined_records.csv",
+    "PowerBI/Data/all_schools_rankings.csv": "all_schools_rankings.csv",
+}
+
+
+def _pattern_re(pattern):
+    """Regex for a root-relative glob: ``**/`` spans folders, ``*`` and ``?`` do not."""
+    out, i = "", 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out, i = out + "(?:.*/)?", i + 3
+        elif pattern[i] == "*":
+            out, i = out + "[^/]*", i + 1
+        elif pattern[i] == "?":
+            out, i = out + "[^/]", i + 1
+        else:
+            out, i = out + re.escape(pattern[i]), i + 1
+    return re.compile(out + r"\Z")
+
+
+def dependencies(stages=STAGES):
+    """{stage name: [names of the stages whose outputs it reads]}."""
+    deps = {}
+    for stage in stages:
+        patterns = [_pattern_re(p) for p in stage.inputs]
+        deps[stage.name] = [other.name for other in stages if other is not stage
+                            and any(p.match(out) for out in other.outputs for p in patterns)]
+    return deps
+
+
+class Pipeline:
+    """Plans and runs STAGES against the tree at ``root``."""
+
+    def __init__(self, root=REPO_ROOT, stages=STAGES, state_path=None):
+        self.root = root
+        self.stages = {s.name: s for s in stages}
+        self.deps = dependencies(stages)
+        self.state_path = state_path or os.path.join(root, STATE_FILE)
+        self.state = self._read()
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STATE_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": STATE_VERSION, "files": {}, "stages": {}, "runs": []}
+
+    def save(self):
+        with _FileLock(self.state_path):
+            tmp = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(json.dumps(self.state, separators=(",", ":"), sort_keys=True))
+            os.replace(tmp, self.state_path)
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+    def _files(self, patterns, exclude=()):
+        """Root-relative paths matched by ``patterns`` (literal paths kept even if missing)."""
+        found = set()
+        for pattern in patterns:
+            if not glob.has_magic(pattern):
+                found.add(pattern)
+                continue
+            for path in glob.glob(os.path.join(glob.escape(self.root), pattern), recursive=True):
+                if os.path.isfile(path):
+                    found.add(os.path.relpath(path, self.root).replace(os.sep, "/"))
+        return sorted(found - set(exclude))
+
+    def file_hash(self, rel):
+        """SHA-256 of a file, reused while its size and mtime stay the same (None if missing)."""
+        path = os.path.join(self.root, rel)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            known = self.state["files"].get(rel)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        with self._lock:
+            self.state["files"][rel] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def digest(self, rels):
+        h = hashlib.sha256()
+        for rel in rels:
+            h.update(f"{rel}\0{self.file_hash(rel)}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def digests(self, stage):
+        """(input digest, output digest) of a stage as the tree stands now."""
+        return (self.digest(self._files(stage.inputs, exclude=stage.outputs)),
+                self.digest(stage.outputs))
+
+    def is_current(self, name):
+        last = self.state["stages"].get(name)
+        if not last:
+            return False
+        inputs, outputs = self.digests(self.stages[name])
+        return last["inputs"] == inputs and last["outputs"] == outputs
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    def _execute(self, stage, verbose):
+        if stage.kind == "copy":
+            dest = os.path.join(self.root, stage.outputs[0])
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            tmp = f"{dest}.{os.getpid()}.tmp"
+            shutil.copyfile(os.path.join(self.root, stage.target), tmp)
+            os.replace(tmp, dest)
+            return
+        proc = subprocess.run([sys.executable, os.path.join(self.root, stage.target)],
+                              cwd=os.path.join(self.root, stage.cwd), capture_output=True, text=True)
+        if verbose and proc.stdout.strip():
+            print(proc.stdout.rstrip())
+        if proc.returncode != 0:
+            tail = "\n".join((proc.stderr or proc.stdout).strip().splitlines()[-5:])
+            raise RuntimeError(f"{stage.target} exited with {proc.returncode}:\n{tail}")
+
+    def _run_stage(self, name, force, verbose):
+        """(status, seconds) for one stage: "skipped", "ran" or "failed"."""
+        stage = self.stages[name]
+        start = time.perf_counter()
+        inputs, outputs = self.digests(stage)
+        last = self.state["stages"].get(name)
+        if not force and last and last["inputs"] == inputs and last["outputs"] == outputs:
+            return "skipped", time.perf_counter() - start
+        try:
+            self._execute(stage, verbose)
+        except (OSError, RuntimeError) as err:
+            print(f"[{name}] failed: {err}", file=sys.stderr)
+            with self._lock:
+                self.state["stages"].pop(name, None)
+            return "failed", time.perf_counter() - start
+        outputs = self.digest(stage.outputs)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self.state["stages"][name] = {
+                "inputs": inputs, "outputs": outputs, "seconds": round(seconds, 3),
+                "ran_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            }
+        return "ran", seconds
+
+    def upstream(self, names):
+        """``names`` plus every stage they depend on, directly or not."""
+        wanted, todo = set(), list(names)
+        while todo:
+            name = todo.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage {name!r}; known: {', '.join(self.stages)}")
+            if name not in wanted:
+                wanted.add(name)
+                todo.extend(self.deps[name])
+        return wanted
+
+    def run(self, names=None, force=False, jobs=None, verbose=False):
+        """
+        Run the stages (default: all) in dependency order, up to ``jobs`` at a
+        time. Returns {stage: (status, seconds)}; status "blocked" means an
+        upstream stage failed.
+        """
+        wanted = self.upstream(names) if names else set(self.stages)
+        results = {}
+        started = time.perf_counter()
+        pending = {n: set(self.deps[n]) & wanted for n in wanted}
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            running = {}
+            while pending or running:
+                for name in [n for n, deps in pending.items() if not deps - set(results)]:
+                    del pending[name]
+                    if any(results[d][0] in ("failed", "blocked") for d in self.deps[name] if d in wanted):
+                        results[name] = ("blocked", 0.0)
+                    else:
+                        running[pool.submit(self._run_stage, name, force, verbose)] = name
+                if not running:
+                    continue  # everything left was just blocked
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        total = time.perf_counter() - started
+        self.state["runs"] = (self.state["runs"] + [{
+            "at": datetime.datetime.now().isoformat(timespec="seconds"), "seconds": round(total, 3),
+            "stages": {n: [s, round(t, 3)] for n, (s, t) in results.items()},
+        }])[-KEEP_RUNS:]
+        self.save()
+        return results, total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.pipeline",
+                                     description="Run the data pipeline, skipping unchanged stages.")
+    parser.add_argument("--root", default=REPO_ROOT)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("run", help="run out-of-date stages")
+    p.add_argument("stages", nargs="*", help="only these stages (and what they need)")
+    p.add_argument("--force", action="store_true", help="run even if nothing changed")
+    p.add_argument("--jobs", type=int, default=None, help="stages run at once (default: CPU count)")
+    p.add_argument("--verbose", action="store_true", help="echo the scripts' output")
+    sub.add_parser("status", help="which stages are up to date")
+    sub.add_parser("graph", help="stages and what they depend on")
+    args = parser.parse_args(argv)
+
+    pipeline = Pipeline(args.root)
+    if args.command == "graph":
+        for name, stage in pipeline.stages.items():
+            print(f"{name:26} <- {', '.join(pipeline.deps[name]) or '-'}")
+        for path, source in HAND_MAINTAINED.items():
+            print(f"{path} is maintained by hand from {source}; no stage writes it")
+        return 0
+    if args.command == "status":
+        for name in pipeline.stages:
+            last = pipeline.state["stages"].get(name)
+            state = "up to date" if pipeline.is_current(name) else "stale"
+            timing = f"{last['seconds']:.2f}s at {last['ran_at']}" if last else "never ran"
+            print(f"{name:26} {state:10} last: {timing}")
+        pipeline.save()  # keep the file hashes just computed
+        return 0
+
+    results, total = pipeline.run(args.stages or None, args.force, args.jobs, args.verbose)
+    for name in pipeline.stages:
+        if name in results:
+            status, seconds = results[name]
+            print(f"{name:26} {status:8} {seconds:7.2f}s")
+    print(f"Pipeline finished in {total:.2f}s")
+    return 1 if any(s in ("failed", "blocked") for s, _ in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
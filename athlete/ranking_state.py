@@ -0,0 +1,147 @@
+"""
+Incremental All Rankings: re-rank only the (Gender, Sport, Year) groups whose
+record files changed since the last run.
+
+``.rankings_state.json`` at the repo root keeps, per group, a fingerprint of
+its record files (path, size, mtime) and the ranked rows the last run wrote.
+update() rescans Schedule/ (one stat per file), re-reads and re-ranks the new
+and changed groups, and drops the groups whose files are gone. A group's ranks
+and row order depend only on its own rows (see rank_records()), so frame()
+gives the same table a full run would.
+
+    from athlete.ranking_state import RankingState
+    state = RankingState()
+    changed, removed = state.update("Schedule")
+    df = state.frame()        # School, Gender, Sport, Year, Pct, CPct, Ranking
+    ...write the outputs...
+    state.save()              # only once the outputs are written
+
+    python -m athlete.ranking_state info
+    python -m athlete.ranking_state clear     # next run re-ranks everything
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+import pandas as pd
+
+from athlete.manifest import _FileLock
+from athlete.ranking import rank_records
+from athlete.records import COLUMNS, read_record_files, scan_record_files
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STATE_PATH = os.path.join(REPO_ROOT, ".rankings_state.json")
+
+STATE_VERSION = 1
+
+
+def fingerprint(files):
+    """Hash of the (path, size, mtime) of a group's scanned record files."""
+    h = hashlib.sha256()
+    for f in sorted(files, key=lambda f: f[4]):
+        st = os.stat(f[4])
+        h.update(f"{f[4]}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _name(key):
+    return "/".join(key)  # folder names cannot contain "/"
+
+
+class RankingState:
+    """Per-group fingerprints and ranked rows from the last All Rankings run."""
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        # "Gender/Sport/Year" -> {"fingerprint": str, "rows": [[School, Pct, CPct, Ranking], ...]}
+        self.groups = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STATE_VERSION:
+                return data["groups"]
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def update(self, schedule_dir="Schedule", processes=None):
+        """
+        Re-rank the groups whose record files changed; returns the names of the
+        (re-ranked, removed) groups. Call save() once the outputs are written.
+        """
+        by_group = {}
+        for f in scan_record_files(schedule_dir):
+            by_group.setdefault(_name(f[1:4]), []).append(f)
+        fingerprints = {name: fingerprint(files) for name, files in by_group.items()}
+
+        changed = [name for name, fp in fingerprints.items()
+                   if self.groups.get(name, {}).get("fingerprint") != fp]
+        removed = [name for name in self.groups if name not in by_group]
+        for name in removed:
+            del self.groups[name]
+        if not changed:
+            return changed, removed
+
+        ranked = rank_records(read_record_files(
+            [f for name in changed for f in by_group[name]], processes))
+        rows = {name: [] for name in changed}  # groups with no readable record stay, empty
+        for school, gender, sport, year, pct, cpct, ranking in ranked.itertuples(index=False, name=None):
+            rows[_name((gender, sport, year))].append([school, pct, cpct, ranking])
+        for name in changed:
+            self.groups[name] = {"fingerprint": fingerprints[name], "rows": rows[name]}
+        return changed, removed
+
+    def frame(self):
+        """Every group's rows, in rank_records() order."""
+        rows = []
+        for name in sorted(self.groups, key=lambda n: tuple(n.split("/"))):
+            gender, sport, year = name.split("/")
+            rows.extend((school, gender, sport, year, pct, cpct, ranking)
+                        for school, pct, cpct, ranking in self.groups[name]["rows"])
+        df = pd.DataFrame(rows, columns=COLUMNS + ["Ranking"])
+        return df.astype({"Pct": "float64", "CPct": "float64", "Ranking": "int64"})
+
+    def save(self):
+        with _FileLock(self.path):
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                # dumps() takes the C encoder; dump() to a file does not
+                f.write(json.dumps({"version": STATE_VERSION, "groups": self.groups}, separators=(",", ":")))
+            os.replace(tmp, self.path)
+
+    def clear(self):
+        self.groups = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.ranking_state",
+                                     description="Saved state of the incremental All Rankings run.")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="groups and rows in the state file")
+    sub.add_parser("clear", help="forget the state; the next run re-ranks every group")
+    args = parser.parse_args(argv)
+
+    state = RankingState(args.state)
+    if args.command == "clear":
+        state.clear()
+        print(f"Removed {args.state}")
+        return 0
+    if not state.groups:
+        print("No saved rankings; the next All Rankings run ranks every group.")
+        return 1
+    for gender in sorted({n.split("/")[0] for n in state.groups}):
+        names = [n for n in state.groups if n.startswith(gender + "/")]
+        print(f"{gender:6} {len(names):5d} groups {sum(len(state.groups[n]['rows']) for n in names):6d} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Per-domain token buckets shared by every scraper process on this machine.
+
+Each domain has a budget of ``rate`` requests/second with bursts of up to
+``burst``. The bucket state is a small JSON file per domain under
+``.rate_limit/`` at the repo root, updated under a lock file, so pool workers
+(athlete.scheduler), separate scripts and a Spyder session all draw from the
+same budget.
+
+Adaptive slowdown (AIMD):
+
+  * a 429 or 503 halves the domain's current rate (never below ``min_rate``)
+    and, if the server sent Retry-After, blocks the domain for every process
+    until then;
+  * each successful response adds back 5% of the configured rate, so the rate
+    climbs back once the server stops pushing back.
+
+HttpClient calls acquire() before every network request and feedback() after
+it. It reports time spent throttled against time spent fetching.
+
+    python -m athlete.rate_limit            # current state of every bucket
+"""
+
+import os
+import sys
+import json
+import time
+from urllib.parse import urlsplit
+
+from athlete.manifest import _FileLock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STATE_DIR = os.path.join(REPO_ROOT, ".rate_limit")
+
+# Domain (matched on the host or any parent domain) -> (requests/sec, burst)
+RATE_LIMITS = {
+    "pioneers.grinnell.edu": (4.0, 8),
+    "midwestconference.org": (2.0, 4),
+    "tfrrs.org": (1.0, 3),
+}
+DEFAULT_LIMIT = (5.0, 10)
+
+SLOWDOWN_STATUSES = {429, 503}
+SLOWDOWN_FACTOR = 0.5           # multiply the rate on 429/503
+RECOVERY_STEP = 0.05            # fraction of the configured rate regained per success
+MIN_RATE_FRACTION = 0.05        # never slow below 5% of the configured rate
+
+
+def domain_of(url):
+    host = urlsplit(url).netloc.lower() or url.lower()
+    return host.split("@")[-1].split(":")[0]
+
+
+def limit_for(domain, limits=None):
+    """(rate, burst) for a host: exact match, then parent domains, then default."""
+    limits = RATE_LIMITS if limits is None else limits
+    parts = domain.split(".")
+    for i in range(len(parts) - 1):
+        key = ".".join(parts[i:])
+        if key in limits:
+            return limits[key]
+    return DEFAULT_LIMIT
+
+
+class RateLimiter:
+    """File-backed token buckets, one per domain."""
+
+    def __init__(self, state_dir=DEFAULT_STATE_DIR, limits=None):
+        self.state_dir = state_dir
+        self.limits = RATE_LIMITS if limits is None else limits
+        os.makedirs(state_dir, exist_ok=True)
+
+    def _path(self, domain):
+        return os.path.join(self.state_dir, domain.replace(":", "_") + ".json")
+
+    def _read(self, domain, now):
+        rate, burst = limit_for(domain, self.limits)
+        try:
+            with open(self._path(domain), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        # A changed configuration resets the bucket
+        if state.get("limit") != [rate, burst]:
+            state = {"limit": [rate, burst], "rate": rate, "tokens": float(burst),
+                     "updated": now, "blocked_until": 0.0, "slowdowns": 0}
+        return state
+
+    def _write(self, domain, state):
+        path = self._path(domain)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    def _locked(self, domain):
+        return _FileLock(self._path(domain), timeout=60.0, stale_after=5.0, poll=0.005)
+
+    def acquire(self, url):
+        """Block until the URL's domain has a token; returns the seconds waited."""
+        domain = domain_of(url)
+        waited = 0.0
+        while True:
+            with self._locked(domain):
+                now = time.time()
+                state = self._read(domain, now)
+                burst = state["limit"][1]
+                state["tokens"] = min(burst, state["tokens"] + (now - state["updated"]) * state["rate"])
+                state["updated"] = now
+                if now < state["blocked_until"]:
+                    wait = state["blocked_until"] - now
+                elif state["tokens"] >= 1.0:
+                    state["tokens"] -= 1.0
+                    self._write(domain, state)
+                    return waited
+                else:
+                    wait = (1.0 - state["tokens"]) / state["rate"]
+                self._write(domain, state)
+            time.sleep(wait)
+            waited += wait
+
+    def feedback(self, url, status, retry_after=None):
+        """Adapt the domain's rate to a response status (None = connection error)."""
+        domain = domain_of(url)
+        with self._locked(domain):
+            now = time.time()
+            state = self._read(domain, now)
+            configured = state["limit"][0]
+            if status in SLOWDOWN_STATUSES:
+                state["rate"] = max(configured * MIN_RATE_FRACTION, state["rate"] * SLOWDOWN_FACTOR)
+                state["slowdowns"] += 1
+                if retry_after:
+                    state["blocked_until"] = max(state["blocked_until"], now + retry_after)
+            elif status is not None and status < 400 and state["rate"] < configured:
+                state["rate"] = min(configured, state["rate"] + configured * RECOVERY_STEP)
+            else:
+                return
+            self._write(domain, state)
+
+    def snapshot(self):
+        """{domain: state} for every bucket on disk."""
+        now = time.time()
+        states = {}
+        for name in sorted(os.listdir(self.state_dir)):
+            if name.endswith(".json"):
+                domain = name[:-5]
+                states[domain] = self._read(domain, now)
+        return states
+
+
+def main(argv=None):
+    limiter = RateLimiter()
+    now = time.time()
+    states = limiter.snapshot()
+    if not states:
+        print("No rate-limit state yet.")
+    for domain, s in states.items():
+        rate, burst = s["limit"]
+        blocked = max(0.0, s["blocked_until"] - now)
+        print(f"{domain:32} {s['rate']:5.2f}/{rate:g} req/s  burst {burst:<3} "
+              f"slowdowns {s['slowdowns']:<3}" + (f" blocked {blocked:.0f}s" if blocked else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
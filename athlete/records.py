@@ -0,0 +1,110 @@
+"""
+Fast loader for the season-record CSVs under Schedule/.
+
+All Rankings.py needs two numbers from each ``<Season>_record.csv``: Pct on
+line 3 and CPct on line 5 (column 2). It used to walk the tree with nested
+os.listdir calls and run ``pd.read_csv(header=None)`` on every 9-line file.
+Here the tree is walked with os.scandir, and each file goes through a small
+fixed-position reader that gives the same values read_csv + iloc[2, 1] /
+iloc[4, 1] would. A process pool reads the files, so a cold cache or a
+network drive is not a serial wait.
+
+    from athlete.records import load_record_pcts
+    df = load_record_pcts("Schedule")     # School, Gender, Sport, Year, Pct, CPct
+"""
+
+import os
+import csv
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+COLUMNS = ["School", "Gender", "Sport", "Year", "Pct", "CPct"]
+
+# Strings pandas.read_csv turns into NaN by default
+NA_VALUES = {"", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+             "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+             "nan", "null"}
+
+# Below this many files the pool costs more than it saves
+MIN_FILES_FOR_POOL = 2000
+
+
+def read_pct_cpct(path):
+    """
+    (Pct, CPct) from a record CSV, as pd.read_csv(header=None).iloc[2, 1] and
+    .iloc[4, 1] give them; (None, None) if the file is empty, too short or
+    not numeric there.
+    """
+    try:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            rows = [row for row in csv.reader(f) if row]  # read_csv skips blank lines
+        # read_csv takes the width from line 1 and rejects longer lines
+        if len(rows) < 5 or len(rows[0]) < 2 or any(len(row) > len(rows[0]) for row in rows):
+            return None, None
+        return _cell(rows[2]), _cell(rows[4])
+    except (OSError, UnicodeDecodeError, ValueError, csv.Error):
+        return None, None
+
+
+def _cell(row):
+    value = row[1] if len(row) > 1 else ""
+    return float("nan") if value in NA_VALUES else float(value)
+
+
+def scan_record_files(schedule_dir="Schedule"):
+    """
+    [(School, Gender, Sport, Year, path)] for every CSV with "record" in its
+    name at Schedule/<School>/<Gender>/<Sport>/<Year>/, in directory order.
+    """
+    def subdirs(path):
+        try:
+            with os.scandir(path) as it:
+                return [(e.name, e.path) for e in it if e.is_dir()]
+        except OSError:
+            return []
+
+    found = []
+    for school, school_path in subdirs(schedule_dir):
+        for gender, gender_path in subdirs(school_path):
+            for sport, sport_path in subdirs(gender_path):
+                for year, year_path in subdirs(sport_path):
+                    with os.scandir(year_path) as it:
+                        for e in it:
+                            name = e.name.lower()
+                            if "record" in name and name.endswith(".csv"):
+                                found.append((school, gender, sport, year, e.path))
+    return found
+
+
+def _read_chunk(paths):
+    return [read_pct_cpct(p) for p in paths]
+
+
+def read_record_files(files, processes=None):
+    """
+    DataFrame of (School, Gender, Sport, Year, Pct, CPct) for the scanned
+    ``files`` that have both values, in the order given, with Pct/CPct as
+    float64. ``processes``: pool size (default: CPU count for large batches,
+    1 = read in this process).
+    """
+    paths = [f[4] for f in files]
+    if processes is None:
+        processes = (os.cpu_count() or 1) if len(paths) >= MIN_FILES_FOR_POOL else 1
+
+    if processes <= 1:
+        values = _read_chunk(paths)
+    else:
+        size = -(-len(paths) // (processes * 4))
+        chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            values = [v for chunk in pool.map(_read_chunk, chunks) for v in chunk]
+
+    rows = [f[:4] + v for f, v in zip(files, values) if v[0] is not None and v[1] is not None]
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    return df.astype({"Pct": "float64", "CPct": "float64"})
+
+
+def load_record_pcts(schedule_dir="Schedule", processes=None):
+    """read_record_files() over every record file under ``schedule_dir``."""
+    return read_record_files(scan_record_files(schedule_dir), processes)
@@ -0,0 +1,115 @@
+"""
+Scrape job registry.
+
+``scrape_registry.json`` (repo root) lists every school we scrape, its Sidearm
+site, which sports it has and which page types to collect:
+
+    {
+      "sports":     {"<slug>": ["<Gender>", "<Sport folder>"], ...},
+      "per_domain": {"default": 4, "<host>": <max requests in flight>},
+      "schools": {
+        "<School folder>": {
+          "base_url":   "https://...",          # null = not configured yet, skipped
+          "note":       "...",                  # optional, why it is not configured
+          "sports":     ["baseball", ...],      # slugs from "sports"
+          "folders":    {"softball": ["Women", "softball"]},   # optional overrides
+          "page_types": ["schedule"]
+        }
+      }
+    }
+
+expand_jobs() turns it into one Job per (school, sport, page type); the
+scheduler (athlete.scheduler) runs them. Outputs keep the existing layout,
+e.g. ``Schedule/<School>/<Gender>/<Sport>/<Year>/``.
+
+Only schedule pages are a page type so far. Rosters (Code/Roster/) and
+Performance Stats (Code/Stats/Stats(XML).py) are still scraped by their own
+scripts, and so are single-sport runs (Code/Schedule/schedule.py and the
+copies in Schedule/Beloit and Schedule/Ripon).
+"""
+
+import os
+import json
+from collections import namedtuple
+
+from athlete.manifest import school_key
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_REGISTRY_PATH = os.path.join(REPO_ROOT, "scrape_registry.json")
+
+# Page type -> top-level data folder its outputs go under
+OUTPUT_ROOTS = {
+    "schedule": os.path.join(REPO_ROOT, "Schedule"),
+}
+
+DEFAULT_PER_DOMAIN = 4
+
+Job = namedtuple("Job", ["school", "base_url", "sport", "gender", "folder", "page_type"])
+
+
+def load_registry(path=None):
+    with open(path or DEFAULT_REGISTRY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def unconfigured_schools(registry):
+    """Schools listed without a base_url (their jobs are skipped)."""
+    return [name for name, entry in registry["schools"].items() if not entry.get("base_url")]
+
+
+def school_for_url(registry, url):
+    """Folder name of the registry school whose site ``url`` is on."""
+    domain = school_key(url)
+    for name, entry in registry["schools"].items():
+        if entry.get("base_url") and school_key(entry["base_url"]) == domain:
+            return name
+    raise ValueError(f"No school in the registry has the site {domain}")
+
+
+def expand_jobs(registry, schools=None, sports=None, genders=None, page_types=None):
+    """
+    Every Job in the registry, optionally filtered by school folder names,
+    sport slugs, genders ("Men"/"Women") and page types.
+    """
+    known = registry["schools"]
+    for name in schools or ():
+        if name not in known:
+            raise ValueError(f"Unknown school {name!r}; known: {', '.join(known)}")
+
+    jobs = []
+    for name, entry in known.items():
+        if schools and name not in schools:
+            continue
+        base_url = (entry.get("base_url") or "").rstrip("/")
+        if not base_url:
+            continue
+        folders = entry.get("folders", {})
+        for sport in entry["sports"]:
+            if sports and sport not in sports:
+                continue
+            if sport not in registry["sports"] and sport not in folders:
+                raise ValueError(f"{name}: sport {sport!r} is not in the registry's sports map")
+            gender, folder = folders.get(sport) or registry["sports"][sport]
+            if genders and gender not in genders:
+                continue
+            for page_type in entry.get("page_types", ["schedule"]):
+                if page_type not in OUTPUT_ROOTS:
+                    raise ValueError(f"{name}: unknown page type {page_type!r}")
+                if page_types and page_type not in page_types:
+                    continue
+                jobs.append(Job(name, base_url, sport, gender, folder, page_type))
+    return jobs
+
+
+def job_domain(job):
+    return school_key(job.base_url)
+
+
+def output_dir(job):
+    """<data root>/<School>/<Gender>/<Sport> for a job."""
+    return os.path.join(OUTPUT_ROOTS[job.page_type], job.school, job.gender, job.folder)
+
+
+def per_domain_cap(registry, domain):
+    caps = registry.get("per_domain", {})
+    return int(caps.get(domain, caps.get("default", DEFAULT_PER_DOMAIN)))
@@ -0,0 +1,249 @@
+"""
+Run registry jobs (athlete.registry) on a process pool.
+
+Each (school, sport, page type) job runs in its own worker process, and within
+a job the season pages are fetched concurrently (athlete.aio). A semaphore per
+domain, shared by all workers through a multiprocessing Manager, caps how many
+requests are in flight against one site across the whole pool. The cap is
+``per_domain`` in the registry. Jobs are interleaved by domain so the workers
+don't all queue up on the same site.
+
+    python -m athlete.scheduler                              # everything
+    python -m athlete.scheduler --school Beloit --school Ripon
+    python -m athlete.scheduler --sport softball --gender Women --processes 8
+    python -m athlete.scheduler --list
+    python -m athlete.scheduler --replay                     # re-parse from the HTML archive
+    python -m athlete.scheduler --sink parquet               # write to Dataset/ (athlete.dataset)
+
+Scripts calling run_jobs() must do so under ``if __name__ == "__main__":``
+(worker processes re-import the script on Windows).
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import multiprocessing
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from athlete import aio, registry
+from athlete.archive import REPLAY_ENV
+from athlete.dataset import DatasetWriter
+from athlete.http_client import HttpClient
+from athlete.manifest import SeasonManifest, school_key
+from athlete.sidearm import (
+    parse_schedule_seasons,
+    parse_schedule_page,
+    schedule_season_url,
+    write_season_csvs,
+)
+
+# Where parsed tables go: the CSV tree, the Parquet dataset, or both
+SINKS = ("csv", "parquet", "both")
+
+# Per-process state, set up once per worker by _init_worker()
+_domain_slots = {}
+_client = None
+
+
+def _init_worker(slots):
+    global _domain_slots, _client
+    _domain_slots = slots
+    _client = None
+
+
+def client():
+    """The worker's HttpClient (one pooled session per process)."""
+    global _client
+    if _client is None:
+        _client = HttpClient()
+    return _client
+
+
+@contextmanager
+def domain_slot(url):
+    """Hold one of the domain's shared request slots while fetching ``url``."""
+    slot = _domain_slots.get(school_key(url))
+    if slot is None:
+        yield
+        return
+    slot.acquire()
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+def fetch(url):
+    with domain_slot(url):
+        return client().get_ok(url)
+
+
+# -----------------------------------------------------------------------------
+# Page-type runners: job -> summary dict
+# -----------------------------------------------------------------------------
+def run_schedule_job(job, per_host, full_refresh=False, sink="csv"):
+    """Every season of one school's sport -> <School>/<Gender>/<Sport>/<Year>/ CSVs."""
+    folder = registry.output_dir(job)
+    school = registry.job_domain(job)
+    manifest = SeasonManifest()
+    dataset = DatasetWriter("schedule") if sink != "csv" else None
+    summary = {"fetched": 0, "failed": 0, "skipped": 0}
+
+    seasons = parse_schedule_seasons(fetch(f"{job.base_url}/sports/{job.sport}/schedule").text)
+    if seasons is None:
+        summary["error"] = "no season dropdown"
+        return summary
+    if not full_refresh:
+        todo = manifest.pending(school, job.sport, "schedule", seasons)
+        summary["skipped"] = len(seasons) - len(todo)
+        seasons = todo
+
+    season_urls = [schedule_season_url(job.base_url, job.sport, s) for s in seasons]
+    results = aio.fetch_all(season_urls, fetch=fetch, per_host=per_host)
+    for season, result in zip(seasons, results):
+        if result.error is not None:
+            print(f"{job.school} {job.sport} {season}: failed to fetch {result.url} -- {result.error}")
+            summary["failed"] += 1
+            continue
+        record_data, schedule_data = parse_schedule_page(result.response.text)
+        paths = []
+        if sink != "parquet":
+            paths = write_season_csvs(folder, season, record_data, schedule_data)
+        if dataset is not None:
+            keys = (job.school, job.gender, job.folder, season)
+            dataset.add_dicts(*keys, f"{season}_record", record_data)
+            dataset.add_dicts(*keys, f"{season}_schedule", schedule_data or [])
+        if schedule_data is None:
+            # left pending, so the next run fetches the season again
+            print(f"{job.school} {job.sport} {season}: no schedule table on {result.url}")
+            summary["failed"] += 1
+            continue
+        manifest.mark_done(school, job.sport, "schedule", season, outputs=paths)
+        summary["fetched"] += 1
+
+    if dataset is not None:
+        dataset.flush()
+    manifest.save()
+    return summary
+
+
+PAGE_TYPES = {
+    "schedule": run_schedule_job,
+}
+
+
+def _run_job(job, per_host, full_refresh, sink="csv"):
+    start = time.perf_counter()
+    try:
+        summary = PAGE_TYPES[job.page_type](job, per_host, full_refresh, sink)
+    except Exception as err:  # one broken site must not take down the batch
+        summary = {"error": f"{type(err).__name__}: {err}"}
+    summary["elapsed"] = time.perf_counter() - start
+    return job, summary
+
+
+def interleave(jobs):
+    """Round-robin jobs across domains: a1, b1, c1, a2, b2, ..."""
+    by_domain = defaultdict(list)
+    for job in jobs:
+        by_domain[registry.job_domain(job)].append(job)
+    queues = list(by_domain.values())
+    ordered = []
+    while queues:
+        ordered.extend(q.pop(0) for q in queues)
+        queues = [q for q in queues if q]
+    return ordered
+
+
+def run_jobs(jobs, reg=None, processes=None, full_refresh=False, sink="csv"):
+    """
+    Run ``jobs`` on ``processes`` worker processes (default: CPU count, at most
+    one per job); ``processes=1`` runs them in this process. ``sink`` is one of
+    SINKS. Returns [(job, summary), ...] in completion order.
+    """
+    if sink not in SINKS:
+        raise ValueError(f"sink must be one of {SINKS}, not {sink!r}")
+    reg = reg or registry.load_registry()
+    jobs = interleave(jobs)
+    if not jobs:
+        return []
+    domains = {registry.job_domain(job) for job in jobs}
+    caps = {d: registry.per_domain_cap(reg, d) for d in domains}
+    per_host = max(caps.values())
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+
+    def report(job, summary, done):
+        status = summary.get("error") or (
+            f"{summary['fetched']} fetched, {summary['skipped']} up to date, "
+            f"{summary['failed']} failed")
+        print(f"[{done}/{len(jobs)}] {job.school} / {job.gender} / {job.folder} "
+              f"({job.page_type}): {status} in {summary['elapsed']:.1f}s")
+
+    start = time.perf_counter()
+    results = []
+    if processes <= 1:
+        _init_worker({d: threading.BoundedSemaphore(c) for d, c in caps.items()})
+        for job in jobs:
+            results.append(_run_job(job, per_host, full_refresh, sink))
+            report(*results[-1], len(results))
+    else:
+        with multiprocessing.Manager() as manager:
+            slots = {d: manager.BoundedSemaphore(c) for d, c in caps.items()}
+            with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                     initargs=(slots,)) as pool:
+                futures = [pool.submit(_run_job, job, per_host, full_refresh, sink) for job in jobs]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    report(*results[-1], len(results))
+
+    elapsed = time.perf_counter() - start
+    failed = sum("error" in s for _, s in results)
+    print(f"\n{len(results)} jobs on {processes} process(es) in {elapsed:.1f}s; "
+          f"{failed} failed; {len(domains)} domains")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.scheduler",
+                                     description="Run registry scrape jobs.")
+    parser.add_argument("--registry", default=None, help="registry JSON path")
+    parser.add_argument("--school", action="append", help="school folder name (repeatable)")
+    parser.add_argument("--sport", action="append", help="sport slug (repeatable)")
+    parser.add_argument("--gender", action="append", choices=["Men", "Women"])
+    parser.add_argument("--page-type", action="append", choices=sorted(PAGE_TYPES))
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--full-refresh", action="store_true",
+                        help="re-scrape seasons the manifest marks final")
+    parser.add_argument("--list", action="store_true", help="only print the jobs")
+    parser.add_argument("--replay", action="store_true",
+                        help="no network: re-parse every season from the HTML archive")
+    parser.add_argument("--sink", choices=SINKS, default="csv",
+                        help="write CSVs, the Parquet dataset (Dataset/), or both")
+    args = parser.parse_args(argv)
+    if args.replay:
+        os.environ[REPLAY_ENV] = "1"  # inherited by the worker processes
+        args.full_refresh = True
+
+    reg = registry.load_registry(args.registry)
+    for name in registry.unconfigured_schools(reg):
+        if not args.school or name in args.school:
+            note = reg["schools"][name].get("note")
+            print(f"Skipping {name}: no base_url in the registry" + (f" ({note})" if note else ""))
+    jobs = registry.expand_jobs(reg, args.school, args.sport, args.gender, args.page_type)
+
+    if args.list:
+        for job in interleave(jobs):
+            print(f"{job.school:24} {job.gender:6} {job.folder:12} {job.page_type:9} {job.base_url}/sports/{job.sport}")
+        print(f"{len(jobs)} jobs")
+        return 0
+
+    results = run_jobs(jobs, reg, args.processes, args.full_refresh, args.sink)
+    return 1 if any("error" in s for _, s in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""
+Season labels as the data trees use them ("2019", "2019-20", "2019_Fall").
+
+    from athlete.seasons import year_of
+    year_of("2019-20")    # 2019
+"""
+
+import re
+
+_YEAR_RE = re.compile(r"\d{4}")
+
+
+def year_of(label):
+    """First four-digit year in a season label ("2019-20" -> 2019), or None."""
+    m = _YEAR_RE.search(str(label))
+    return int(m.group(0)) if m else None
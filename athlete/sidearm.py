@@ -0,0 +1,255 @@
+"""
+Parsing helpers for Sidearm Sports schedule and roster pages.
+
+These are the exact steps the schedule scrapers used to run inline:
+read the season dropdown, pull the "season record" list and the grid
+schedule table, then write ``<season>_record.csv`` / ``<season>_schedule.csv``.
+
+Pages are parsed through athlete.parsing, which only builds the dropdown,
+record block and grid table (lxml + SoupStrainer) instead of the whole page.
+Pass ``parser=parsing.SLOW_PARSER, strained=False`` for the old full parse.
+"""
+
+import os
+import csv
+
+from bs4 import NavigableString
+
+from athlete import parsing
+
+# The grid view (?grid=true) renders the schedule in this table
+SCHEDULE_TABLE_CLASS = (
+    "sidearm-table sidearm-table-grid-template-1 "
+    "sidearm-table-grid-template-1-breakdown-large dataTable no-footer"
+)
+
+
+def schedule_season_url(base_url, sport, season):
+    """Grid-view schedule URL for one season, e.g. .../schedule/2019?grid=true"""
+    return f"{base_url}/sports/{sport}/schedule/{season}?grid=true"
+
+
+def parse_schedule_seasons(html, parser=None, strained=True):
+    """
+    Return the season keys (first 4 characters of each <option>) from the
+    ``sidearm-schedule-select-season`` dropdown, in page order.
+    Returns None if the page has no dropdown.
+    """
+    season_select = parsing.season_dropdown(html, "schedule", parser, strained)
+    if not season_select:
+        return None
+
+    seasons = []
+    for opt in season_select.find_all("option"):
+        season_text = opt.get_text(strip=True)[0:4]
+        if not season_text:
+            continue  # skip if it's blank or a placeholder
+        seasons.append(season_text)
+    return seasons
+
+
+def parse_record(soup):
+    """
+    Scrape the "season record" block.
+    Returns a list of dicts, e.g. [{"Category": "Overall", "Value": "15-6"}, ...]
+    """
+    record_data = []
+    record_div = soup.find("div", class_="sidearm-schedule-record")
+    if record_div:
+        ul = record_div.find("ul")
+        if ul:
+            for li in ul.find_all("li"):
+                spans = li.find_all("span", class_="flex-item-1")
+                if len(spans) == 2:
+                    category = spans[0].get_text(strip=True)
+                    value = spans[1].get_text(strip=True)
+                    record_data.append({"Category": category, "Value": value})
+    return record_data
+
+
+def parse_schedule_table(soup):
+    """
+    Scrape the grid schedule table into one dict per row/game.
+    Returns None if the table is missing (so callers can report it).
+    """
+    schedule_table = soup.find("table", class_=SCHEDULE_TABLE_CLASS)
+    if not schedule_table:
+        return None
+
+    # Column headers from <thead>
+    headers_row = []
+    thead = schedule_table.find("thead")
+    if thead:
+        headers_row = [th.get_text(strip=True) for th in thead.find_all("th")]
+
+    # Gather all <tr> outside the <thead>, as there's no <tbody>
+    schedule_data = []
+    for tr in schedule_table.find_all("tr"):
+        if tr.find_parent("thead"):
+            continue  # skip header row
+
+        cells = tr.find_all(["td", "th"])
+        row_texts = [c.get_text(strip=True) for c in cells]
+
+        # Zip headers with row cells if they match; else, label columns generically
+        if len(headers_row) == len(row_texts):
+            row_dict = dict(zip(headers_row, row_texts))
+        else:
+            row_dict = {f"col_{i}": val for i, val in enumerate(row_texts)}
+        schedule_data.append(row_dict)
+
+    return schedule_data
+
+
+def parse_schedule_page(html, parser=None, strained=True):
+    """
+    Parse one season page.
+    Returns (record_data, schedule_data); schedule_data is None if the
+    schedule table was not found.
+    """
+    strainer = parsing.SCHEDULE_STRAINER if strained else None
+    soup = parsing.soup(html, strainer, parser)
+    return parse_record(soup), parse_schedule_table(soup)
+
+
+def write_dict_csv(path, rows):
+    """Write a list of dicts to CSV (header from the first row), or an empty file."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if not rows:
+            f.write("")
+            return
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def write_season_csvs(root_folder, season, record_data, schedule_data):
+    """
+    Write <root_folder>/<season>/<season>_record.csv and _schedule.csv.
+    Returns the two paths.
+    """
+    season_folder = os.path.join(root_folder, season)
+    os.makedirs(season_folder, exist_ok=True)
+
+    record_csv_path = os.path.join(season_folder, f"{season}_record.csv")
+    schedule_csv_path = os.path.join(season_folder, f"{season}_schedule.csv")
+
+    write_dict_csv(record_csv_path, record_data)
+    write_dict_csv(schedule_csv_path, schedule_data or [])
+    return record_csv_path, schedule_csv_path
+
+
+# ---------------------------------------------------------------------------
+# Roster pages (grid view)
+# ---------------------------------------------------------------------------
+# The roster scraper used to read the grid through WebDriver, whose ``.text``
+# returns *rendered* text. To write the same CSVs from raw HTML we apply the
+# two CSS effects that show up in the saved files: the grid theme renders
+# <th> labels uppercase, and visually-hidden elements (the table caption,
+# screen-reader labels) read as "".
+HIDDEN_CLASSES = {"hide", "hidden", "sr-only", "visually-hidden", "offscreen", "sidearm-visually-hidden"}
+ROSTER_GRID_VIEW = "2"  # value of the "Grid" entry in the view-template dropdown
+
+
+def _is_hidden(tag):
+    if set(tag.get("class") or []) & HIDDEN_CLASSES:
+        return True
+    style = (tag.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def visible_text(tag):
+    """
+    Text of ``tag`` as WebDriver's ``.text`` reads it: text nodes joined as
+    they are (``<a>John</a>Smith`` -> "JohnSmith"), hidden parts dropped,
+    <br> read as a line break and every run of whitespace collapsed to one
+    space.
+    """
+    if tag is None or _is_hidden(tag):
+        return ""
+    parts = []
+    for node in tag.descendants:
+        is_break = getattr(node, "name", None) == "br"
+        # exact type: skips comments, doctype, <script>/<style> contents
+        if not is_break and (type(node) is not NavigableString
+                             or node.parent.name in ("script", "style")):
+            continue
+        parent, hidden = (node if is_break else node.parent), False
+        while parent is not None and parent is not tag:
+            if _is_hidden(parent):
+                hidden = True
+                break
+            parent = parent.parent
+        if not hidden:
+            parts.append("\n" if is_break else node)
+    return " ".join("".join(parts).split())
+
+
+def roster_season_url(base_url, sport, option_value, season_text):
+    """
+    Grid-view URL for one entry of the ``ddl_past_rosters`` dropdown.
+    Option values are normally site paths (/sports/<sport>/roster/2019-20);
+    otherwise fall back to the season key at the start of the option text.
+    """
+    value = (option_value or "").strip()
+    if value.startswith(("/", "http")):
+        url = value if value.startswith("http") else f"{base_url.rstrip('/')}{value}"
+    else:
+        url = f"{base_url.rstrip('/')}/sports/{sport}/roster/{season_text.split(' ')[0]}"
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}view={ROSTER_GRID_VIEW}"
+
+
+def parse_roster_seasons(html, parser=None):
+    """[(season_text, option_value), ...] from the past-rosters dropdown; None if absent."""
+    select = parsing.season_dropdown(html, "roster", parser)
+    if not select:
+        return None
+    return [(opt.get_text(strip=True), opt.get("value", "")) for opt in select.find_all("option")]
+
+
+def parse_roster_grid(html, parser=None):
+    """
+    (caption_text, header_texts, rows) of the grid roster table, or None if
+    the page has no grid table. Empty rows are dropped, as before.
+    """
+    table = parsing.soup(html, parsing.ROSTER_STRAINER, parser).find("table")
+    if table is None:
+        return None
+
+    caption_text = visible_text(table.find("caption"))
+
+    header_texts = []
+    thead = table.find("thead")
+    if thead:
+        header_texts = [visible_text(th).upper() for th in thead.find_all("th")]
+
+    all_rows = []
+    tbody = table.find("tbody")
+    for tr in (tbody.find_all("tr") if tbody else []):
+        row_data = [visible_text(td) for td in tr.find_all("td")]
+        if any(row_data):
+            all_rows.append(row_data)
+    return caption_text, header_texts, all_rows
+
+
+def roster_csv_path(folder, season_text):
+    safe_season_name = (
+        season_text
+        .replace("/", "_")
+        .replace("\\", "_")
+        .replace(" ", "_")
+        .replace(":", "_")
+    )
+    return os.path.join(folder, f"{safe_season_name}.csv")
+
+
+def write_roster_csv(path, caption_text, header_texts, all_rows):
+    """Caption row, then header row, then data rows (the roster.py layout)."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([caption_text])
+        writer.writerow(header_texts)
+        for row_data in all_rows:
+            writer.writerow(row_data)
@@ -0,0 +1,335 @@
+"""
+Compact columnar store for Performance Stats/.
+
+The tree is 8,492 small CSVs (``2014-15_category-leaders-ast.csv``,
+``2019_game-comparison.csv``, ...) that repeat the same player names,
+categories and headers in every season. Reading a sport's history means a
+pandas parse per file and a DataFrame full of Python strings. Here each
+(gender, sport) is one Parquet file
+
+    Dataset/stats_store/gender=<Gender>/sport=<Sport>/data.parquet
+
+holding every data cell of every season as
+
+    season   dictionary   "2014-15"
+    table    dictionary   "category-leaders-ast" (file name minus the season prefix)
+    row      int32        data row, from 0
+    col      int16        column position
+    column   dictionary   column name, as pd.read_csv would give it
+    text     dictionary   the cell exactly as in the CSV
+    number   float64      the cell parsed as a number at build time, else NaN
+
+with one row group per season. load_stats() reads the dictionaries straight
+into pandas categoricals. load_tables() turns a sport's full history into one
+wide DataFrame per table, seasons stacked: numeric columns come back as the
+float64 parsed at build time and text columns as categoricals. That takes
+milliseconds, in a fraction of the memory of the parsed CSVs. Tables with a
+header and no rows have no cells here.
+
+    python -m athlete.stats_store build            # only partitions with newer CSVs
+    python -m athlete.stats_store build --force --sport Basketball
+    python -m athlete.stats_store info
+
+    from athlete.stats_store import load_stats, load_tables, stats_table
+    cells = load_stats("Men", "Basketball")                  # long, categorical
+    tables = load_tables("Men", "Basketball")                # {table: wide frame}
+    table = stats_table("Men", "Basketball", "2014-15", "category-leaders-ast")
+"""
+
+import os
+import csv
+import sys
+import argparse
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from athlete.dataset import DEFAULT_DATASET_ROOT, REPO_ROOT, _as_set, _pyarrow
+
+DEFAULT_SOURCE = os.path.join(REPO_ROOT, "Performance Stats")
+DEFAULT_STORE_ROOT = os.path.join(DEFAULT_DATASET_ROOT, "stats_store")
+
+PARTITION_KEYS = ("gender", "sport")
+DATA_FILE = "data.parquet"
+COLUMNS = ["season", "table", "row", "col", "column", "text", "number"]
+DICTIONARY_COLUMNS = ["season", "table", "column", "text"]
+
+
+def partition_path(gender, sport, root=DEFAULT_STORE_ROOT):
+    return os.path.join(root, f"gender={gender}", f"sport={sport}", DATA_FILE)
+
+
+def partitions(root=DEFAULT_STORE_ROOT, gender=None, sport=None):
+    """[(gender, sport, path), ...] of the built partitions, filtered."""
+    genders, sports = _as_set(gender), _as_set(sport)
+    found = []
+    for g in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+        if not g.startswith("gender=") or (genders and g[7:] not in genders):
+            continue
+        for s in sorted(os.listdir(os.path.join(root, g))):
+            path = os.path.join(root, g, s, DATA_FILE)
+            if s.startswith("sport=") and (not sports or s[6:] in sports) and os.path.exists(path):
+                found.append((g[7:], s[6:], path))
+    return found
+
+
+# -----------------------------------------------------------------------------
+# Building
+# -----------------------------------------------------------------------------
+def _table_name(season, rel):
+    """``2014-15_category-leaders-ast.csv`` -> ``category-leaders-ast``; sub folders kept."""
+    parts = rel.replace(os.sep, "/")[:-4].split("/")
+    if parts[-1].startswith(season + "_"):
+        parts[-1] = parts[-1][len(season) + 1:]
+    return "/".join(parts)
+
+
+def _source_files(sport_dir):
+    """{season: [(table, path), ...]} for every CSV under a sport folder, sorted."""
+    found = defaultdict(list)
+    for season in sorted(os.listdir(sport_dir)):
+        season_dir = os.path.join(sport_dir, season)
+        if not os.path.isdir(season_dir):
+            continue
+        for dirpath, _, files in os.walk(season_dir):
+            for name in files:
+                if name.lower().endswith(".csv"):
+                    path = os.path.join(dirpath, name)
+                    found[season].append((_table_name(season, os.path.relpath(path, season_dir)), path))
+        found[season].sort()
+    return dict(found)
+
+
+def _column_names(header):
+    """Header names as pd.read_csv gives them: blanks become "Unnamed: i", repeats get .1, .2, ..."""
+    names, seen = [], {}
+    for i, name in enumerate(header):
+        name = name or f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _season_cells(files):
+    """Column lists of every data cell in one season's files."""
+    cols = {name: [] for name in COLUMNS[:-1]}
+    for table, path in files:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        if not rows:
+            continue
+        header = _column_names(rows[0])
+        for r, row in enumerate(rows[1:]):
+            for c, value in enumerate(row):
+                cols["table"].append(table)
+                cols["row"].append(r)
+                cols["col"].append(c)
+                cols["column"].append(header[c] if c < len(header) else f"Unnamed: {c}")
+                cols["text"].append(value)
+    return cols
+
+
+def build_partition(sport_dir, path):
+    """Rebuild one partition file from a Performance Stats/<Gender>/<Sport> folder; returns cells written."""
+    pa, pq = _pyarrow()
+    schema = pa.schema([("season", pa.string()), ("table", pa.string()), ("row", pa.int32()),
+                        ("col", pa.int16()), ("column", pa.string()), ("text", pa.string()),
+                        ("number", pa.float64())])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    with pq.ParquetWriter(tmp, schema, compression="zstd", use_dictionary=DICTIONARY_COLUMNS) as writer:
+        for season, files in _source_files(sport_dir).items():
+            cols = _season_cells(files)
+            n = len(cols["text"])
+            if not n:
+                continue
+            # Parse every cell once; text that is not a number stays NaN
+            number = pd.to_numeric(pd.Series(cols["text"], dtype=object), errors="coerce")
+            writer.write_table(pa.table(dict(cols, season=[season] * n,
+                                             number=number.to_numpy(np.float64)), schema=schema))
+            count += n
+    os.replace(tmp, path)
+    return count
+
+
+def _newest_mtime(folder):
+    newest = 0
+    for dirpath, _, files in os.walk(folder):
+        for name in files:
+            newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime_ns)
+    return newest
+
+
+def build(src=DEFAULT_SOURCE, root=DEFAULT_STORE_ROOT, gender=None, sport=None, force=False,
+          verbose=False):
+    """
+    Build the partitions for the sport folders under ``src``. A partition newer
+    than all of its CSVs is kept unless ``force``. Returns [(gender, sport, cells)]
+    of the rebuilt ones.
+    """
+    genders, sports = _as_set(gender), _as_set(sport)
+    built = []
+    for g in sorted(os.listdir(src)):
+        if not os.path.isdir(os.path.join(src, g)) or (genders and g not in genders):
+            continue
+        for s in sorted(os.listdir(os.path.join(src, g))):
+            sport_dir = os.path.join(src, g, s)
+            if not os.path.isdir(sport_dir) or (sports and s not in sports):
+                continue
+            path = partition_path(g, s, root)
+            if (not force and os.path.exists(path)
+                    and os.stat(path).st_mtime_ns > _newest_mtime(sport_dir)):
+                continue
+            count = build_partition(sport_dir, path)
+            built.append((g, s, count))
+            if verbose:
+                print(f"{g}/{s}: {count} cells, {os.path.getsize(path) / 1e6:.2f} MB")
+    return built
+
+
+# -----------------------------------------------------------------------------
+# Reading
+# -----------------------------------------------------------------------------
+def _concat(frames):
+    """Concatenate frames, merging the categories of categorical columns."""
+    if len(frames) == 1:
+        return frames[0]
+    out = {}
+    for name in frames[0].columns:
+        if isinstance(frames[0][name].dtype, pd.CategoricalDtype):
+            out[name] = pd.api.types.union_categoricals([f[name] for f in frames])
+        else:
+            out[name] = np.concatenate([f[name].to_numpy() for f in frames])
+    return pd.DataFrame(out)
+
+
+def load_stats(gender=None, sport=None, season=None, table=None, root=DEFAULT_STORE_ROOT):
+    """
+    Long DataFrame (gender, sport, season, table, row, col, column, text, number)
+    of the matching cells; every string column is categorical. season/table
+    take a value or a list; season filters skip whole row groups.
+    """
+    pa, pq = _pyarrow()
+    filters = []
+    if season is not None:
+        filters.append(("season", "in", sorted(_as_set(season))))
+    if table is not None:
+        filters.append(("table", "in", sorted(_as_set(table))))
+
+    frames = []
+    for g, s, path in partitions(root, gender, sport):
+        df = pq.read_table(path, filters=filters or None, read_dictionary=DICTIONARY_COLUMNS).to_pandas()
+        zeros = np.zeros(len(df), dtype=np.int8)
+        df.insert(0, "sport", pd.Categorical.from_codes(zeros, [s]))
+        df.insert(0, "gender", pd.Categorical.from_codes(zeros, [g]))
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame({"gender": pd.Categorical([]), "sport": pd.Categorical([]),
+                             "season": pd.Categorical([]), "table": pd.Categorical([]),
+                             "row": np.zeros(0, np.int32), "col": np.zeros(0, np.int16),
+                             "column": pd.Categorical([]), "text": pd.Categorical([]),
+                             "number": np.zeros(0)})
+    return _concat(frames)
+
+
+def _wide(idx, seasons, rows, columns, texts, numbers, dtypes, names, empty):
+    """One table's cells (positions ``idx``, in season/row/col order) as a wide DataFrame."""
+    key = seasons[idx].astype(np.int64) * (int(rows[idx].max()) + 1) + rows[idx]
+    row_id, first = pd.factorize(key)
+    n_rows = len(first)
+    season_codes = np.empty(n_rows, dtype=seasons.dtype)
+    season_codes[row_id] = seasons[idx]
+    data = {"season": pd.Categorical.from_codes(season_codes, dtype=dtypes["season"])}
+
+    col_id, col_codes = pd.factorize(columns[idx])
+    by_col = np.argsort(col_id, kind="stable")
+    for j, part in enumerate(np.split(by_col, np.flatnonzero(np.diff(col_id[by_col])) + 1)):
+        sel = idx[part]
+        r, txt, num = row_id[part], texts[sel], numbers[sel]
+        filled = txt != empty
+        if np.isnan(num[filled]).any():
+            codes = np.full(n_rows, -1, dtype=texts.dtype)
+            codes[r[filled]] = txt[filled]
+            values = pd.Categorical.from_codes(codes, dtype=dtypes["text"])
+        else:
+            values = np.full(n_rows, np.nan)
+            values[r] = num
+        data[names[col_codes[j]]] = values
+    return pd.DataFrame(data)
+
+
+def load_tables(gender, sport, season=None, table=None, root=DEFAULT_STORE_ROOT):
+    """
+    {table: wide DataFrame} of one sport's history: a categorical ``season``
+    column, then the table's columns across all seasons. A column whose every
+    non-empty cell is a number is float64 (parsed at build time); the others
+    are categorical text. All text columns share the sport's one dictionary,
+    so a name repeated across tables and seasons is stored once. Empty cells
+    are missing.
+    """
+    cells = load_stats(gender, sport, season, table, root)
+    if cells.empty:
+        return {}
+    seasons = cells["season"].cat.codes.to_numpy()
+    tables = cells["table"].cat.codes.to_numpy()
+    rows = cells["row"].to_numpy()
+    columns = cells["column"].cat.codes.to_numpy()
+    texts = cells["text"].cat.codes.to_numpy()
+    numbers = cells["number"].to_numpy()
+    dtypes = {"season": cells["season"].dtype, "text": cells["text"].dtype}
+    names = list(cells["column"].cat.categories)
+    empty = cells["text"].cat.categories.get_indexer([""])[0]  # -1 if no cell is empty
+
+    table_names = list(cells["table"].cat.categories)
+    order = np.argsort(tables, kind="stable")
+    found = {}
+    for idx in np.split(order, np.flatnonzero(np.diff(tables[order])) + 1):
+        found[table_names[tables[idx[0]]]] = _wide(idx, seasons, rows, columns, texts, numbers,
+                                                   dtypes, names, empty)
+    return dict(sorted(found.items()))
+
+
+def stats_table(gender, sport, season, table, root=DEFAULT_STORE_ROOT):
+    """One season's table as a wide DataFrame (see load_tables()); None if not stored."""
+    found = load_tables(gender, sport, season, table, root)
+    if table not in found:
+        return None
+    return found[table].drop(columns="season")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.stats_store",
+                                     description="Compact columnar store for Performance Stats.")
+    parser.add_argument("--root", default=DEFAULT_STORE_ROOT)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="(re)build partitions from the CSV tree")
+    p.add_argument("--src", default=DEFAULT_SOURCE)
+    p.add_argument("--gender", action="append")
+    p.add_argument("--sport", action="append")
+    p.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    sub.add_parser("info", help="cells and sizes per partition")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        built = build(args.src, args.root, args.gender, args.sport, args.force, verbose=True)
+        print(f"Rebuilt {len(built)} partition(s)")
+        return 0
+    pa, pq = _pyarrow()
+    total = 0
+    for g, s, path in partitions(args.root):
+        meta = pq.ParquetFile(path).metadata
+        size = os.path.getsize(path)
+        total += size
+        print(f"{g:6} {s:20} {meta.num_rows:9d} cells {meta.num_row_groups:4d} seasons {size / 1e6:7.2f} MB")
+    print(f"{total / 1e6:.2f} MB in total")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
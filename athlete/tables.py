@@ -0,0 +1,210 @@
+"""
+DataFrames straight from an already-parsed BeautifulSoup ``<table>``.
+
+The scrapers used ``pd.read_html(str(table))[0]``: serialize a node we had
+already parsed back to HTML, then let pandas parse it a second time. This
+module walks the existing tree instead and reproduces what read_html does with
+a table:
+
+  * header rows = ``<thead>`` rows, or else the leading rows made only of <th>;
+    body = ``<tbody>`` rows + direct ``<tr>`` children; footer = ``<tfoot>`` rows
+  * colspan / rowspan are expanded (values repeated), ragged rows padded
+  * ``<br>`` is a line break, so ``x<br>y`` reads as "x y"; cell text is
+    whitespace-normalized the same way
+  * ``display:none`` elements and ``<style>`` contents are ignored
+  * the resulting text grid goes through pandas' own TextParser with
+    read_html's options (thousands=",", header inference), so dtypes, NaN
+    handling, duplicate-column mangling and multi-row headers are unchanged.
+
+Only the second HTML parse is gone; the DataFrames are the same.
+"""
+
+import re
+
+from bs4 import NavigableString, CData
+from pandas.io.parsers import TextParser
+
+# pandas.io.html._remove_whitespace
+_RE_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+# read_html's default match=".+": a table needs some text to be returned
+_RE_ANY_TEXT = re.compile(".+")
+
+_TEXT_TYPES = (NavigableString, CData)
+
+
+def _remove_whitespace(s):
+    return _RE_WHITESPACE.sub(" ", s.strip())
+
+
+def _is_hidden(tag):
+    return "display:none" in (tag.get("style") or "").replace(" ", "")
+
+
+class _TableReader:
+    """One <table>, read the way pandas' bs4/lxml readers read it."""
+
+    def __init__(self, table):
+        self.table = table
+        self.has_hidden = False
+        self.has_br = False
+        # One walk over the table instead of a CSS select per section: every
+        # <tr> in document order, plus whether any hidden element, <style> or
+        # <br> means the slower node-by-node text path is needed.
+        self.trs = []
+        for node in table.descendants:
+            name = getattr(node, "name", None)
+            if name is None:
+                continue
+            if name == "tr":
+                self.trs.append(node)
+            if name == "br":
+                self.has_br = True
+            if not self.has_hidden and (name == "style" or _is_hidden(node)):
+                self.has_hidden = True
+
+    def visible(self, tag):
+        if not self.has_hidden:
+            return True
+        while tag is not None and tag is not self.table:
+            if _is_hidden(tag):
+                return False
+            tag = tag.parent
+        return True
+
+    def text(self, td):
+        if not (self.has_hidden or self.has_br):
+            return td.get_text()
+        parts = []
+        for node in td.descendants:
+            # read_html turns every <br> into a "\n" before reading the text
+            if type(node) in _TEXT_TYPES:
+                text = node
+            elif getattr(node, "name", None) == "br":
+                text = "\n"
+            else:
+                continue
+            parent, keep = node.parent, True
+            while parent is not td:
+                if parent.name == "style" or _is_hidden(parent):
+                    keep = False
+                    break
+                parent = parent.parent
+            if keep:
+                parts.append(text)
+        return "".join(parts)
+
+    def cells(self, tr):
+        return [td for td in tr.children
+                if getattr(td, "name", None) in ("td", "th") and self.visible(td)]
+
+    def sections(self):
+        """(header, body, footer) text grids."""
+        # Same row sets as read_html's bs4 reader: "thead tr", "tbody tr" plus
+        # the table's own <tr> children, and "tfoot tr".
+        header_rows, tbody_rows, root_rows, footer_rows = [], [], [], []
+        ancestors = {}
+        for tr in self.trs:
+            if not self.visible(tr):
+                continue
+            parent = tr.parent
+            names = ancestors.get(id(parent))
+            if names is None:
+                names, node = set(), parent
+                while node is not None:
+                    names.add(node.name)
+                    node = node.parent
+                ancestors[id(parent)] = names
+            if "thead" in names:
+                header_rows.append(tr)
+            if "tbody" in names:
+                tbody_rows.append(tr)
+            if "tfoot" in names:
+                footer_rows.append(tr)
+            if parent is self.table:
+                root_rows.append(tr)
+        body_rows = tbody_rows + root_rows
+
+        if not header_rows:
+            # No <thead>: leading all-<th> rows are the header
+            while body_rows and all(td.name == "th" for td in self.cells(body_rows[0])):
+                header_rows.append(body_rows.pop(0))
+
+        return self.expand(header_rows), self.expand(body_rows), self.expand(footer_rows)
+
+    def expand(self, rows):
+        """pandas' _expand_colspan_rowspan: rows of <td>/<th> -> rows of text."""
+        all_texts = []
+        remainder = []  # (index, text, rows left)
+        for tr in rows:
+            texts, next_remainder, index = [], [], 0
+            for td in self.cells(tr):
+                while remainder and remainder[0][0] <= index:
+                    prev_i, prev_text, prev_rowspan = remainder.pop(0)
+                    texts.append(prev_text)
+                    if prev_rowspan > 1:
+                        next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+                    index += 1
+
+                text = _remove_whitespace(self.text(td))
+                rowspan = int(td.get("rowspan") or 1)
+                colspan = int(td.get("colspan") or 1)
+                for _ in range(colspan):
+                    texts.append(text)
+                    if rowspan > 1:
+                        next_remainder.append((index, text, rowspan - 1))
+                    index += 1
+
+            for prev_i, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+            all_texts.append(texts)
+            remainder = next_remainder
+
+        # rows that only exist because of a rowspan from above
+        while remainder:
+            texts, next_remainder = [], []
+            for prev_i, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+            all_texts.append(texts)
+            remainder = next_remainder
+        return all_texts
+
+
+def table_rows(table):
+    """(header, body, footer) lists of cell-text rows for a parsed <table>."""
+    return _TableReader(table).sections()
+
+
+def table_to_frame(table):
+    """
+    DataFrame for a parsed <table> Tag, equal to ``pd.read_html(str(table))[0]``.
+    Raises the same ValueError as read_html for empty or hidden tables.
+    """
+    if _is_hidden(table) or table.find(string=_RE_ANY_TEXT) is None:
+        raise ValueError("No tables found matching pattern '.+'")
+
+    head, body, foot = table_rows(table)
+
+    header = None
+    if head:
+        body = head + body
+        if len(head) == 1:
+            header = 0
+        else:
+            # ignore all-empty-text rows
+            header = [i for i, row in enumerate(head) if any(text for text in row)]
+    if foot:
+        body += foot
+
+    # fill out "ragged" rows
+    if body:
+        width = max(len(row) for row in body)
+        body = [row + [""] * (width - len(row)) for row in body]
+
+    with TextParser(body, header=header, index_col=None, skiprows=None,
+                    parse_dates=False, thousands=",", decimal=".", converters=None,
+                    na_values=None, keep_default_na=True) as parser:
+        return parser.read()
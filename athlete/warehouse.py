@@ -0,0 +1,644 @@
+"""
+Embedded SQLite warehouse of the whole data tree.
+
+The aggregation scripts each walk and parse the raw folders again. One ingest
+loads every tree into ``warehouse.sqlite`` at the repo root instead, as typed
+tables keyed and indexed on (school, gender, sport, year):
+
+    records           Schedule/<School>/<Gender>/<Sport>/<Season>/*_record.csv
+    record_items        the same files, one row per Category/Value line
+    games             Schedule/.../*_schedule.csv
+    standings         Standing/<Gender>/<Sport>/<Year>.csv
+    standing_scores   Standing/Score data.csv
+    rosters           Roster/<Gender>/<Sport>/<Season>_..._Roster.csv
+    coaches           Coaches/<Gender>/<Sport>/<Season>_<Sport>.csv
+    stat_tables       Performance Stats/<Gender>/<Sport>/<Season>/.../<table>.csv
+    stat_rows           (header and rows as JSON arrays; the tables vary too much
+                        for fixed columns)
+    awards            Awards/<Gender>/<Sport>.csv|.xlsx
+    ncaa              NCAA/<Gender>/<Sport>.xlsx
+    expenses          Expense Data/<School>/ (EADA total + operating expense sheets)
+
+``season`` is the label the tree uses ("2019", "2019-20"); ``year`` is its
+first calendar year as an integer. The queries behind All Rankings.py,
+Grinnell Ranking.py, School_combined_standing.py, Combine_schedule.py and
+combine_player.py are below (record_pcts(), standings_ranked(), ...).
+
+    python -m athlete.warehouse ingest                 # every tree
+    python -m athlete.warehouse ingest --tree standings --tree schedule
+    python -m athlete.warehouse info
+    python -m athlete.warehouse sql "SELECT sport, COUNT(*) FROM games GROUP BY sport"
+
+The database file can also be opened from DuckDB (``ATTACH ... (TYPE sqlite)``)
+or Power BI's ODBC driver. xlsx sheets need openpyxl; without it those files
+are skipped and reported.
+"""
+
+import os
+import re
+import csv
+import sys
+import json
+import time
+import sqlite3
+import argparse
+
+from athlete.seasons import year_of
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB_PATH = os.path.join(REPO_ROOT, "warehouse.sqlite")
+
+SCHEMA_VERSION = 1
+KEY = ("school", "gender", "sport", "year")
+# Trees without a school level are Grinnell's own pages
+DEFAULT_SCHOOL = "Grinnell"
+
+TABLES = {
+    "records": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER,
+        overall TEXT, pct REAL, conf TEXT, cpct REAL, streak TEXT,
+        home TEXT, away TEXT, neutral TEXT""",
+    "record_items": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER,
+        position INTEGER, category TEXT, value TEXT""",
+    "games": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER, game INTEGER,
+        date TEXT, time TEXT, at TEXT, opponent TEXT, location TEXT, tv TEXT,
+        radio TEXT, tournament TEXT, result TEXT, links TEXT""",
+    "standings": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER, position INTEGER,
+        conf TEXT, overall TEXT, cpts INTEGER, cpct REAL, pct REAL, streak TEXT,
+        home TEXT, away TEXT, neutral TEXT""",
+    "standing_scores": """
+        school TEXT, gender TEXT, sport TEXT, year INTEGER, scores REAL""",
+    "rosters": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER, source TEXT,
+        line INTEGER, number TEXT, name TEXT, position TEXT, height TEXT, weight TEXT,
+        class_year TEXT, hometown_high_school TEXT, captain TEXT, bats_throws TEXT""",
+    "coaches": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER, line INTEGER,
+        name TEXT, title TEXT, email TEXT, phone TEXT, office TEXT""",
+    "stat_tables": """
+        id INTEGER PRIMARY KEY, school TEXT, gender TEXT, sport TEXT, season TEXT,
+        year INTEGER, name TEXT, columns TEXT""",
+    "stat_rows": """
+        table_id INTEGER REFERENCES stat_tables(id), line INTEGER, cells TEXT""",
+    "awards": """
+        school TEXT, gender TEXT, sport TEXT, year INTEGER, name TEXT, award TEXT,
+        level TEXT, team TEXT, position TEXT, source TEXT""",
+    "ncaa": """
+        school TEXT, gender TEXT, sport TEXT, season TEXT, year INTEGER,
+        mwc_champion TEXT, ncaa_teams TEXT, ncaa_finish TEXT, ncaa_rounds TEXT,
+        extra TEXT""",
+    "expenses": """
+        school TEXT, gender TEXT, sport TEXT, year INTEGER, school_folder TEXT,
+        unitid INTEGER, total_expense REAL, operating_expense REAL, undergrads INTEGER""",
+    "ingest_log": """
+        tree TEXT PRIMARY KEY, files INTEGER, rows INTEGER, skipped INTEGER,
+        seconds REAL, ingested_at REAL, note TEXT""",
+}
+
+INDEXES = [
+    *[f"CREATE INDEX IF NOT EXISTS ix_{t}_key ON {t} (school, gender, sport, year)"
+      for t in TABLES if t not in ("stat_rows", "ingest_log")],
+    # The ranking queries partition by (gender, sport, season)
+    "CREATE INDEX IF NOT EXISTS ix_records_group ON records (gender, sport, season)",
+    "CREATE INDEX IF NOT EXISTS ix_standings_group ON standings (gender, sport, season)",
+    "CREATE INDEX IF NOT EXISTS ix_stat_rows_table ON stat_rows (table_id, line)",
+]
+
+
+# -----------------------------------------------------------------------------
+# Small parsing helpers
+# -----------------------------------------------------------------------------
+def to_float(text):
+    """Float of "0.571", ".571" or "57.1%"; None if it isn't a number."""
+    try:
+        return float(str(text).replace("%", ""))
+    except ValueError:
+        return None
+
+
+def to_int(text):
+    value = to_float(text)
+    return int(value) if value is not None and value == value else None
+
+
+def _read_rows(path, skip=0):
+    """CSV rows without blank lines (as pandas reads them); [] for an empty file."""
+    with open(path, "r", newline="", encoding="utf-8-sig", errors="replace") as f:
+        for _ in range(skip):
+            f.readline()
+        return [row for row in csv.reader(f) if row]
+
+
+def _subdirs(path):
+    try:
+        return sorted(e.name for e in os.scandir(path) if e.is_dir() and not e.name.startswith(("_", ".")))
+    except OSError:
+        return []
+
+
+def _files(path, suffixes=(".csv",)):
+    try:
+        return sorted(e.name for e in os.scandir(path)
+                      if e.is_file() and e.name.lower().endswith(suffixes) and not e.name.startswith(".~"))
+    except OSError:
+        return []
+
+
+def _mapped(header, mapping):
+    """{column index: field} for the header names a mapping knows."""
+    found = {}
+    for i, name in enumerate(header):
+        field = mapping(name.strip().upper())
+        if field and field not in found.values():
+            found[i] = field
+    return found
+
+
+def _pick(row, fields, index):
+    values = dict.fromkeys(fields)
+    for i, field in index.items():
+        if i < len(row):
+            values[field] = row[i]
+    return [values[f] for f in fields]
+
+
+# -----------------------------------------------------------------------------
+# Tree loaders: root -> {table: [row tuples]}, files, skipped, note
+# -----------------------------------------------------------------------------
+GAME_COLUMNS = {"DATE": "date", "TIME": "time", "AT": "at", "OPPONENT": "opponent",
+                "LOCATION": "location", "TV": "tv", "RADIO": "radio",
+                "TOURNAMENT": "tournament", "RESULT": "result", "LINKS": "links"}
+GAME_FIELDS = list(GAME_COLUMNS.values())
+
+
+def load_schedule(root):
+    """records, record_items and games from Schedule/<School>/<Gender>/<Sport>/<Season>/."""
+    base = os.path.join(root, "Schedule")
+    out = {"records": [], "record_items": [], "games": []}
+    files = 0
+    for school in _subdirs(base):
+        for gender in _subdirs(os.path.join(base, school)):
+            for sport in _subdirs(os.path.join(base, school, gender)):
+                sport_dir = os.path.join(base, school, gender, sport)
+                for season in _subdirs(sport_dir):
+                    key = (school, gender, sport, season, year_of(season))
+                    season_dir = os.path.join(sport_dir, season)
+                    for name in _files(season_dir):
+                        rows = _read_rows(os.path.join(season_dir, name))
+                        files += 1
+                        lower = name.lower()
+                        if "record" in lower:
+                            _add_record(out, key, rows)
+                        elif "schedule" in lower and rows:
+                            index = _mapped(rows[0], GAME_COLUMNS.get)
+                            out["games"].extend(key + (n,) + tuple(_pick(r, GAME_FIELDS, index))
+                                                for n, r in enumerate(rows[1:], start=1))
+    return out, files, 0, None
+
+
+def _add_record(out, key, rows):
+    # Category/Value lines; Pct and CPct sit on lines 3 and 5 of the file
+    # (the label is "PCT" on some sites and "OverallPCT"/"ConfPCT" on others)
+    items = [(r[0], r[1] if len(r) > 1 else None) for r in rows[1:]]
+    out["record_items"].extend(key + (i, c, v) for i, (c, v) in enumerate(items, start=1))
+    if not items:
+        return
+    value = lambda i: items[i - 1][1] if len(items) >= i else None
+    pct = to_float(value(2)) if len(rows) >= 5 else None
+    cpct = to_float(value(4)) if len(rows) >= 5 else None
+    out["records"].append(key + (value(1), pct, value(3), cpct, value(5),
+                                 value(6), value(7), value(8)))
+
+
+STANDING_COLUMNS = {"SCHOOL": "school", "CONF": "conf", "OVERALL": "overall", "CPTS": "cpts",
+                    "CPCT.": "cpct", "PCT.": "pct", "STREAK": "streak", "HOME": "home",
+                    "AWAY": "away", "NEUTRAL": "neutral"}
+STANDING_FIELDS = list(STANDING_COLUMNS.values())
+
+
+def load_standings(root):
+    """standings from Standing/<Gender>/<Sport>/<Year>.csv and standing_scores."""
+    base = os.path.join(root, "Standing")
+    out = {"standings": [], "standing_scores": []}
+    files = 0
+    for gender in _subdirs(base):
+        for sport in _subdirs(os.path.join(base, gender)):
+            sport_dir = os.path.join(base, gender, sport)
+            for name in _files(sport_dir):
+                season = os.path.splitext(name)[0]
+                rows = _read_rows(os.path.join(sport_dir, name))
+                files += 1
+                if not rows:
+                    continue
+                index = _mapped(rows[0], STANDING_COLUMNS.get)
+                for n, row in enumerate(rows[1:], start=1):
+                    v = dict(zip(STANDING_FIELDS, _pick(row, STANDING_FIELDS, index)))
+                    out["standings"].append((
+                        v["school"], gender, sport, season, year_of(season), n, v["conf"],
+                        v["overall"], to_int(v["cpts"]) if v["cpts"] else None,
+                        to_float(v["cpct"] or ""), to_float(v["pct"] or ""), v["streak"],
+                        v["home"], v["away"], v["neutral"]))
+
+    scores = os.path.join(base, "Score data.csv")
+    if os.path.exists(scores):
+        rows = _read_rows(scores)
+        files += 1
+        index = _mapped(rows[0], lambda h: h.lower() if h in ("YEAR", "SCHOOL", "SPORT", "GENDER", "SCORES") else None)
+        for row in rows[1:]:
+            v = dict(zip(("year", "school", "sport", "gender", "scores"),
+                         _pick(row, ("year", "school", "sport", "gender", "scores"), index)))
+            out["standing_scores"].append((v["school"], v["gender"], v["sport"],
+                                           to_int(v["year"] or ""), to_float(v["scores"] or "")))
+    return out, files, 0, None
+
+
+def _roster_column(name):
+    if "HOMETOWN" in name and "HIGH SCHOOL" in name:
+        return "hometown_high_school"
+    return {"#": "number", "NO.": "number", "FULL NAME": "name", "NAME": "name",
+            "POS": "position", "POS.": "position", "HT.": "height", "WT.": "weight",
+            "ACADEMIC YEAR": "class_year", "YR.": "class_year", "CAPTAIN": "captain",
+            "B/T": "bats_throws"}.get(name)
+
+
+ROSTER_FIELDS = ["number", "name", "position", "height", "weight", "class_year",
+                 "hometown_high_school", "captain", "bats_throws"]
+COACH_FIELDS = ["name", "title", "email", "phone", "office"]
+
+
+def load_rosters(root):
+    """rosters from Roster/<Gender>/<Sport>/<Season>_<...>_Roster.csv (line 1 is a caption)."""
+    base = os.path.join(root, "Roster")
+    out = {"rosters": []}
+    files = 0
+    for gender in _subdirs(base):
+        for sport in _subdirs(os.path.join(base, gender)):
+            sport_dir = os.path.join(base, gender, sport)
+            for name in _files(sport_dir):
+                season = name.split("_")[0]
+                rows = _read_rows(os.path.join(sport_dir, name), skip=1)
+                files += 1
+                if not rows:
+                    continue
+                index = _mapped(rows[0], _roster_column)
+                out["rosters"].extend(
+                    (DEFAULT_SCHOOL, gender, sport, season, year_of(season), name, n)
+                    + tuple(_pick(r, ROSTER_FIELDS, index))
+                    for n, r in enumerate(rows[1:], start=1))
+    return out, files, 0, None
+
+
+def load_coaches(root):
+    """coaches from Coaches/<Gender>/<Sport>/<Season>_<Sport>.csv."""
+    base = os.path.join(root, "Coaches")
+    out = {"coaches": []}
+    files = 0
+    column = {"NAME": "name", "TITLE": "title", "EMAIL ADDRESS": "email", "EMAIL": "email",
+              "PHONE": "phone", "OFFICE": "office"}.get
+    for gender in _subdirs(base):
+        for sport in _subdirs(os.path.join(base, gender)):
+            sport_dir = os.path.join(base, gender, sport)
+            for name in _files(sport_dir):
+                season = name.split("_")[0]
+                rows = _read_rows(os.path.join(sport_dir, name))
+                files += 1
+                if not rows:
+                    continue
+                index = _mapped(rows[0], column)
+                out["coaches"].extend(
+                    (DEFAULT_SCHOOL, gender, sport, season, year_of(season), n)
+                    + tuple(_pick(r, COACH_FIELDS, index))
+                    for n, r in enumerate(rows[1:], start=1))
+    return out, files, 0, None
+
+
+def load_stats(root):
+    """stat_tables / stat_rows from Performance Stats/<Gender>/<Sport>/<Season>/..."""
+    base = os.path.join(root, "Performance Stats")
+    out = {"stat_tables": [], "stat_rows": []}
+    files = 0
+    for gender in _subdirs(base):
+        for sport in _subdirs(os.path.join(base, gender)):
+            for season in _subdirs(os.path.join(base, gender, sport)):
+                season_dir = os.path.join(base, gender, sport, season)
+                for dirpath, dirnames, names in os.walk(season_dir):
+                    dirnames.sort()
+                    rel = os.path.relpath(dirpath, season_dir)
+                    for name in sorted(n for n in names if n.endswith(".csv")):
+                        rows = _read_rows(os.path.join(dirpath, name))
+                        files += 1
+                        table_id = files
+                        table = name[:-4] if rel == "." else f"{rel.replace(os.sep, '/')}/{name[:-4]}"
+                        out["stat_tables"].append((table_id, DEFAULT_SCHOOL, gender, sport, season,
+                                                   year_of(season), table,
+                                                   json.dumps(rows[0] if rows else [])))
+                        out["stat_rows"].extend((table_id, n, json.dumps(r))
+                                                for n, r in enumerate(rows[1:], start=1))
+    return out, files, 0, None
+
+
+def _read_sheet(path):
+    """Rows (header first, all text) of a CSV or the first xlsx sheet."""
+    if path.lower().endswith(".csv"):
+        return _read_rows(path)
+    from athlete.excel import read_excel
+    df = read_excel(path, dtype=str, header=None).dropna(how="all")
+    return [["" if v != v else str(v) for v in row] for row in df.itertuples(index=False)]
+
+
+def _load_sheets(root, tree, handle):
+    """Run handle(gender, sport, path, rows) over <tree>/<Gender>/<Sport>.csv|.xlsx."""
+    base = os.path.join(root, tree)
+    files = skipped = 0
+    note = None
+    for gender in _subdirs(base):
+        gender_dir = os.path.join(base, gender)
+        for name in _files(gender_dir, (".csv", ".xlsx", ".xls")):
+            try:
+                rows = _read_sheet(os.path.join(gender_dir, name))
+            except ImportError as err:
+                skipped += 1
+                note = f"xlsx skipped ({err})"
+                continue
+            files += 1
+            if rows:
+                handle(gender, os.path.splitext(name)[0], name, rows)
+    return files, skipped, note
+
+
+def load_awards(root):
+    """awards from Awards/<Gender>/<Sport>.csv|.xlsx (raw/ and processed/ are not loaded)."""
+    out = {"awards": []}
+    fields = ["year", "name", "award", "level", "team", "position", "sport"]
+
+    def handle(gender, sport, source, rows):
+        index = _mapped(rows[0], lambda h: h.lower() if h.lower() in fields else None)
+        for row in rows[1:]:
+            v = dict(zip(fields, _pick(row, fields, index)))
+            out["awards"].append((DEFAULT_SCHOOL, gender, v["sport"] or sport, year_of(v["year"] or ""),
+                                  v["name"], v["award"], v["level"], v["team"], v["position"], source))
+
+    files, skipped, note = _load_sheets(root, "Awards", handle)
+    return out, files, skipped, note
+
+
+def _ncaa_column(name):
+    name = name.lower()
+    if name == "year":
+        return "year"
+    if "champion" in name:
+        return "mwc_champion"
+    if "standing" in name or "finish" in name:
+        return "ncaa_finish"
+    if "round" in name:
+        return "ncaa_rounds"
+    if name.startswith("ncaa"):
+        return "ncaa_teams"
+    return None
+
+
+def load_ncaa(root):
+    """ncaa from NCAA/<Gender>/<Sport>.xlsx (one row per year; school is NULL)."""
+    out = {"ncaa": []}
+    fields = ["year", "mwc_champion", "ncaa_teams", "ncaa_finish", "ncaa_rounds"]
+
+    def handle(gender, sport, source, rows):
+        index = _mapped(rows[0], _ncaa_column)
+        if "year" not in index.values():
+            index[0] = "year"  # some sheets leave the year column unlabelled
+        for row in rows[1:]:
+            v = dict(zip(fields, _pick(row, fields, index)))
+            extra = {rows[0][i]: row[i] for i in range(min(len(row), len(rows[0])))
+                     if i not in index and row[i]}
+            out["ncaa"].append((None, gender, sport, v["year"], year_of(v["year"] or ""),
+                                v["mwc_champion"], v["ncaa_teams"], v["ncaa_finish"],
+                                v["ncaa_rounds"], json.dumps(extra) if extra else None))
+
+    files, skipped, note = _load_sheets(root, "NCAA", handle)
+    return out, files, skipped, note
+
+
+def load_expenses(root):
+    """
+    expenses from the Expenses_All_Sports / Operating_Expenses pair in each
+    Expense Data/<School>/, reshaped by athlete.expenses as Combined_Data.py does.
+    """
+    import pandas as pd
+    from athlete.expenses import extract_tidy
+
+    base = os.path.join(root, "Expense Data")
+    out = {"expenses": []}
+    files = skipped = 0
+    for folder in _subdirs(base):
+        names = _files(os.path.join(base, folder))
+        total = next((n for n in names if re.search(r"Expenses_All_Sports", n, re.I)
+                      and not re.search(r"Operating_Expenses", n, re.I)), None)
+        oper = next((n for n in names if re.search(r"Operating_Expenses", n, re.I)), None)
+        if not (total and oper):
+            skipped += 1
+            continue
+        tidy = extract_tidy(pd.read_csv(os.path.join(base, folder, total)),
+                            pd.read_csv(os.path.join(base, folder, oper)), extra=["UNITID"])
+        files += 2
+        out["expenses"].extend(
+            (school, gender, sport, int(year), folder, to_int(unitid), float(total_exp),
+             float(oper_exp), to_int(undergrads))
+            for year, school, gender, sport, total_exp, oper_exp, undergrads, unitid
+            in tidy.itertuples(index=False, name=None))
+    return out, files, skipped, None
+
+
+# tree -> (loader, tables it fills)
+TREES = {
+    "schedule": (load_schedule, ("records", "record_items", "games")),
+    "standings": (load_standings, ("standings", "standing_scores")),
+    "rosters": (load_rosters, ("rosters",)),
+    "coaches": (load_coaches, ("coaches",)),
+    "stats": (load_stats, ("stat_tables", "stat_rows")),
+    "awards": (load_awards, ("awards",)),
+    "ncaa": (load_ncaa, ("ncaa",)),
+    "expenses": (load_expenses, ("expenses",)),
+}
+
+
+# -----------------------------------------------------------------------------
+# Database
+# -----------------------------------------------------------------------------
+def _create(conn):
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        for table in TABLES:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    for table, columns in TABLES.items():
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+    for statement in INDEXES:
+        conn.execute(statement)
+
+
+def ingest(trees=None, path=DEFAULT_DB_PATH, root=REPO_ROOT, verbose=True):
+    """
+    (Re)load ``trees`` (default: all) into the warehouse in one transaction;
+    readers see the old data until it commits. Returns {tree: (files, rows, seconds)}.
+    """
+    trees = list(trees or TREES)
+    unknown = set(trees) - set(TREES)
+    if unknown:
+        raise ValueError(f"Unknown tree(s) {sorted(unknown)}; known: {', '.join(TREES)}")
+
+    conn = sqlite3.connect(path)
+    summary = {}
+    try:
+        _create(conn)
+        with conn:
+            for tree in trees:
+                loader, tables = TREES[tree]
+                start = time.perf_counter()
+                data, files, skipped, note = loader(root)
+                rows = 0
+                for table in tables:
+                    conn.execute(f"DELETE FROM {table}")
+                    if data[table]:
+                        marks = ",".join("?" * len(data[table][0]))
+                        conn.executemany(f"INSERT INTO {table} VALUES ({marks})", data[table])
+                    rows += len(data[table])
+                seconds = time.perf_counter() - start
+                conn.execute("INSERT OR REPLACE INTO ingest_log VALUES (?,?,?,?,?,?,?)",
+                             (tree, files, rows, skipped, seconds, time.time(), note))
+                summary[tree] = (files, rows, seconds)
+                if verbose:
+                    print(f"{tree:10} {files:6d} files {rows:8d} rows {seconds:6.2f}s"
+                          + (f"  [{skipped} skipped: {note}]" if skipped else ""))
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return summary
+
+
+def connect(path=DEFAULT_DB_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found; run `python -m athlete.warehouse ingest` first")
+    conn = sqlite3.connect(path)
+    conn.create_function("clean_name", 1, lambda s: re.sub(r"[^\w\s]", "", s or ""), deterministic=True)
+    return conn
+
+
+def query(sql, params=(), path=DEFAULT_DB_PATH):
+    """Run SQL against the warehouse; returns a DataFrame."""
+    import pandas as pd
+    conn = connect(path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+# -----------------------------------------------------------------------------
+# The aggregators' inputs as indexed queries
+# -----------------------------------------------------------------------------
+def record_pcts(path=DEFAULT_DB_PATH):
+    """All Rankings.py input: School, Gender, Sport, Year, Pct, CPct per season record."""
+    return query("""
+        SELECT school AS School, gender AS Gender, sport AS Sport, season AS Year,
+               pct AS Pct, cpct AS CPct
+        FROM records WHERE pct IS NOT NULL AND cpct IS NOT NULL
+        ORDER BY school, gender, sport, season""", path=path)
+
+
+# Ties keep the file order, like Python's stable sort in the scripts
+_RANKED_STANDINGS = """
+    SELECT gender, sport, season, school, position,
+           COALESCE(cpct, 0.0) AS cpct, COALESCE(pct, 0.0) AS pct,
+           ROW_NUMBER() OVER (PARTITION BY gender, sport, season
+                              ORDER BY COALESCE(cpct, 0.0) DESC, COALESCE(pct, 0.0) DESC, position)
+               AS ranking
+    FROM standings"""
+
+
+def standings_ranked(path=DEFAULT_DB_PATH):
+    """School_combined_standing.py output: every school ranked by CPct., then Pct."""
+    return query(f"""
+        SELECT gender AS Gender, sport AS Sport, season AS Year, clean_name(school) AS School,
+               cpct AS "CPct.", pct AS "Pct.", ranking AS Ranking
+        FROM ({_RANKED_STANDINGS})
+        ORDER BY gender, sport, season, ranking""", path=path)
+
+
+def grinnell_rankings(path=DEFAULT_DB_PATH):
+    """Grinnell Ranking.py output: Grinnell's place in each conference standing."""
+    return query(f"""
+        SELECT gender AS Gender, sport AS Sport, substr(season, 1, 4) AS Year,
+               cpct AS "CPct.", pct AS "Pct.", MIN(ranking) AS Ranking
+        FROM ({_RANKED_STANDINGS})
+        WHERE lower(school) LIKE '%grinnell%'
+        GROUP BY gender, sport, season
+        ORDER BY gender, sport, season""", path=path)
+
+
+def combined_records(school, path=DEFAULT_DB_PATH):
+    """Combine_schedule.py output for one school: one wide row per season record."""
+    import pandas as pd
+    items = query("""
+        SELECT gender, sport, season, category, value FROM record_items
+        WHERE school = ? AND gender IN ('Men', 'Women')
+        ORDER BY gender, sport, season, position""", (school,), path=path)
+    rows = []
+    for (gender, sport, season), group in items.groupby(["gender", "sport", "season"], sort=False):
+        row = {}
+        for category, value in zip(group["category"], group["value"]):
+            row.setdefault(category, value)  # first occurrence wins
+        row.update(Gender=gender, Sport=sport, Year=season)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def combined_roster(path=DEFAULT_DB_PATH):
+    """combine_player.py output: FULL NAME, HOMETOWN / HIGH SCHOOL, Gender, Sport."""
+    df = query("""
+        SELECT name AS "FULL NAME",
+               NULLIF(hometown_high_school, '/') AS "HOMETOWN / HIGH SCHOOL",
+               gender AS Gender, sport AS Sport
+        FROM rosters
+        WHERE gender IN ('Men', 'Women') AND name IS NOT NULL AND hometown_high_school IS NOT NULL
+        ORDER BY gender, sport, source, line""", path=path)
+    return df.drop_duplicates(subset=["FULL NAME"], keep="first")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m athlete.warehouse",
+                                     description="Embedded SQLite warehouse of the data tree.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("ingest", help="(re)load trees into the warehouse")
+    p.add_argument("--tree", action="append", choices=sorted(TREES), help="default: all")
+    p.add_argument("--root", default=REPO_ROOT)
+    sub.add_parser("info", help="row counts and the last ingest of each tree")
+    p = sub.add_parser("sql", help="run a query and print the result")
+    p.add_argument("statement")
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        start = time.perf_counter()
+        ingest(args.tree, args.db, args.root)
+        print(f"Ingested into {args.db} in {time.perf_counter() - start:.1f}s")
+    elif args.command == "info":
+        conn = connect(args.db)
+        for table in TABLES:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"{table:16} {count:9d} rows")
+        for tree, files, rows, skipped, seconds, at, note in conn.execute(
+                "SELECT * FROM ingest_log ORDER BY tree"):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(at))
+            print(f"  {tree:10} {files:6d} files  {seconds:6.2f}s  {when}" + (f"  {note}" if note else ""))
+        conn.close()
+    else:
+        import pandas as pd
+        with pd.option_context("display.max_rows", 200, "display.width", 200):
+            print(query(args.statement, path=args.db))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Files athlete.dataset leaves on disk and opens, and what that costs.
+
+    python benchmarks/bench_dataset.py
+    python benchmarks/bench_dataset.py --seasons 60 --tables 30
+
+1. A scraper run: --seasons seasons of --tables stats-sized tables, flushed
+   one season at a time into one partition, the way Stats(XML).py writes.
+   Reports the flush time and the most files the partition held at once,
+   then writes a season again and checks that the newer tables are read.
+2. Schedule/ imported into a dataset: files per partition, and the number of
+   Parquet files read_records() opens against the time it takes, next to
+   athlete.records.load_record_pcts over the CSV tree.
+
+Stops with an error if a partition ever holds more than COMPACT_AFTER files
+or a read returns stale tables.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete import dataset
+from athlete.records import load_record_pcts
+
+
+class CountOpens:
+    """Counts the Parquet files pq.read_table() is asked to read."""
+
+    def __enter__(self):
+        self.count, self._read_table = 0, pq.read_table
+
+        def read_table(source, *args, **kwargs):
+            self.count += 1
+            return self._read_table(source, *args, **kwargs)
+        pq.read_table = read_table
+        return self
+
+    def __exit__(self, *exc):
+        pq.read_table = self._read_table
+
+
+def stats_table(season, table, rows=12, cols=20):
+    header = [f"{table}_col{c}" for c in range(cols)]
+    return [header] + [[f"{season}:{table}:{r}:{c}" for c in range(cols)] for r in range(rows)]
+
+
+def scraper_run(root, seasons, tables):
+    folder = dataset.partition_dir("stats", "Grinnell", "Women", "Softball", root)
+    writer = dataset.DatasetWriter("stats", root)
+    most, start = 0, time.perf_counter()
+    for s in range(seasons):
+        season = str(2000 + s)
+        for t in range(tables):
+            writer.add_rows("Grinnell", "Women", "Softball", season, f"table{t}", stats_table(season, t))
+        writer.flush()
+        most = max(most, len(dataset._partition_files(folder)))
+    elapsed = time.perf_counter() - start
+    print(f"{seasons} seasons x {tables} tables, one flush per season: {elapsed:6.3f}s, "
+          f"at most {most} file(s) in the partition (COMPACT_AFTER = {dataset.COMPACT_AFTER})")
+    if most > dataset.COMPACT_AFTER:
+        sys.exit("a partition held more files than COMPACT_AFTER")
+
+    rewritten = [["new header"], ["new value"]]
+    writer.add_rows("Grinnell", "Women", "Softball", "2000", "table0", rewritten)
+    writer.flush()
+    stored = dataset.read_table("stats", "Grinnell", "Women", "Softball", "2000", "table0", root)
+    kept = dataset.read_table("stats", "Grinnell", "Women", "Softball", "2001", "table0", root)
+    if stored.columns.tolist() != ["new header"] or kept.shape != (12, 20):
+        sys.exit("read returned a stale table after a season was written again")
+    with CountOpens() as opens:
+        cells = dataset.read_cells("stats", root)
+    print(f"read_cells after the run: {opens.count} file(s) opened, {len(cells)} cells")
+
+
+def schedule_reads(root, schedule_dir, repeat):
+    dataset.import_csv("schedule", src=schedule_dir, root=root)
+    found = dataset.partitions("schedule", root)
+    files = sum(len(paths) for _, _, paths in found)
+    print(f"\nSchedule/ as a dataset: {len(found)} partitions, {files} Parquet files")
+
+    best = float("inf")
+    for _ in range(repeat):
+        with CountOpens() as opens:
+            start = time.perf_counter()
+            records = dataset.read_records(root)
+            best = min(best, time.perf_counter() - start)
+    print(f"{'read_records()':36}: {best:6.3f}s  ({len(records)} seasons, {opens.count} files opened)")
+    if opens.count > len(found) * dataset.COMPACT_AFTER:
+        sys.exit("read_records opened more than COMPACT_AFTER files per partition")
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pcts = load_record_pcts(schedule_dir, processes=1)
+        best = min(best, time.perf_counter() - start)
+    print(f"{'load_record_pcts() over the CSVs':36}: {best:6.3f}s  ({len(pcts)} records)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--schedule-dir", default=os.path.join(os.path.dirname(__file__), "..", "Schedule"))
+    parser.add_argument("--seasons", type=int, default=40)
+    parser.add_argument("--tables", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper_run(os.path.join(tmp, "run"), args.seasons, args.tables)
+        schedule_reads(os.path.join(tmp, "schedule"), args.schedule_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+athlete.excel against plain pandas.
+
+Write: DataFrame.to_excel vs write_xlsx (openpyxl write-only) on a synthetic
+rankings-shaped frame; time and peak Python memory (tracemalloc).
+Read: pd.read_excel vs read_excel cold (parse + cache) and warm (cache hit)
+over the repo's NCAA/, Awards/ and team-expense workbooks; the cached frames
+must equal pd.read_excel's.
+
+    python benchmarks/bench_excel.py
+    python benchmarks/bench_excel.py --rows 200000
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+from athlete.excel import read_excel, write_xlsx
+
+
+def rankings_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "School": np.asarray([f"School {i}" for i in range(14)])[rng.integers(0, 14, n)],
+        "Gender": np.where(rng.random(n) < 0.5, "Men", "Women"),
+        "Sport": np.asarray(["Baseball", "Basketball", "Soccer", "Softball"])[rng.integers(0, 4, n)],
+        "Year": rng.integers(1905, 2025, n).astype(str),
+        "Pct": np.round(rng.random(n), 3),
+        "CPct": np.where(rng.random(n) < 0.05, np.nan, np.round(rng.random(n), 3)),
+        "Ranking": rng.integers(1, 12, n),
+    })
+
+
+def measured(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def workbooks():
+    patterns = ["NCAA/*/*.xlsx", "Awards/*/*.xlsx", "*Team Expenses.xlsx"]
+    return sorted(p for pattern in patterns for p in glob.glob(os.path.join(ROOT, pattern)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming xlsx writes and cached xlsx reads.")
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        df = rankings_frame(args.rows)
+        _, t_pd, m_pd = measured(lambda: df.to_excel(os.path.join(tmp, "pandas.xlsx"), index=False))
+        _, t_ws, m_ws = measured(lambda: write_xlsx(df, os.path.join(tmp, "stream.xlsx")))
+        print(f"Write {args.rows:,} rows: to_excel {t_pd:.2f}s / {m_pd:.0f} MB peak, "
+              f"write_xlsx {t_ws:.2f}s / {m_ws:.0f} MB peak")
+        if args.rows <= 50_000:
+            same = pd.read_excel(os.path.join(tmp, "stream.xlsx")).equals(
+                pd.read_excel(os.path.join(tmp, "pandas.xlsx")))
+            print(f"  read back identical: {same}")
+
+        files = workbooks()
+        cache = os.path.join(tmp, "cache")
+        start = time.perf_counter()
+        plain = [pd.read_excel(f) for f in files]
+        t_plain = time.perf_counter() - start
+        start = time.perf_counter()
+        [read_excel(f, cache_dir=cache) for f in files]
+        t_cold = time.perf_counter() - start
+        start = time.perf_counter()
+        warm = [read_excel(f, cache_dir=cache) for f in files]
+        t_warm = time.perf_counter() - start
+        if not all(a.equals(b) for a, b in zip(plain, warm)):
+            sys.exit("cached frames differ from pd.read_excel")
+        cached = sum(len(names) for _, _, names in os.walk(cache))
+        print(f"Read {len(files)} workbooks ({cached} cacheable): pd.read_excel {t_plain:.3f}s, "
+              f"cold {t_cold:.3f}s, warm {t_warm:.3f}s ({t_plain / t_warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
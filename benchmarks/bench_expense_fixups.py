@@ -0,0 +1,109 @@
+"""
+Section 4 of Final/standardize_sports_and_fix_all.py (Swimming & Diving
+merge, All Track Combined and Total rows): the old per-group loop against
+the group-wide fix_expenses().
+
+    python benchmarks/bench_expense_fixups.py                 # ~2,000 institutions
+    python benchmarks/bench_expense_fixups.py --copies 20 --check-copies 20
+
+Input is the committed combined expenses file, stacked --copies times under
+new school names (2,000+ institutions is the size of the national EADA
+file). Both must write the same CSV; the old loop is only timed on
+--check-copies copies.
+"""
+
+import os
+import ast
+import sys
+import time
+import argparse
+
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCRIPT = os.path.join(ROOT, "Final", "standardize_sports_and_fix_all.py")
+SOURCE = os.path.join(ROOT, "Final", "intermediate results", "combined_athlete_expenses.csv")
+sys.path.insert(0, ROOT)
+
+
+def script_helpers():
+    """Imports, UPPER_CASE constants and functions of the script, without running it."""
+    tree = ast.parse(open(SCRIPT, "r", encoding="utf-8").read())
+    keep = [node for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))
+            or (isinstance(node, ast.Assign) and all(isinstance(t, ast.Name) and t.id.isupper()
+                                                      for t in node.targets))]
+    namespace = {"__file__": SCRIPT}
+    exec(compile(ast.Module(keep, type_ignores=[]), SCRIPT, "exec"), namespace)
+    return namespace
+
+
+def old_fix_expenses(exp_df, numeric_cols):
+    """Section 4 as it was: copy + to_frame().T + concat per group."""
+    clean_blocks = []
+    for _, grp in exp_df.groupby(["Year", "Gender", "School_std"], sort=False):
+        grp = grp.copy()
+        if (grp["Sport_std"] == "Swimming & Diving").sum() > 1:
+            rows = grp[grp["Sport_std"] == "Swimming & Diving"]
+            summed = rows[numeric_cols].sum()
+            template = rows.iloc[0].copy()
+            template.update(summed)
+            grp = grp[grp["Sport_std"] != "Swimming & Diving"]
+            grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
+        if "All Track Combined" not in grp["Sport_std"].values:
+            mask = grp["Sport_std"].isin(["Track & Field (Indoor)", "Track & Field (Outdoor)", "Cross Country"])
+            if mask.any():
+                summed = grp.loc[mask, numeric_cols].sum()
+                template = grp.iloc[0].copy()
+                template["Sport"] = template["Sport_std"] = "All Track Combined"
+                template.update(summed)
+                grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
+        if "Total" not in grp["Sport_std"].values:
+            exclude = (["Track & Field (Indoor)", "Track & Field (Outdoor)", "Cross Country"]
+                       if "All Track Combined" in grp["Sport_std"].values else [])
+            summed = grp.loc[~grp["Sport_std"].isin(["Total"] + exclude), numeric_cols].sum()
+            template = grp.iloc[0].copy()
+            template["Sport"] = template["Sport_std"] = "Total"
+            template.update(summed)
+            grp = pd.concat([grp, template.to_frame().T], ignore_index=True)
+        clean_blocks.append(grp)
+    return pd.concat(clean_blocks, ignore_index=True)
+
+
+def expenses(helpers, copies):
+    """The schools' expense rows with School_std/Sport_std, stacked ``copies`` times."""
+    df = pd.read_csv(SOURCE)
+    df["Sport_std"] = helpers["SPORTS"].standardize(df["Sport"])
+    frames = [df.assign(School_std=df["School"] + f" #{i}") for i in range(copies)]
+    return pd.concat(frames, ignore_index=True)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Expense fix-ups: per-group loop vs vectorized.")
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--check-copies", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    helpers = script_helpers()
+    df = expenses(helpers, args.check_copies)
+    old, t_old = timed(lambda: old_fix_expenses(df, helpers["NUMERIC_COLS"]))
+    new, t_new = timed(lambda: helpers["fix_expenses"](df))
+    if old.to_csv(index=False) != new.to_csv(index=False):
+        sys.exit("fix_expenses writes a different CSV than the loop")
+    print(f"{len(df):,} rows -> {len(new):,}: loop {t_old:.2f}s, vectorized {t_new:.3f}s "
+          f"({t_old / t_new:.0f}x), identical CSV")
+
+    df = expenses(helpers, args.copies)
+    new, t_new = timed(lambda: helpers["fix_expenses"](df))
+    print(f"{df['School_std'].nunique():,} institutions, {len(df):,} rows -> {len(new):,}: "
+          f"vectorized {t_new:.3f}s (loop est. {t_old * args.copies / args.check_copies:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
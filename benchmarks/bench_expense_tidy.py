@@ -0,0 +1,136 @@
+"""
+EADA wide-to-long step of Expense Data/Combined_Data.py: the old
+iterrows loop (a regex per column per row, an index lookup per row) against
+the column map + vectorized reshape now in athlete.expenses.extract_tidy.
+
+    python benchmarks/bench_expense_tidy.py                   # ~2,000 institutions
+    python benchmarks/bench_expense_tidy.py --copies 20 --check-copies 20
+
+The 11 schools' sheet pairs are each checked for identical output, then
+stacked --copies times under fresh UNITIDs (2,000+ institutions is about
+the size of the national EADA file). The old loop is only timed on
+--check-copies copies.
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCRIPT = os.path.join(ROOT, "Expense Data", "Combined_Data.py")
+sys.path.insert(0, ROOT)
+from athlete.expenses import COL_TOTAL_RE, extract_tidy
+
+
+def script_helpers():
+    """The helper section of Combined_Data.py (everything above its main block)."""
+    source = open(SCRIPT, "r", encoding="utf-8").read()
+    source = source[:source.index("# Main (no args)")]
+    namespace = {"__file__": SCRIPT, "__name__": "combined_data"}
+    exec(compile(source, SCRIPT, "exec"), namespace)
+    return namespace
+
+
+def old_extract_tidy(df_total, df_oper, col_total_re):
+    """extract_tidy as it was: a Python loop over rows and columns."""
+    ug_m_col = next((c for c in df_total.columns if re.search(r"Male Undergraduates", c, re.I)), None)
+    ug_f_col = next((c for c in df_total.columns if re.search(r"Female Undergraduates", c, re.I)), None)
+    oper_lookup = df_oper.set_index(["UNITID", "Survey Year"])
+    records = []
+    for _, row in df_total.iterrows():
+        key = (row.get("UNITID"), row.get("Survey Year"))
+        row_oper = oper_lookup.loc[key] if key in oper_lookup.index else pd.Series(dtype="object")
+        school = row.get("Institution Name", pd.NA)
+        year = row.get("Survey Year")
+        if pd.isna(year) or pd.isna(school):
+            continue
+        year = int(year)
+        under_M = row.get(ug_m_col, pd.NA)
+        under_F = row.get(ug_f_col, pd.NA)
+        for col in df_total.columns:
+            m = col_total_re.match(col)
+            if not m:
+                continue
+            sport = m.group(1).strip()
+            gender_poss = m.group(2)
+            gender = "Men" if gender_poss.lower().startswith("men") else "Women"
+            total_exp = row[col]
+            oper_col = f"{sport} {gender_poss} Team Operating Expenses"
+            oper_exp = row_oper.get(oper_col, pd.NA) if not row_oper.empty else pd.NA
+            if pd.isna(total_exp) and pd.isna(oper_exp):
+                continue
+            records.append({
+                "Year": year, "School": school, "Gender": gender, "Sport": sport,
+                "Total Expense": total_exp, "Operating Expense": oper_exp,
+                "Undergrads": under_M if gender == "Men" else under_F,
+            })
+    df = pd.DataFrame.from_records(records)
+    df.dropna(subset=["Total Expense", "Operating Expense", "Undergrads"], inplace=True)
+    return df
+
+
+def sheet_pairs(helpers):
+    pairs = []
+    for folder in sorted(p for p in Path(ROOT, "Expense Data").iterdir() if p.is_dir()):
+        files = [f for f in folder.iterdir() if f.is_file()]
+        total = next((f for f in files if helpers["EXPENSE_PATTERN"].search(f.name)
+                      and not helpers["OPERATING_PATTERN"].search(f.name)), None)
+        oper = next((f for f in files if helpers["OPERATING_PATTERN"].search(f.name)), None)
+        if total and oper:
+            pairs.append((folder.name, helpers["_load_table"](total), helpers["_load_table"](oper)))
+    return pairs
+
+
+def national(pairs, copies):
+    """The schools' sheets stacked ``copies`` times, each copy under new UNITIDs."""
+    totals, opers = [], []
+    for i in range(copies):
+        for _, df_total, df_oper in pairs:
+            totals.append(df_total.assign(UNITID=df_total["UNITID"] + i * 1_000_000))
+            opers.append(df_oper.assign(UNITID=df_oper["UNITID"] + i * 1_000_000))
+    return pd.concat(totals, ignore_index=True), pd.concat(opers, ignore_index=True)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EADA wide-to-long: iterrows loop vs vectorized.")
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--check-copies", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    helpers = script_helpers()
+    new_tidy, pattern = extract_tidy, COL_TOTAL_RE
+    pairs = sheet_pairs(helpers)
+    for name, df_total, df_oper in pairs:
+        old = old_extract_tidy(df_total, df_oper, pattern).reset_index(drop=True)
+        if not old.equals(new_tidy(df_total, df_oper).reset_index(drop=True)):
+            sys.exit(f"{name}: vectorized rows differ from the loop")
+    print(f"{len(pairs)} schools: identical rows and dtypes")
+
+    df_total, df_oper = national(pairs, args.check_copies)
+    old, t_old = timed(lambda: old_extract_tidy(df_total, df_oper, pattern))
+    new, t_new = timed(lambda: new_tidy(df_total, df_oper))
+    if not old.reset_index(drop=True).equals(new.reset_index(drop=True)):
+        sys.exit("stacked sheets: vectorized rows differ from the loop")
+    print(f"{len(df_total):,} sheet rows -> {len(new):,} tidy rows: loop {t_old:.2f}s, "
+          f"vectorized {t_new:.3f}s ({t_old / t_new:.0f}x)")
+
+    df_total, df_oper = national(pairs, args.copies)
+    new, t_new = timed(lambda: new_tidy(df_total, df_oper))
+    print(f"{df_total['UNITID'].nunique():,} institutions, {len(df_total):,} sheet rows -> "
+          f"{len(new):,} tidy rows: vectorized {t_new:.3f}s "
+          f"(loop est. {t_old * args.copies / args.check_copies:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
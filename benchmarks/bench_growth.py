@@ -0,0 +1,115 @@
+"""
+Growth metrics per series: the groupby(...).transform(lambda ...) pair from
+PowerBI/Data/Year_Growth_Expense.py against athlete.growth.
+
+    python benchmarks/bench_growth.py                    # 1M rows
+    python benchmarks/bench_growth.py --rows 200000 --check-rows 20000
+
+Synthetic series start in different years and miss ~10% of their years. On
+--check-rows rows the results are checked against plain per-series Python:
+Index and Change must equal the lambdas exactly, YoY must equal Change
+wherever the previous year exists, and CAGR and the calendar rolling mean are compared
+with a straightforward loop.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.growth import METRICS, growth
+
+BY = ["School", "Sport", "Gender"]
+
+
+def synthetic_expenses(n, seed=0):
+    """About n rows of (School, Sport, Gender, Year, Expense) series, 20 years each at most."""
+    rng = np.random.default_rng(seed)
+    series = n // 18 + 1
+    first = rng.integers(2003, 2012, series)
+    rows = pd.DataFrame({"series": np.repeat(np.arange(series), 20),
+                         "Year": np.repeat(first, 20) + np.tile(np.arange(20), series)})
+    rows = rows[rng.random(len(rows)) > 0.1].head(n)          # gaps
+    s = rows["series"].to_numpy()
+    return pd.DataFrame({
+        "School": np.char.add("School ", (s // 40).astype(str)),
+        "Sport": np.char.add("Sport ", (s % 20).astype(str)),
+        "Gender": np.where((s // 20) % 2 == 0, "Men", "Women"),
+        "Year": rows["Year"].to_numpy(),
+        "Expense": np.round(rng.lognormal(11, 1, len(rows))),
+    }).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def lambdas(df):
+    """Year_Growth_Expense.py as it was (minus the 2003 fix-up)."""
+    df = df.sort_values(BY + ["Year"])
+    grouped = df.groupby(BY)["Expense"]
+    return pd.DataFrame({
+        "Index": grouped.transform(lambda x: x / x.iloc[0]),
+        "Change": grouped.transform(lambda x: x.diff() / x.shift(1)),
+    }).reindex(df.index.sort_values())
+
+
+def reference(df, window):
+    """CAGR and calendar rolling mean, one series at a time."""
+    cagr, rolling = pd.Series(np.nan, index=df.index), pd.Series(np.nan, index=df.index)
+    for _, s in df.groupby(BY):
+        s = s.sort_values("Year")
+        y, v = s["Year"].to_numpy(), s["Expense"].to_numpy()
+        for i, label in enumerate(s.index):
+            if i:
+                cagr[label] = (v[i] / v[0]) ** (1 / (y[i] - y[0])) - 1
+            rolling[label] = v[(y > y[i] - window) & (y <= y[i])].mean()
+    return cagr, rolling
+
+
+def min_time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-group lambdas vs vectorized growth metrics.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--check-rows", type=int, default=50_000)
+    parser.add_argument("--window", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    small = synthetic_expenses(args.check_rows, seed=1)
+    start = time.perf_counter()
+    old = lambdas(small)
+    t_old = time.perf_counter() - start
+    new = growth(small, "Expense", BY, window=args.window)
+    if not new["Index"].equals(old["Index"]):
+        sys.exit("Index differs from x / x.iloc[0]")
+    if not new["Change"].equals(old["Change"]):
+        sys.exit("Change differs from x.diff() / x.shift(1)")
+    ordered = small.sort_values(BY + ["Year"])
+    consecutive = (ordered["Year"] - ordered.groupby(BY)["Year"].shift(1) == 1).reindex(small.index)
+    if not new.loc[consecutive, "YoY"].equals(old.loc[consecutive, "Change"]):
+        sys.exit("YoY differs from x.diff() / x.shift(1) across consecutive years")
+    cagr, rolling = reference(small, args.window)
+    if not (np.allclose(new.loc[cagr.index, "CAGR"], cagr, equal_nan=True)
+            and np.allclose(new.loc[rolling.index, "Rolling Mean"], rolling)):
+        sys.exit("CAGR / Rolling Mean differ from the per-series loop")
+    print(f"{len(small):,} rows: lambdas (Index + Change) {t_old:.2f}s, "
+          f"growth() all {len(METRICS)} metrics {min_time(lambda: growth(small, 'Expense', BY)):.3f}s; checks passed")
+
+    df = synthetic_expenses(args.rows)
+    series = df.groupby(BY).ngroups
+    t_two = min_time(lambda: growth(df, "Expense", BY, metrics=("Index", "Change")))
+    t_all = min_time(lambda: growth(df, "Expense", BY, window=args.window))
+    print(f"{len(df):,} rows in {series:,} series: growth() Index + Change {t_two:.3f}s, "
+          f"all {len(METRICS)} {t_all:.3f}s (lambdas est. {t_old * len(df) / len(small):.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Nightly All Rankings refresh: a full re-read and re-rank against
+athlete.ranking_state.RankingState after one current-season record file changed.
+
+    python benchmarks/bench_incremental_rankings.py
+    python benchmarks/bench_incremental_rankings.py --schedule-dir /path/to/Schedule
+
+Runs on a temporary copy of Schedule/. Each timing covers the whole job up to
+and including the CSV write; the incremental table must equal the full one.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.ranking import rank_records
+from athlete.ranking_state import RankingState
+from athlete.records import load_record_pcts, scan_record_files
+
+
+def full_run(schedule_dir, csv_path):
+    df = rank_records(load_record_pcts(schedule_dir))
+    df.to_csv(csv_path, index=False)
+    return df
+
+
+def incremental_run(schedule_dir, csv_path, state_path):
+    state = RankingState(state_path)
+    changed, removed = state.update(schedule_dir)
+    df = state.frame()
+    if changed or removed:
+        df.to_csv(csv_path, index=False)
+        state.save()
+    return df, changed
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:40}: {elapsed:6.3f}s")
+    return result, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full vs incremental All Rankings refresh.")
+    parser.add_argument("--schedule-dir", default=os.path.join(os.path.dirname(__file__), "..", "Schedule"))
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        schedule = os.path.join(tmp, "Schedule")
+        shutil.copytree(args.schedule_dir, schedule)
+        csv_path = os.path.join(tmp, "all_schools_rankings.csv")
+        state_path = os.path.join(tmp, "rankings_state.json")
+
+        timed("incremental, no saved state", lambda: incremental_run(schedule, csv_path, state_path))
+        timed("incremental, nothing changed", lambda: incremental_run(schedule, csv_path, state_path))
+
+        # A nightly scrape rewrites the latest record of one team
+        latest = max(scan_record_files(schedule), key=lambda f: (f[3], f[4]))
+        with open(latest[4], "a", encoding="utf-8") as f:
+            f.write("\n")
+        print(f"\nChanged {os.path.relpath(latest[4], schedule)}")
+        full, t_full = timed("full re-read and re-rank", lambda: full_run(schedule, csv_path))
+        (inc, changed), t_inc = timed("incremental", lambda: incremental_run(schedule, csv_path, state_path))
+
+        if not full.reset_index(drop=True).equals(inc):
+            sys.exit("incremental rankings differ from a full run")
+        print(f"\nIdentical tables ({len(inc)} rows). Re-ranked {len(changed)} group(s); "
+              f"{t_full / t_inc:.1f}x faster than a full run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Pages/sec of the old full html.parser tree against the lxml + SoupStrainer
+path in athlete.sidearm, on the same schedule pages.
+
+    python benchmarks/bench_parse.py            # synthetic pages
+    python benchmarks/bench_parse.py --cached   # real pages from .http_cache/
+
+Both paths must extract identical record/schedule rows; the script stops
+with an error if any page differs.
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from athlete import parsing
+from athlete.http_cache import DEFAULT_CACHE_DIR
+from athlete.sidearm import parse_schedule_page, parse_schedule_seasons
+import sample_pages
+
+
+def cached_schedule_pages(limit=200):
+    """Bodies of grid schedule pages already in the on-disk HTTP cache."""
+    pages = []
+    for meta_path in glob.glob(os.path.join(DEFAULT_CACHE_DIR, "*", "*.json")):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if "/schedule/" in meta["url"] and "grid=true" in meta["url"]:
+            with open(meta_path[:-5] + ".body", "rb") as f:
+                pages.append(f.read().decode(meta.get("encoding") or "utf-8", "replace"))
+        if len(pages) >= limit:
+            break
+    return pages
+
+
+def run(label, pages, parse):
+    start = time.perf_counter()
+    results = [parse(html) for html in pages]
+    elapsed = time.perf_counter() - start
+    print(f"{label:32}: {len(pages) / elapsed:8.1f} pages/s  ({elapsed:.2f}s)")
+    return results, elapsed
+
+
+def main(use_cache=False):
+    if use_cache:
+        pages = cached_schedule_pages()
+        if not pages:
+            sys.exit("No cached schedule pages; run a schedule scraper first.")
+    else:
+        pages = [sample_pages.schedule_page(str(2000 + i), seed=i) for i in range(40)]
+    mb = sum(len(p) for p in pages) / 1e6
+    print(f"{len(pages)} schedule pages, {mb:.1f} MB; fast parser = {parsing.FAST_PARSER}\n")
+
+    old, old_s = run("html.parser, full tree", pages,
+                     lambda h: parse_schedule_page(h, parser=parsing.SLOW_PARSER, strained=False))
+    new, new_s = run(f"{parsing.FAST_PARSER} + SoupStrainer", pages, parse_schedule_page)
+    if old != new:
+        bad = sum(a != b for a, b in zip(old, new))
+        sys.exit(f"Output mismatch on {bad} page(s)")
+
+    old_d, _ = run("dropdown, html.parser full", pages,
+                   lambda h: parse_schedule_seasons(h, parser=parsing.SLOW_PARSER, strained=False))
+    new_d, _ = run("dropdown, strained", pages, parse_schedule_seasons)
+    if old_d != new_d:
+        sys.exit("Season dropdown mismatch")
+
+    print(f"\nIdentical output; schedule parse speed-up {old_s / new_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main(use_cache="--cached" in sys.argv[1:])
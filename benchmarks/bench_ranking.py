@@ -0,0 +1,92 @@
+"""
+Dense ranking of (CPct, Pct) within (Gender, Sport, Year): the old
+iterrows-per-group dense_rank_cpct_pct against athlete.ranking.group_rank.
+
+    python benchmarks/bench_ranking.py                  # 10M rows
+    python benchmarks/bench_ranking.py --rows 1000000 --check-rows 50000
+
+The old loop is only timed on --check-rows rows (it needs minutes for
+millions); both must give identical rankings on those rows.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.ranking import group_rank
+
+GROUPS = ["Gender", "Sport", "Year"]
+SPORTS = ["Baseball", "Basketball", "Football", "Soccer", "Softball", "Tennis",
+          "Volleyball", "Golf", "Swimming", "Cross Country"]
+
+
+def synthetic_records(n, seed=0):
+    """n season records over ~2,400 (Gender, Sport, Year) groups, with plenty of ties."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "School": pd.Categorical.from_codes(rng.integers(0, 14, n), [f"School {i}" for i in range(14)]).astype(str),
+        "Gender": np.where(rng.random(n) < 0.5, "Men", "Women"),
+        "Sport": np.asarray(SPORTS)[rng.integers(0, len(SPORTS), n)],
+        "Year": rng.integers(1905, 2025, n).astype(str),
+        # Win percentages from short seasons: few distinct values, many ties
+        "Pct": np.round(rng.integers(0, 21, n) / 20, 3),
+        "CPct": np.round(rng.integers(0, 13, n) / 12, 3),
+    })
+
+
+def dense_rank_cpct_pct(group):
+    """The old All Rankings.py ranking (group sorted by CPct, Pct descending)."""
+    ranks = []
+    rank_val = 1
+    last_cpct, last_pct = None, None
+    for idx, row in group.iterrows():
+        cpct_val = row["CPct"]
+        pct_val = row["Pct"]
+        if (cpct_val, pct_val) != (last_cpct, last_pct):
+            ranks.append(rank_val)
+            rank_val += 1
+            last_cpct, last_pct = cpct_val, pct_val
+        else:
+            ranks.append(rank_val - 1)
+    group["Ranking"] = ranks
+    return group
+
+
+def old_ranking(df):
+    df = df.sort_values(by=GROUPS + ["CPct", "Pct"], ascending=[True, True, True, False, False])
+    parts = [dense_rank_cpct_pct(g.copy()) for _, g in df.groupby(GROUPS, sort=False)]
+    return pd.concat(parts)["Ranking"].reindex(df.index)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Old vs vectorized dense ranking.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--check-rows", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    sample = synthetic_records(args.check_rows, seed=1)
+    start = time.perf_counter()
+    old = old_ranking(sample)
+    t_old = time.perf_counter() - start
+    start = time.perf_counter()
+    new = group_rank(sample, by=["CPct", "Pct"], groups=GROUPS, method="dense")
+    t_new = time.perf_counter() - start
+    if not np.array_equal(old.loc[sample.index].to_numpy(), new):
+        sys.exit("group_rank differs from dense_rank_cpct_pct")
+    print(f"{args.check_rows:,} rows: iterrows {t_old:.2f}s, group_rank {t_new:.3f}s "
+          f"({t_old / t_new:.0f}x), identical rankings")
+
+    big = synthetic_records(args.rows)
+    for method in ("dense", "min", "max"):
+        start = time.perf_counter()
+        group_rank(big, by=["CPct", "Pct"], groups=GROUPS, method=method)
+        print(f"{args.rows:,} rows, {method:5}: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
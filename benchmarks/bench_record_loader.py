@@ -0,0 +1,94 @@
+"""
+Time to collect (School, Gender, Sport, Year, Pct, CPct) from every record CSV
+under Schedule/: the old nested os.listdir walk with ``pd.read_csv(header=None)``
+per file against athlete.records.load_record_pcts (os.scandir walk,
+fixed-position reader, process pool).
+
+    python benchmarks/bench_record_loader.py
+    python benchmarks/bench_record_loader.py --schedule-dir /path/to/Schedule --processes 8
+
+Both loaders must return the same rows; the script stops with an error if
+they differ.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.records import load_record_pcts
+
+
+def read_csv_record(csv_path):
+    """The old All Rankings.py reader."""
+    try:
+        df = pd.read_csv(csv_path, header=None)
+        if df.shape[0] < 5 or df.shape[1] < 2:
+            return None, None
+        return float(df.iloc[2, 1]), float(df.iloc[4, 1])
+    except Exception:
+        return None, None
+
+
+def listdir_loader(schedule_dir):
+    """The old All Rankings.py walk."""
+    rows = []
+    for school in os.listdir(schedule_dir):
+        school_path = os.path.join(schedule_dir, school)
+        if not os.path.isdir(school_path):
+            continue
+        for gender in os.listdir(school_path):
+            gender_path = os.path.join(school_path, gender)
+            if not os.path.isdir(gender_path):
+                continue
+            for sport in os.listdir(gender_path):
+                sport_path = os.path.join(gender_path, sport)
+                if not os.path.isdir(sport_path):
+                    continue
+                for year in os.listdir(sport_path):
+                    year_path = os.path.join(sport_path, year)
+                    if not os.path.isdir(year_path):
+                        continue
+                    for name in os.listdir(year_path):
+                        if "record" in name.lower() and name.lower().endswith(".csv"):
+                            pct, cpct = read_csv_record(os.path.join(year_path, name))
+                            if pct is not None and cpct is not None:
+                                rows.append((school, gender, sport, year, pct, cpct))
+    return pd.DataFrame(rows, columns=["School", "Gender", "Sport", "Year", "Pct", "CPct"])
+
+
+def timed(label, fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:36}: {best:6.3f}s  ({len(result)} records)")
+    return result, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--schedule-dir", default=os.path.join(os.path.dirname(__file__), "..", "Schedule"))
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    old, t_old = timed("os.listdir + pd.read_csv", lambda: listdir_loader(args.schedule_dir), args.repeat)
+    serial, t_serial = timed("scandir + fixed-position reader",
+                             lambda: load_record_pcts(args.schedule_dir, processes=1), args.repeat)
+    pooled, t_pool = timed(f"  ... on {args.processes} processes",
+                           lambda: load_record_pcts(args.schedule_dir, processes=args.processes), args.repeat)
+
+    for label, new in (("serial", serial), ("pooled", pooled)):
+        if not old.equals(new):
+            sys.exit(f"{label} loader returned different rows")
+    print(f"\nIdentical rows. Speed-up: {t_old / t_serial:.1f}x serial, "
+          f"{t_old / t_pool:.1f}x with {args.processes} process(es) ({os.cpu_count()} CPUs here)")
+
+
+if __name__ == "__main__":
+    main()
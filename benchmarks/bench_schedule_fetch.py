@@ -0,0 +1,64 @@
+"""
+Wall-clock comparison of the sequential season loop against the asyncio
+fetch mode used by Code/Schedule/schedule.py and athlete.scheduler.
+
+    python benchmarks/bench_schedule_fetch.py https://pioneers.grinnell.edu baseball 6
+
+Only the season pages are timed (the dropdown page is fetched once, up front);
+nothing is written to disk.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete import aio
+from athlete.http_client import HttpClient
+from athlete.sidearm import parse_schedule_seasons, schedule_season_url
+
+
+# Each timing gets a fresh client with the cache off, so neither run is
+# served from disk and neither inherits the other's warm connections
+def time_sequential(urls):
+    client = HttpClient(cache=None)
+    start = time.perf_counter()
+    failed = 0
+    for url in urls:
+        try:
+            client.get_ok(url)
+        except Exception:
+            failed += 1
+    return time.perf_counter() - start, failed
+
+
+def time_async(urls, per_host):
+    client = HttpClient(cache=None, pool_size=per_host)
+    start = time.perf_counter()
+    results = aio.fetch_all(urls, fetch=client.get_ok, per_host=per_host)
+    failed = sum(r.error is not None for r in results)
+    return time.perf_counter() - start, failed
+
+
+def main(base_url, sport, per_host):
+    resp = HttpClient(cache=None).get_ok(f"{base_url}/sports/{sport}/schedule")
+    seasons = parse_schedule_seasons(resp.text) or []
+    urls = [schedule_season_url(base_url, sport, s) for s in seasons]
+    print(f"{len(urls)} season pages for {sport} at {base_url}")
+
+    seq_s, seq_failed = time_sequential(urls)
+    async_s, async_failed = time_async(urls, per_host)
+
+    print(f"sequential         : {seq_s:8.2f}s  ({seq_failed} failed)")
+    print(f"async (per host={per_host}): {async_s:8.2f}s  ({async_failed} failed)")
+    if async_s > 0:
+        print(f"speed-up           : {seq_s / async_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        args[0] if len(args) > 0 else "https://pioneers.grinnell.edu",
+        args[1] if len(args) > 1 else "baseball",
+        int(args[2]) if len(args) > 2 else aio.DEFAULT_PER_HOST,
+    )
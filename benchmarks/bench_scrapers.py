@@ -0,0 +1,110 @@
+"""
+Throughput of each scraper against the local stand-in server
+(benchmarks/standin_server.py): pages/sec, tables/sec and p95 page latency.
+
+    python benchmarks/bench_scrapers.py
+    python benchmarks/bench_scrapers.py --latency 40 --jitter 30 --error-rate 0.02
+    python benchmarks/bench_scrapers.py --only schedule.py --recorded
+
+Each scraper runs unmodified as its own process in a scratch directory, with
+ATHLETE_STANDIN pointing at the server and ATHLETE_MANIFEST at a scratch
+manifest, so every season is fetched and nothing under the repo is touched.
+
+  pages/s   pages served (200s) / time from its first request to its last
+  tables/s  tables written as CSV (standing_collect: tables in the pages it
+            read, since it writes one combined CSV) over the same window
+  p95 ms    95th percentile of per-request time at the server, including the
+            injected latency
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from standin_server import StandinServer
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# name -> (script, how tables are counted)
+SCRAPERS = {
+    "schedule.py": ("Code/Schedule/schedule.py", "csv"),
+    "Stats(XML).py": ("Code/Stats/Stats(XML).py", "csv"),
+    "Stats_TFRRS.py": ("Code/Stats/Stats_TFRRS.py", "csv"),
+    "Conf_standing.py": ("Conf_standing.py", "csv"),
+    "standing_collect.py": ("Standing/standing_collect.py", "served"),
+}
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def run_scraper(server, name, script, count):
+    server.reset_stats()
+    with tempfile.TemporaryDirectory(prefix="bench_") as scratch:
+        env = dict(os.environ, ATHLETE_STANDIN=server.base_url,
+                   ATHLETE_MANIFEST=os.path.join(scratch, "manifest.json"))
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, os.path.join(REPO_ROOT, script)], cwd=scratch,
+                              env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall = time.perf_counter() - start
+        csvs = len(glob.glob(os.path.join(scratch, "**", "*.csv"), recursive=True))
+
+    log = list(server.log)
+    ok = [entry for entry in log if entry[2] == 200]
+    window = (max(e[1] for e in log) - min(e[0] for e in log)) if log else 0.0
+    tables = csvs if count == "csv" else sum(e[3] for e in ok)
+    row = {
+        "name": name,
+        "pages": len(ok),
+        "errors": len(log) - len(ok),
+        "tables": tables,
+        "pages_s": len(ok) / window if window else 0.0,
+        "tables_s": tables / window if window else 0.0,
+        "p95_ms": percentile([e[1] - e[0] for e in log], 95) * 1000,
+        "wall": wall,
+        "exit": proc.returncode,
+    }
+    if proc.returncode:
+        print(f"{name} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency per page (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform latency (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--filler-kb", type=int, default=250)
+    parser.add_argument("--recorded", action="store_true", help="serve archived pages first")
+    parser.add_argument("--only", action="append", choices=sorted(SCRAPERS))
+    args = parser.parse_args(argv)
+
+    server = StandinServer(0, args.latency, args.jitter, args.error_rate, args.error_status,
+                           args.filler_kb, args.recorded)
+    server.serve_in_thread()
+    print(f"stand-in {server.base_url}: latency {args.latency:g}+{args.jitter:g} ms, "
+          f"error rate {args.error_rate:g}, pages padded to ~{args.filler_kb} KB\n")
+
+    rows = [run_scraper(server, name, *SCRAPERS[name]) for name in (args.only or SCRAPERS)]
+    server.shutdown()
+
+    print(f"{'scraper':22}{'pages':>7}{'errors':>8}{'pages/s':>9}{'tables':>8}{'tables/s':>10}"
+          f"{'p95 ms':>9}{'wall s':>8}")
+    for r in rows:
+        print(f"{r['name']:22}{r['pages']:7d}{r['errors']:8d}{r['pages_s']:9.1f}{r['tables']:8d}"
+              f"{r['tables_s']:10.1f}{r['p95_ms']:9.1f}{r['wall']:8.1f}")
+    return 1 if any(r["exit"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Load a sport's full Performance Stats history: one pd.read_csv per CSV file
+against athlete.stats_store (one dictionary-encoded Parquet file per sport),
+both as long cells (load_stats) and as one wide frame per table (load_tables).
+
+    python benchmarks/bench_stats_store.py
+    python benchmarks/bench_stats_store.py --gender Women --sport Softball
+
+Builds the store in a temporary folder, checks that every data cell of every
+file comes back with the same text, then reports time and memory for each
+sport. Memory is memory_usage(deep=True), except that a categories dictionary
+shared by several columns (load_tables) is counted once.
+"""
+
+import os
+import csv
+import sys
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.stats_store import DEFAULT_SOURCE, _source_files, build, load_stats, load_tables
+
+
+def read_csvs(sport_dir):
+    """The usual way: a DataFrame per file."""
+    frames = []
+    for files in _source_files(sport_dir).values():
+        for _, path in files:
+            try:
+                frames.append(pd.read_csv(path))
+            except pd.errors.EmptyDataError:
+                pass
+    return frames
+
+
+def check_cells(sport_dir, cells):
+    """Every data cell of every CSV, in order, against the stored text."""
+    expected = []
+    for season, files in _source_files(sport_dir).items():
+        for table, path in files:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            expected.extend((season, table, r, c, v)
+                            for r, row in enumerate(rows[1:]) for c, v in enumerate(row))
+    stored = list(zip(cells["season"].astype(str), cells["table"].astype(str), cells["row"],
+                      cells["col"], cells["text"].astype(str)))
+    return stored == expected
+
+
+def frames_bytes(frames):
+    """Bytes held by the frames' columns; each categories dictionary counted once."""
+    total, seen = 0, set()
+    for frame in frames:
+        for name in frame.columns:
+            values = frame[name]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                total += values.cat.codes.to_numpy().nbytes
+                categories = values.cat.categories
+                if id(categories) not in seen:
+                    seen.add(id(categories))
+                    total += categories.memory_usage(deep=True)
+            else:
+                total += values.memory_usage(index=False, deep=True)
+    return total
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-file CSV parse vs the compact stats store.")
+    parser.add_argument("--src", default=DEFAULT_SOURCE)
+    parser.add_argument("--gender", action="append")
+    parser.add_argument("--sport", action="append")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        built = build(args.src, root, args.gender, args.sport)
+        print(f"Built {len(built)} partitions in {time.perf_counter() - start:.2f}s\n")
+        print(f"{'':26} {'read_csv':>9} {'MB':>6} {'load_stats':>11} {'load_tables':>12} {'MB':>6}")
+        totals = [0.0] * 5
+        for gender, sport, _ in built:
+            sport_dir = os.path.join(args.src, gender, sport)
+            frames, t_csv = best_of(lambda: read_csvs(sport_dir), args.repeat)
+            cells, t_cells = best_of(lambda: load_stats(gender, sport, root=root), args.repeat)
+            tables, t_tables = best_of(lambda: load_tables(gender, sport, root=root), args.repeat)
+            if not check_cells(sport_dir, cells):
+                sys.exit(f"{gender}/{sport}: stored cells differ from the CSVs")
+            row = (t_csv, frames_bytes(frames) / 1e6, t_cells, t_tables, frames_bytes(tables.values()) / 1e6)
+            totals = [t + v for t, v in zip(totals, row)]
+            print(f"{gender + '/' + sport:26} {row[0]:8.3f}s {row[1]:6.2f} {row[2] * 1000:9.1f}ms "
+                  f"{row[3] * 1000:10.1f}ms {row[4]:6.2f}")
+        print(f"{'all':26} {totals[0]:8.3f}s {totals[1]:6.2f} {totals[2] * 1000:9.1f}ms "
+              f"{totals[3] * 1000:10.1f}ms {totals[4]:6.2f}")
+        print(f"\nIdentical cells. Per table: {totals[0] / totals[3]:.0f}x faster than read_csv "
+              f"in {totals[4] / totals[1]:.0%} of the memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Tables/sec of ``pd.read_html(str(table))[0]`` (re-serialize and re-parse every
+table) against athlete.tables.table_to_frame (read the parsed tree directly),
+on the same <table> Tags.
+
+    python benchmarks/bench_tables.py            # synthetic stats pages
+    python benchmarks/bench_tables.py --cached   # real stats pages from .http_cache/
+
+Both paths must give equal DataFrames; the script stops with an error if any
+table differs. The synthetic run also reads BR_TABLE, whose cells break lines
+with <br> (Sidearm writes "Name<br>Position" and two-line dates that way).
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+from io import StringIO
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from athlete import parsing
+from athlete.http_cache import DEFAULT_CACHE_DIR
+from athlete.tables import table_to_frame
+import sample_pages
+
+BR_TABLE = (
+    "<table><thead><tr><th>Player</th><th>Date</th><th>Notes</th></tr></thead><tbody>"
+    "<tr><td>Ada Smith<br>Forward</td><td>Sep. 7<br/>(Sat)</td><td>a<br> b <br>c<br></td></tr>"
+    "<tr><td><a href=\"/roster/1\">Ben Jones</a><br><span>Guard</span></td>"
+    "<td>Sep. 14<br>\n(Sat)</td><td><br></td></tr>"
+    "</tbody></table>"
+)
+
+
+def cached_stats_pages(limit=50):
+    """Bodies of stats / coaches / TFRRS pages already in the on-disk HTTP cache."""
+    pages = []
+    for meta_path in glob.glob(os.path.join(DEFAULT_CACHE_DIR, "*", "*.json")):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if any(k in meta["url"] for k in ("/stats", "/coaches", "tfrrs.org")):
+            with open(meta_path[:-5] + ".body", "rb") as f:
+                pages.append(f.read().decode(meta.get("encoding") or "utf-8", "replace"))
+        if len(pages) >= limit:
+            break
+    return pages
+
+
+def read_html(table):
+    return pd.read_html(StringIO(str(table)))[0]
+
+
+def run(label, tables, extract):
+    frames = []
+    start = time.perf_counter()
+    for table in tables:
+        try:
+            frames.append(extract(table))
+        except ValueError:
+            frames.append(None)
+    elapsed = time.perf_counter() - start
+    print(f"{label:32}: {len(tables) / elapsed:8.1f} tables/s  ({elapsed:.2f}s)")
+    return frames, elapsed
+
+
+def same(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return a.columns.equals(b.columns) and a.equals(b)
+
+
+def main(use_cache=False):
+    if use_cache:
+        pages = cached_stats_pages()
+        if not pages:
+            sys.exit("No cached stats pages; run a stats scraper first.")
+    else:
+        pages = [sample_pages.stats_page(seed=i) for i in range(10)] + [BR_TABLE]
+    tables = [t for html in pages for t in parsing.soup(html, parsing.TABLE_STRAINER).find_all("table")]
+    print(f"{len(tables)} tables from {len(pages)} pages\n")
+
+    old, old_s = run("read_html(str(table))", tables, read_html)
+    new, new_s = run("table_to_frame(table)", tables, table_to_frame)
+    bad = sum(not same(a, b) for a, b in zip(old, new))
+    if bad:
+        sys.exit(f"DataFrame mismatch on {bad} table(s)")
+
+    print(f"\nIdentical DataFrames; speed-up {old_s / new_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main(use_cache="--cached" in sys.argv[1:])
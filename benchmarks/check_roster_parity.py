@@ -0,0 +1,117 @@
+"""
+Cell-by-cell diff of athlete.sidearm's roster parser against the Roster/ CSVs
+the Selenium scraper (Code/Roster/roster.py) wrote.
+
+    python benchmarks/check_roster_parity.py
+    python benchmarks/check_roster_parity.py --match womens-basketball --show 20
+
+Reads every archived grid page (``/sports/<slug>/roster/<season>?view=2``)
+from the HTML archive (athlete.archive; fill it by running
+Code/Roster/roster_http.py with FULL_REFRESH = True), parses it with
+parse_roster_grid() and compares caption, header and data rows with
+``Roster/<Gender>/<Folder>/<season>_*.csv``, the folder coming from the
+registry's "sports" map. Exits non-zero if any cell differs or no page could
+be compared.
+"""
+
+import os
+import csv
+import sys
+import glob
+import argparse
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from athlete.archive import HtmlArchive, DEFAULT_ARCHIVE_DIR
+from athlete.registry import load_registry
+from athlete.sidearm import ROSTER_GRID_VIEW, parse_roster_grid
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def grid_pages(archive, match=None):
+    """[(url, slug, season), ...] of the archived grid-view roster pages."""
+    pages = []
+    for url in sorted(archive.index()):
+        parts = urlsplit(url)
+        segments = parts.path.strip("/").split("/")
+        if (len(segments) != 4 or segments[0] != "sports" or segments[2] != "roster"
+                or parse_qs(parts.query).get("view") != [ROSTER_GRID_VIEW]):
+            continue
+        if match and match not in url:
+            continue
+        pages.append((url, segments[1], segments[3]))
+    return pages
+
+
+def read_csv(path):
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def diff_rows(expected, got):
+    """[(row, col, expected, got), ...] for every cell that differs."""
+    diffs = []
+    for r in range(max(len(expected), len(got))):
+        want = expected[r] if r < len(expected) else []
+        have = got[r] if r < len(got) else []
+        for c in range(max(len(want), len(have))):
+            a = want[c] if c < len(want) else None
+            b = have[c] if c < len(have) else None
+            if a != b:
+                diffs.append((r, c, a, b))
+    return diffs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--archive-dir", default=DEFAULT_ARCHIVE_DIR)
+    parser.add_argument("--roster-dir", default=os.path.join(REPO_ROOT, "Roster"))
+    parser.add_argument("--registry", default=None, help="registry JSON (default: scrape_registry.json)")
+    parser.add_argument("--match", default=None, help="only pages whose URL contains this")
+    parser.add_argument("--show", type=int, default=5, help="differing cells printed per page")
+    args = parser.parse_args(argv)
+
+    sports = load_registry(args.registry)["sports"]
+    archive = HtmlArchive(args.archive_dir)
+    pages = grid_pages(archive, args.match)
+    if not pages:
+        sys.exit(f"no archived grid roster pages in {args.archive_dir}; "
+                 "run Code/Roster/roster_http.py with FULL_REFRESH = True first")
+
+    compared, skipped, cells, failed = 0, 0, 0, 0
+    for url, slug, season in pages:
+        if slug not in sports:
+            print(f"skip {url}: {slug!r} is not in the registry's sports map")
+            skipped += 1
+            continue
+        gender, folder = sports[slug]
+        found = sorted(glob.glob(os.path.join(glob.escape(os.path.join(args.roster_dir, gender, folder)),
+                                              f"{glob.escape(season)}_*.csv")))
+        if not found:
+            print(f"skip {url}: no {gender}/{folder}/{season}_*.csv")
+            skipped += 1
+            continue
+
+        grid = parse_roster_grid(archive.body(archive.latest(url)["sha256"]))
+        compared += 1
+        if grid is None:
+            print(f"DIFF {url}: no grid roster table on the archived page")
+            failed += 1
+            continue
+        expected = read_csv(found[0])
+        diffs = diff_rows(expected, [[grid[0]], grid[1]] + grid[2])
+        cells += sum(len(row) for row in expected)
+        if diffs:
+            failed += 1
+            print(f"DIFF {url} vs {os.path.relpath(found[0], args.roster_dir)}: {len(diffs)} cell(s)")
+            for r, c, a, b in diffs[:args.show]:
+                print(f"    row {r} col {c}: csv {a!r} != parsed {b!r}")
+
+    print(f"{compared} pages compared ({cells} cells), {failed} with differences, {skipped} skipped")
+    if failed or not compared:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Synthetic Sidearm pages for benchmarks.
+
+The markup mirrors what the scrapers look for (season dropdown, season-record
+block, grid schedule table) and pads the page with the navigation, script and
+footer bulk that makes real Sidearm pages ~300 KB.
+"""
+
+import random
+
+SPORTS_NAV = ["baseball", "mens-basketball", "football", "mens-soccer", "mens-tennis",
+              "softball", "womens-basketball", "womens-volleyball", "womens-soccer"]
+
+OPPONENTS = ["Knox College", "Monmouth College", "Ripon College", "Lake Forest College",
+             "Illinois College", "Beloit College", "Cornell College", "Lawrence University",
+             "St. Norbert College", "University of Chicago", "Coe College", "Luther College"]
+
+
+def _page_chrome(body, filler_kb=250):
+    """Wrap ``body`` in header/nav/scripts/footer of roughly ``filler_kb`` KB."""
+    nav = "".join(
+        f'<li class="main-nav-item"><a href="/sports/{s}">{s.replace("-", " ").title()}</a>'
+        f'<ul class="sub-nav">' + "".join(
+            f'<li><a href="/sports/{s}/{p}">{p.title()}</a></li>'
+            for p in ("schedule", "roster", "stats", "coaches", "news")
+        ) + "</ul></li>"
+        for s in SPORTS_NAV
+    )
+    script = "<script>window.sidearmComponents = " + ("{\"k\":\"v\"}," * 40) + "{};</script>\n"
+    filler = []
+    size = len(nav)
+    while size < filler_kb * 1024:
+        block = (f'<div class="sidearm-common-promotions"><a href="/news/{size}">'
+                 f'<img src="/images/{size}.jpg" alt="promo"><span>Story {size}</span></a></div>\n'
+                 + script)
+        filler.append(block)
+        size += len(block)
+    half = len(filler) // 2
+    return (
+        "<!DOCTYPE html><html><head><title>Schedule</title>" + "".join(filler[:half])
+        + f'</head><body><header><nav><ul class="main-nav">{nav}</ul></nav></header>'
+        + f'<main id="main-content">{body}</main>'
+        + "<footer>" + "".join(filler[half:]) + "</footer></body></html>"
+    )
+
+
+def season_dropdown(seasons, select_id="sidearm-schedule-select-season"):
+    options = "".join(f'<option value="{s}">{s} Baseball Schedule</option>' for s in seasons)
+    return f'<select id="{select_id}" class="sidearm-schedule-select">{options}</select>'
+
+
+def schedule_page(season="2019", games=30, seed=0, filler_kb=250):
+    """A grid-view (?grid=true) schedule page for one season."""
+    rnd = random.Random(seed)
+    w = rnd.randint(0, games)
+    l = games - w
+    record = "".join(
+        f'<li class="flex"><span class="flex-item-1">{cat}</span>'
+        f'<span class="flex-item-1">{val}</span></li>'
+        for cat, val in [("Overall", f"{w}-{l}"), ("OverallPCT", f"{w / games:.3f}"[1:]),
+                         ("Conf", f"{w // 2}-{l // 2}"), ("ConfPCT", ".500"), ("Streak", "W1"),
+                         ("Home", "3-2"), ("Away", "4-5"), ("Neutral", "0-0")]
+    )
+    header = "".join(f"<th scope=\"col\">{h}</th>" for h in
+                     ["Date", "Time", "At", "Opponent", "Location", "TV", "Radio", "Result", "Links"])
+    rows = []
+    for i in range(games):
+        opp = rnd.choice(OPPONENTS)
+        result = rnd.choice(["W", "L"]) + f",{rnd.randint(0, 9)}-{rnd.randint(0, 9)}"
+        rows.append(
+            f'<tr class="sidearm-schedule-game"><td>March {i % 28 + 1}, {season} (Saturday)</td>'
+            f'<td>{rnd.randint(1, 7)}:00 p.m.</td><td>{rnd.choice(["Home", "Away"])}</td>'
+            f'<td><a href="/opp/{i}">{opp}</a></td><td>Grinnell, IA</td><td></td><td></td>'
+            f'<td><span>{result}</span></td>'
+            f'<td><a href="/box/{i}">Box Score</a><a href="/recap/{i}">Recap</a></td></tr>'
+        )
+    body = (
+        season_dropdown([str(y) for y in range(int(season), int(season) - 20, -1)])
+        + f'<div class="sidearm-schedule-record"><ul>{record}</ul></div>'
+        + '<table class="sidearm-table sidearm-table-grid-template-1 '
+          'sidearm-table-grid-template-1-breakdown-large dataTable no-footer">'
+        + f"<caption>{season} Baseball Schedule</caption>"
+        + f"<thead><tr>{header}</tr></thead>" + "".join(rows) + "</table>"
+    )
+    return _page_chrome(body, filler_kb)
+
+
+PLAYERS = ["Smith, Jordan", "Lee, Casey", "Nguyen, Avery", "Garcia, Riley", "Brown, Morgan",
+           "Davis, Taylor", "Miller, Quinn", "Wilson, Parker", "Moore, Reese", "Clark, Jamie"]
+
+
+def stats_table(caption="Individual Offensive Statistics", players=25, seed=0):
+    """
+    A Sidearm cumulative-stats table: two header rows with colspans, a rowspan
+    in the body, a hidden column and a totals <tfoot> -- the cases
+    athlete.tables has to handle like read_html does.
+    """
+    rnd = random.Random(seed)
+    head = (
+        '<thead><tr><th rowspan="2">#</th><th rowspan="2">Player</th>'
+        '<th colspan="3">Games</th><th colspan="4">Hitting</th>'
+        '<th style="display: none">hidden</th></tr>'
+        "<tr><th>GP</th><th>GS</th><th>MIN</th><th>AB</th><th>R</th><th>H</th><th>AVG</th>"
+        '<th style="display: none">x</th></tr></thead>'
+    )
+    rows = []
+    for i in range(players):
+        ab = rnd.randint(1, 1500)
+        h = rnd.randint(0, ab)
+        gp = "" if i % 11 == 10 else rnd.randint(1, 40)
+        rows.append(
+            f"<tr><td>{i + 1}</td><td><a href=\"/roster/{i}\">{rnd.choice(PLAYERS)}</a>\n"
+            f"  <span class=\"hide-on-large\">  (Jr.)</span></td>"
+            f"<td>{gp}</td><td>{rnd.randint(0, 40)}</td><td>{rnd.randint(0, 900):,}</td>"
+            f"<td>{ab:,}</td><td>{rnd.randint(0, 60)}</td><td>{h}</td><td>{h / ab:.3f}</td>"
+            f'<td style="display: none">{i}</td></tr>'
+        )
+    if players > 2:
+        # First "#" cell spans two rows, so the second row has one cell fewer
+        rows[0] = rows[0].replace("<td>1</td>", '<td rowspan="2">1</td>', 1)
+        rows[1] = rows[1].replace("<td>2</td>", "", 1)
+    foot = (
+        '<tfoot><tr><td colspan="2">Total</td><td>40</td><td>40</td><td>1,200</td>'
+        '<td>1,310</td><td>210</td><td>380</td><td>.290</td><td style="display: none">-</td></tr>'
+        '<tr><td colspan="2">Opponents</td><td>40</td><td>-</td><td>-</td>'
+        "<td>1,290</td><td>190</td><td>350</td><td>.271</td></tr></tfoot>"
+    )
+    return (f'<table class="sidearm-table"><caption>{caption}</caption>{head}'
+            f"<tbody>{''.join(rows)}</tbody>{foot}</table>")
+
+
+def stats_page(tables=12, players=25, seed=0, filler_kb=250):
+    """A stats page with ``tables`` cumulative-stats tables."""
+    body = "".join(
+        f'<section id="stats-{t}">'
+        + stats_table(f"Table {t}", players, seed * 100 + t) + "</section>"
+        for t in range(tables)
+    )
+    return _page_chrome(body, filler_kb)
+
+
+# -----------------------------------------------------------------------------
+# Other Sidearm page types (stats tabs, roster, coaches, conference standings)
+# and TFRRS team pages, for the stand-in server (benchmarks/standin_server.py)
+# -----------------------------------------------------------------------------
+def sidearm_select(select_id, options):
+    """<select id=...> with (value, text) options."""
+    opts = "".join(f'<option value="{v}">{t}</option>' for v, t in options)
+    return f'<select id="{select_id}" name="{select_id}">{opts}</select>'
+
+
+def stats_landing_page(sport, seasons, filler_kb=250):
+    """/sports/<sport>/stats: the ctl00_cplhMainContent_seasons_ddl dropdown."""
+    options = [("", "Select a Season...")] + [(f"/sports/{sport}/stats/{s}", s) for s in seasons]
+    return _page_chrome(sidearm_select("ctl00_cplhMainContent_seasons_ddl", options), filler_kb)
+
+
+def stats_season_page(season, seed=0, tables_per_tab=3, players=20, filler_kb=250):
+    """
+    /sports/<sport>/stats/<season>: two levels of role=tablist tabs
+    (Team / Individual, then Offense / Defense), each leaf holding tables.
+    """
+    def tablist(prefix, labels):
+        items = "".join(f'<li role="tab"><a href="#{prefix}-{i}">{label}</a></li>'
+                        for i, label in enumerate(labels))
+        return f'<ul role="tablist">{items}</ul>'
+
+    body = [tablist("top", ["Team", "Individual"])]
+    for t, top in enumerate(["Team", "Individual"]):
+        inner = [tablist(f"top-{t}", ["Offense", "Defense"])]
+        for s, sub in enumerate(["Offense", "Defense"]):
+            tables = "".join(
+                stats_table(f"{season} {top} {sub} {k + 1}", players, seed * 100 + t * 10 + s * 3 + k)
+                for k in range(tables_per_tab)
+            )
+            inner.append(f'<section id="top-{t}-{s}">{tables}</section>')
+        body.append(f'<section id="top-{t}">{"".join(inner)}</section>')
+    return _page_chrome("".join(body), filler_kb)
+
+
+def roster_page(sport, season, seasons, players=30, seed=0, filler_kb=250):
+    """/sports/<sport>/roster[/<season>?view=2]: past-rosters dropdown + grid table."""
+    rnd = random.Random(seed)
+    dropdown = sidearm_select("ddl_past_rosters",
+                              [(f"/sports/{sport}/roster/{s}", f"{s} Roster") for s in seasons])
+    header = "".join(f"<th>{h}</th>" for h in ["No.", "Name", "Pos.", "Ht.", "Academic Year", "Hometown"])
+    rows = "".join(
+        f"<tr><td>{i}</td><td><a href=\"/roster/{i}\">{rnd.choice(PLAYERS)}</a></td>"
+        f"<td>{rnd.choice(['OH', 'MB', 'S', 'L'])}</td><td>{rnd.randint(5, 6)}-{rnd.randint(0, 11)}</td>"
+        f"<td>{rnd.choice(['Fr.', 'So.', 'Jr.', 'Sr.'])}</td><td>Grinnell, Iowa</td></tr>"
+        for i in range(1, players + 1)
+    )
+    table = (f'<table class="sidearm-table sidearm-table-grid-template-1">'
+             f"<caption>{season} Roster</caption><thead><tr>{header}</tr></thead>"
+             f"<tbody>{rows}</tbody></table>")
+    return _page_chrome(dropdown + table, filler_kb)
+
+
+def coaches_page(sport, season, seasons, coaches=4, seed=0, filler_kb=250):
+    """/sports/<sport>/coaches[/<season>]: ddl_seasons_list dropdown + staff table."""
+    rnd = random.Random(seed)
+    options = [("", "Select a Season...")] + [(f"/sports/{sport}/coaches/{s}", s) for s in seasons]
+    rows = "".join(
+        f"<tr><td>{rnd.choice(PLAYERS)}</td><td>{title}</td><td>{rnd.randint(1, 25)}</td></tr>"
+        for title in ["Head Coach", "Assistant Coach", "Assistant Coach", "Volunteer Assistant"][:coaches]
+    )
+    table = (f"<table><caption>{season} Coaching Staff</caption><thead><tr><th>Name</th>"
+             f"<th>Title</th><th>Years</th></tr></thead><tbody>{rows}</tbody></table>")
+    return _page_chrome(sidearm_select("ddl_seasons_list", options) + table, filler_kb)
+
+
+def standings_page(season_values, season="2023-24", teams=10, seed=0, filler_kb=250):
+    """Conference /standings.aspx: past-standings dropdown + standings table."""
+    rnd = random.Random(seed)
+    options = [(v, f"{2023 - i}-{(24 - i) % 100:02d} Volleyball Standings")
+               for i, v in enumerate(season_values)]
+    header = "".join(f"<th>{h}</th>" for h in ["School", "Conf", "Pct", "Overall", "Pct", "Streak"])
+    rows = []
+    for team in rnd.sample(OPPONENTS, min(teams, len(OPPONENTS))):
+        w, l = rnd.randint(0, 9), rnd.randint(0, 9)
+        rows.append(f"<tr><td><a href=\"/t\">{team}</a></td><td>{w}-{l}</td>"
+                    f"<td>{w / max(1, w + l):.3f}</td><td>{w + 5}-{l + 5}</td>"
+                    f"<td>{(w + 5) / (w + l + 10):.3f}</td><td>W{rnd.randint(1, 4)}</td></tr>")
+    table = (f'<table class="sidearm-table sidearm-standings-table"><caption>{season}</caption>'
+             f"<thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>")
+    return _page_chrome(sidearm_select("ctl00_cplhMainContent_ddl_past_standings", options) + table,
+                        filler_kb)
+
+
+ALL_SPORTS_CODES = ["VB", "SOC", "XC", "TEN", "BKB", "SWIM", "ITRK", "OTRK", "SB", "FB", "BASE", "TOTAL"]
+
+
+def conference_history_page(years, filler_kb=250):
+    """The conference's all-sports history article: one "YYYY-YY" link per season."""
+    links = "".join(f'<li><a href="/sports/{y}/8/18/GEN_{y}.aspx">{y}-{(y + 1) % 100:02d}</a></li>'
+                    for y in years)
+    return _page_chrome(f"<article><ul>{links}</ul></article>", filler_kb)
+
+
+def all_sports_standings_page(year, seed=0, filler_kb=250):
+    """One season of all-sports standings: a Men table, then a Women table."""
+    rnd = random.Random(seed)
+    tables = []
+    for _ in ("Men", "Women"):
+        header = "<tr><td>School</td>" + "".join(f"<td>{c}</td>" for c in ALL_SPORTS_CODES) + "</tr>"
+        rows = "".join(
+            f"<tr><td>{team}</td>" + "".join(f"<td>{rnd.randint(1, 10)}</td>" for _ in ALL_SPORTS_CODES)
+            + "</tr>"
+            for team in OPPONENTS[:10]
+        )
+        tables.append(f"<table>{header}{rows}</table>")
+    return _page_chrome(f"<h2>{year} All-Sports Standings</h2>" + "".join(tables), filler_kb)
+
+
+TFRRS_BUTTONS = [("TOP QUALIFIERS (POP)", "top_qualifiers"), ("TOP PERFORMANCES", "top_performances"),
+                 ("ALL PERFORMANCES", "all_performances")]
+
+
+def tfrrs_team_page(team_path, seasons, config=None, filler_kb=100):
+    """TFRRS team page: config_hnd season dropdown + the three list buttons."""
+    options = "".join(f'<option value="{v}">{text}</option>' for v, text in seasons)
+    config = config or (seasons[0][0] if seasons else "")
+    name = team_path.rsplit("/", 1)[-1]
+    buttons = "".join(f'<a class="btn" href="/{slug}/{name}?config_hnd={config}">{label}</a>'
+                      for label, slug in TFRRS_BUTTONS)
+    return _page_chrome(f'<select name="config_hnd">{options}</select><div>{buttons}</div>', filler_kb)
+
+
+def tfrrs_list_page(events=8, athletes=15, seed=0, filler_kb=100):
+    """A TFRRS performance list: one col-lg-12 block (h3 + table) per event."""
+    rnd = random.Random(seed)
+    blocks = []
+    for e in range(events):
+        rows = "".join(
+            f"<tr><td>{i + 1}</td><td><a href=\"/athletes/{i}\">{rnd.choice(PLAYERS)}</a></td>"
+            f"<td>{rnd.choice(['FR-1', 'SO-2', 'JR-3', 'SR-4'])}</td>"
+            f"<td>{rnd.randint(17, 26)}:{rnd.randint(0, 59):02d}.{rnd.randint(0, 9)}</td>"
+            f"<td>Meet {rnd.randint(1, 9)}</td><td>Sep {rnd.randint(1, 30)}, 2023</td></tr>"
+            for i in range(athletes)
+        )
+        blocks.append(
+            f'<div class="col-lg-12"><h3>{["5000", "6000", "8000"][e % 3]} ({e})</h3>'
+            f"<table><thead><tr><th></th><th>NAME</th><th>YEAR</th><th>TIME</th><th>MEET</th>"
+            f"<th>MEET DATE</th></tr></thead><tbody>{rows}</tbody></table></div>"
+        )
+    return _page_chrome("".join(blocks), filler_kb)
@@ -0,0 +1,222 @@
+"""
+Local stand-in for the athletics sites the scrapers talk to.
+
+Serves synthetic Sidearm pages (schedule, stats tabs, roster, coaches,
+conference standings and all-sports history) and TFRRS team / performance-list
+pages. With --recorded it serves pages from the HTML archive (.html_archive/)
+first. Latency and errors can be injected.
+
+Requests arrive as ``/<original host>/<path>?<query>``; HttpClient sends them
+that way when ATHLETE_STANDIN points here:
+
+    python benchmarks/standin_server.py --port 8800 --latency 40 --jitter 20 --error-rate 0.02
+    ATHLETE_STANDIN=http://127.0.0.1:8800 python Code/Schedule/schedule.py
+
+benchmarks/bench_scrapers.py starts one in-process and runs every scraper
+against it.
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import hashlib
+import argparse
+import threading
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sample_pages
+
+SEASON_YEARS = list(range(2024, 2009, -1))
+
+
+def _seed(*parts):
+    return int(hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:8], 16)
+
+
+def _academic(year):
+    return f"{year}-{(year + 1) % 100:02d}"
+
+
+# -----------------------------------------------------------------------------
+# Synthetic pages: (host, path, query) -> html, or None for a 404
+# -----------------------------------------------------------------------------
+def sidearm_page(host, path, query, filler_kb):
+    m = re.match(r"^/sports/([\w-]+)/(schedule|stats|roster|coaches)(?:/([^/?]+))?/?$", path)
+    if not m:
+        return None
+    sport, page_type, season = m.groups()
+    seed = _seed(host, sport, page_type, season)
+
+    if page_type == "schedule":
+        return sample_pages.schedule_page(season or str(SEASON_YEARS[0]), seed=seed, filler_kb=filler_kb)
+    if page_type == "stats":
+        seasons = [_academic(y) for y in SEASON_YEARS]
+        if season is None:
+            return sample_pages.stats_landing_page(sport, seasons, filler_kb)
+        return sample_pages.stats_season_page(season, seed=seed, filler_kb=filler_kb)
+    if page_type == "roster":
+        seasons = [_academic(y) for y in SEASON_YEARS]
+        return sample_pages.roster_page(sport, season or seasons[0], seasons, seed=seed,
+                                        filler_kb=filler_kb)
+    seasons = [str(y) for y in SEASON_YEARS]
+    return sample_pages.coaches_page(sport, season or seasons[0], seasons, seed=seed,
+                                     filler_kb=filler_kb)
+
+
+def conference_page(host, path, query, filler_kb):
+    if path.lower() == "/standings.aspx":
+        values = [str(300 + i) for i in range(len(SEASON_YEARS))]
+        season = query.get("standings", [values[0]])[0]
+        return sample_pages.standings_page(values, seed=_seed(host, season), filler_kb=filler_kb)
+    m = re.match(r"^/sports/(\d{4})/\d+/\d+/GEN_(\w+)\.aspx$", path)
+    if m:
+        if m.group(2) == str(m.group(1)):  # a season's all-sports standings
+            return sample_pages.all_sports_standings_page(int(m.group(1)), _seed(host, path), filler_kb)
+        return sample_pages.conference_history_page(range(2003, 2025), filler_kb)
+    return sidearm_page(host, path, query, filler_kb)
+
+
+def tfrrs_page(host, path, query, filler_kb):
+    seasons = [(str(4000 + y), f"{y} Cross Country") for y in SEASON_YEARS]
+    if path.startswith("/teams/"):
+        config = query.get("config_hnd", [None])[0]
+        return sample_pages.tfrrs_team_page(path, seasons, config, filler_kb)
+    if re.match(r"^/(top_qualifiers|top_performances|all_performances)/", path):
+        return sample_pages.tfrrs_list_page(seed=_seed(path, query.get("config_hnd")), filler_kb=filler_kb)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def synthetic_page(host, path, query_string, filler_kb):
+    query = parse_qs(query_string)
+    if "tfrrs.org" in host:
+        html = tfrrs_page(host, path, query, filler_kb)
+    elif "conference" in host:
+        html = conference_page(host, path, query, filler_kb)
+    else:
+        html = sidearm_page(host, path, query, filler_kb)
+    return None if html is None else html.encode("utf-8")
+
+
+# -----------------------------------------------------------------------------
+# Server
+# -----------------------------------------------------------------------------
+class StandinServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with the injection settings and per-request stats."""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 error_status=503, filler_kb=250, recorded=False, seed=0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.filler_kb = filler_kb
+        self.random = random.Random(seed)
+        self.archive = None
+        if recorded:
+            from athlete.archive import HtmlArchive
+            self.archive = HtmlArchive()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset_stats(self):
+        with self._lock:
+            self.log = []  # (start, end, status, n_tables)
+
+    def record(self, start, end, status, tables):
+        with self._lock:
+            self.log.append((start, end, status, tables))
+
+    def draw(self):
+        """(delay seconds, inject an error?) for one request."""
+        with self._lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            return delay, self.random.random() < self.error_rate
+
+    def recorded_page(self, host, path, query_string):
+        if self.archive is None:
+            return None
+        target = f"{host}{path}" + (f"?{query_string}" if query_string else "")
+        for scheme in ("https://", "http://"):
+            entry = self.archive.latest(scheme + target)
+            if entry is not None:
+                return self.archive.body(entry["sha256"])
+        return None
+
+    def serve_in_thread(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        start = time.perf_counter()
+        delay, fail = server.draw()
+        if delay:
+            time.sleep(delay)
+
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+
+        if fail:
+            status, body = server.error_status, b"injected error"
+        else:
+            body = server.recorded_page(host, path, parts.query)
+            if body is None:
+                body = synthetic_page(host, path, parts.query, server.filler_kb)
+            status = 200 if body is not None else 404
+            body = body if body is not None else b"not found"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status in (429, 503):
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(body)
+        server.record(start, time.perf_counter(), status, body.count(b"<table") if status == 200 else 0)
+
+    def log_message(self, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local Sidearm/TFRRS stand-in server.")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency per page (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform latency (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failed")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--filler-kb", type=int, default=250, help="page padding, like real Sidearm pages")
+    parser.add_argument("--recorded", action="store_true", help="serve archived pages first")
+    args = parser.parse_args(argv)
+
+    server = StandinServer(args.port, args.latency, args.jitter, args.error_rate,
+                           args.error_status, args.filler_kb, args.recorded)
+    print(f"Stand-in server on {server.base_url}  (ATHLETE_STANDIN={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()